@@ -8,7 +8,12 @@ _parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if _parent_dir not in sys.path:
     sys.path.insert(0, _parent_dir)
 
-# Now import coordinator
-from agent.coordinator import root_agent
-
 __all__ = ["root_agent"]
+
+
+def __getattr__(name):
+    # Build the agent (and import google.adk) only when it is asked for
+    if name == "root_agent":
+        from agent.coordinator import get_root_agent
+        return get_root_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,61 +1,240 @@
 """Flask API server to connect frontend to the Travel Genie agent."""
 
+import hashlib
+import json
 import os
-from flask import Flask, request, jsonify
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from flask import Flask, Response, g, request, jsonify, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 from datetime import date, timedelta
+from operator import itemgetter
+
+from core.cache import TTLCache
+from core.destinations import get_registry
+from core.analysis import index_scored_periods, score_weather_period, weather_period_from_dict
+from core.matcher import DestinationMatcher
+from core.memo import ToolMemo
+from core.metrics import MetricsRegistry
+from core.models import UserProfile
+from core.profiles import MOCK_PROFILES
+from core.skyline import pareto_frontier
+from core.visa import get_visa_matrix
+# The plain tool engine, not agent.coordinator: the API never needs google.adk
+from tools.engine import (
+    get_user_profile_tool,
+    get_weather_forecast_tool,
+    search_flights_tool,
+    search_hotels_tool,
+)
 
 # Load environment variables
 load_dotenv()
 
 app = Flask(__name__)
-CORS(app)  # Enable CORS for frontend
+CORS(app, expose_headers=["ETag", "X-Cache"])  # Enable CORS for frontend
+
+# Comparison fan-out: max destinations fetched in parallel, seconds allowed per destination
+COMPARISON_MAX_WORKERS = int(os.getenv('COMPARISON_MAX_WORKERS', 6))
+COMPARISON_TIMEOUT_SECONDS = float(os.getenv('COMPARISON_TIMEOUT_SECONDS', 10))
+
+# Cache of rendered recommendations for /api/recommend
+RESPONSE_CACHE = TTLCache(
+    max_entries=int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 1024)),
+    ttl_seconds=float(os.getenv('RESPONSE_CACHE_TTL_SECONDS', 300)),
+)
+
+# Largest number of (query, user) pairs accepted by /api/recommend/batch
+BATCH_MAX_REQUESTS = int(os.getenv('BATCH_MAX_REQUESTS', 5000))
+
+# Most trade-off trips listed in the frontier section
+FRONTIER_MAX_OPTIONS = 5
+
+# Latency and error metrics, served at /api/metrics
+METRICS = MetricsRegistry()
+REQUEST_LATENCY = METRICS.histogram(
+    "travel_genie_request_duration_seconds",
+    "Time to build an API response (time to first byte for streamed responses).",
+    ("endpoint", "method", "status"),
+)
+REQUEST_ERRORS = METRICS.counter(
+    "travel_genie_request_errors_total",
+    "Requests that failed with an unexpected error.",
+    ("endpoint",),
+)
+STAGE_LATENCY = METRICS.histogram(
+    "travel_genie_stage_duration_seconds",
+    "Time spent in each recommendation stage, per endpoint.",
+    ("endpoint", "stage"),
+)
+STAGE_ERRORS = METRICS.counter(
+    "travel_genie_stage_errors_total",
+    "Recommendation stages that raised or timed out, per endpoint.",
+    ("endpoint", "stage"),
+)
+METRICS.gauge(
+    "travel_genie_response_cache_hit_ratio",
+    "Share of response cache lookups that were hits.",
+    function=lambda: RESPONSE_CACHE.stats()["hit_ratio"],
+)
+METRICS.gauge(
+    "travel_genie_response_cache_entries",
+    "Recommendations currently held in the response cache.",
+    function=lambda: len(RESPONSE_CACHE),
+)
+
+
+# Compiled once at import from the shared destination registry; matching
+# cost no longer grows with the alias table
+_DESTINATION_MATCHER = DestinationMatcher(get_registry().alias_locations)
+
+
+@contextmanager
+def timed_stage(stage, endpoint):
+    """Record a stage's duration for ``endpoint``, counting it as an error if it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        STAGE_ERRORS.inc(endpoint=endpoint, stage=stage)
+        raise
+    finally:
+        STAGE_LATENCY.observe(time.perf_counter() - start, endpoint=endpoint, stage=stage)
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
 
 
-def extract_all_destinations(query, destinations_map):
+@app.after_request
+def _record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        # Route templates, not raw paths, keep label cardinality bounded
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        REQUEST_LATENCY.observe(
+            time.perf_counter() - started,
+            endpoint=endpoint, method=request.method, status=str(response.status_code),
+        )
+    return response
+
+
+def travel_window(today=None):
+    """Default search window: depart in two weeks, return a week later (ISO dates)."""
+    today = today or date.today()
+    return (today + timedelta(days=14)).isoformat(), (today + timedelta(days=21)).isoformat()
+
+
+def extract_all_destinations(query, destinations_map=None):
     """
     Extract all destinations mentioned in a query.
-    Returns list of (city, country, airport_code) tuples.
+    Returns list of (city, country, airport_code) tuples in query order.
+    
+    Aliases match on word boundaries, preferring the longest alias at each
+    position (e.g. "new delhi" over "delhi").
     """
-    query_lower = query.lower()
-    found_destinations = []
+    if destinations_map is None:
+        matcher = _DESTINATION_MATCHER
+    else:
+        matcher = DestinationMatcher(destinations_map)
+    
+    # Avoid duplicates (e.g., "bombay" and "mumbai")
+    return matcher.find_unique(query, key=lambda d: d[0])
+
+
+def _fetch_destination_bundle(memo, destination, profile, dep_date, ret_date):
+    """Fetch weather, flights, hotels and visa info for one destination."""
+    dest_name, dest_country, airport_code = destination
+    return {
+        "weather": memo.call(get_weather_forecast_tool, dest_name),
+        "flights": memo.call(search_flights_tool, "SFO", airport_code, dep_date, ret_date, profile['flexibility_days']),
+        "hotels": memo.call(search_hotels_tool, dest_name, dep_date, ret_date, profile['preferred_brands']),
+        "visa": memo.call(check_visa_requirements, dest_country, profile['citizenship']),
+    }
+
+
+def fetch_destination_bundles(memo, destinations_list, profile, dep_date, ret_date,
+                              max_workers=None, timeout=None, endpoint="/api/recommend"):
+    """
+    Fetch every destination's bundle concurrently with bounded parallelism.
     
-    # Sort by key length (longest first) to match more specific terms before shorter ones
-    for key in sorted(destinations_map.keys(), key=len, reverse=True):
-        if key in query_lower:
-            city, country, airport = destinations_map[key]
-            # Avoid duplicates (e.g., "new delhi" and "delhi")
-            if not any(d[0] == city for d in found_destinations):
-                found_destinations.append((city, country, airport))
+    Results are returned in the same order as ``destinations_list``. A
+    destination whose bundle fails or does not finish within ``timeout``
+    seconds of its worker slot becomes available gets ``None``, and counts as
+    a ``comparison_fetch`` stage error for ``endpoint``.
+    """
+    if max_workers is None:
+        max_workers = COMPARISON_MAX_WORKERS
+    if timeout is None:
+        timeout = COMPARISON_TIMEOUT_SECONDS
+    max_workers = max(1, min(max_workers, len(destinations_list)))
     
-    return found_destinations
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="destination-fetch")
+    try:
+        futures = [
+            executor.submit(_fetch_destination_bundle, memo, dest, profile, dep_date, ret_date)
+            for dest in destinations_list
+        ]
+        
+        started = time.monotonic()
+        bundles = []
+        for i, future in enumerate(futures):
+            # Destinations are picked up in waves of max_workers, so the i-th
+            # destination's deadline starts when its wave does.
+            deadline = started + timeout * (i // max_workers + 1)
+            try:
+                bundles.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                print(f"Timed out fetching data for {destinations_list[i][0]}")
+                STAGE_ERRORS.inc(endpoint=endpoint, stage="comparison_fetch")
+                bundles.append(None)
+            except Exception as e:
+                print(f"Error fetching data for {destinations_list[i][0]}: {e}")
+                STAGE_ERRORS.inc(endpoint=endpoint, stage="comparison_fetch")
+                bundles.append(None)
+        return bundles
+    finally:
+        # Don't block the response on stragglers that already timed out
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
-def get_multi_destination_comparison(query, user_id, destinations_list, profile):
+def get_multi_destination_comparison(query, user_id, destinations_list, profile, memo=None,
+                                     endpoint="/api/recommend"):
     """
     Generate a comparison between multiple destinations.
+    
+    Tool calls go through ``memo`` so each (tool, args) pair runs once per
+    request, and destinations are fetched in parallel.
     """
-    from agent.coordinator import (
-        get_weather_forecast_tool,
-        search_flights_tool,
-        search_hotels_tool
-    )
+    if memo is None:
+        memo = ToolMemo(timeout=COMPARISON_TIMEOUT_SECONDS)
+    
+    dep_date, ret_date = travel_window()
     
-    today = date.today()
-    dep_date = (today + timedelta(days=14)).isoformat()
-    ret_date = (today + timedelta(days=21)).isoformat()
+    bundles = fetch_destination_bundles(memo, destinations_list, profile, dep_date, ret_date, endpoint=endpoint)
     
     comparison = f"""I'll compare these destinations for you:\n\n"""
     
-    for i, (dest_name, dest_country, airport_code) in enumerate(destinations_list, 1):
-        # Get data for this destination
-        weather = get_weather_forecast_tool(dest_name)
-        flights = search_flights_tool("SFO", airport_code, dep_date, ret_date, profile['flexibility_days'])
-        hotels = search_hotels_tool(dest_name, dep_date, ret_date, profile['preferred_brands'])
+    for i, ((dest_name, dest_country, airport_code), bundle) in enumerate(zip(destinations_list, bundles), 1):
+        if bundle is None:
+            comparison += f"""{'='*60}
+{i}. {dest_name}, {dest_country}
+{'='*60}
+
+⏱️ Live data for {dest_name} is unavailable right now. Please try again shortly.
+
+"""
+            continue
+        
+        weather = bundle["weather"]
+        flights = bundle["flights"]
+        hotels = bundle["hotels"]
         
         # Get visa info
-        visa_info = check_visa_requirements(dest_country, profile['citizenship'])
+        visa_info = bundle["visa"]
         if visa_info['required']:
             visa_status = f"⚠️ Visa required ({visa_info.get('type', 'visa')})"
         else:
@@ -97,21 +276,27 @@ def get_multi_destination_comparison(query, user_id, destinations_list, profile)
 
 """
     
+    available = [(dest, bundle) for dest, bundle in zip(destinations_list, bundles) if bundle is not None]
+    
     # Compare temperatures
-    temps = [(dest[0], sum(get_weather_forecast_tool(dest[0])['periods'][p]['avg_temp_f'] for p in range(len(get_weather_forecast_tool(dest[0])['periods']))) / len(get_weather_forecast_tool(dest[0])['periods'])) for dest in destinations_list]
-    warmest = max(temps, key=lambda x: x[1])
-    coolest = min(temps, key=lambda x: x[1])
-    comparison += f"🌡️ Warmest: {warmest[0]} ({warmest[1]:.0f}°F) | Coolest: {coolest[0]} ({coolest[1]:.0f}°F)\n"
+    temps = [
+        (dest[0], sum(p['avg_temp_f'] for p in bundle['weather']['periods']) / len(bundle['weather']['periods']))
+        for dest, bundle in available
+    ]
+    if temps:
+        warmest = max(temps, key=lambda x: x[1])
+        coolest = min(temps, key=lambda x: x[1])
+        comparison += f"🌡️ Warmest: {warmest[0]} ({warmest[1]:.0f}°F) | Coolest: {coolest[0]} ({coolest[1]:.0f}°F)\n"
     
     # Compare flight durations
-    flight_data = [(dest[0], search_flights_tool("SFO", dest[2], dep_date, ret_date)['options'][0]['total_duration_hours']) for dest in destinations_list if search_flights_tool("SFO", dest[2], dep_date, ret_date)['options']]
+    flight_data = [(dest[0], bundle['flights']['options'][0]['total_duration_hours']) for dest, bundle in available if bundle['flights']['options']]
     if flight_data:
         shortest = min(flight_data, key=lambda x: x[1])
         longest = max(flight_data, key=lambda x: x[1])
         comparison += f"✈️ Shortest flight: {shortest[0]} ({shortest[1]:.1f}h) | Longest: {longest[0]} ({longest[1]:.1f}h)\n"
     
     # Compare prices
-    price_data = [(dest[0], min(f['price_usd'] for f in search_flights_tool("SFO", dest[2], dep_date, ret_date)['options'])) for dest in destinations_list if search_flights_tool("SFO", dest[2], dep_date, ret_date)['options']]
+    price_data = [(dest[0], min(f['price_usd'] for f in bundle['flights']['options'])) for dest, bundle in available if bundle['flights']['options']]
     if price_data:
         cheapest = min(price_data, key=lambda x: x[1])
         most_expensive = max(price_data, key=lambda x: x[1])
@@ -123,129 +308,65 @@ def get_multi_destination_comparison(query, user_id, destinations_list, profile)
     return comparison
 
 
-def get_travel_recommendation(query, user_id):
+def iter_recommendation_sections(query, user_id, memo=None, endpoint="/api/recommend"):
     """
-    Generate a travel recommendation by calling tools directly.
-    This simulates what the agent would do.
+    Generate a travel recommendation section by section.
+    
+    Yields ``(section, text)`` pairs as soon as the tools each section needs
+    have returned, so callers can stream the profile and visa notes while
+    flights and hotels are still being searched. A full recommendation is
+    emitted as ``profile``, ``visa``, ``weather``, ``flights``, ``hotels``,
+    ``recommended_window`` and ``alternatives``; comparisons, visa stops and
+    fallback messages are a single section. Joining every text gives exactly
+    the output of ``get_travel_recommendation``.
+    
+    All tool calls share a request-scoped ``ToolMemo``; pass one in to inspect
+    its hit/miss counters afterwards. Stage timings are recorded under
+    ``endpoint``.
     """
-    from tools.user_profile import _MOCK_PROFILES
-    from agent.coordinator import (
-        get_user_profile_tool,
-        get_weather_forecast_tool,
-        search_flights_tool,
-        search_hotels_tool
-    )
+    if memo is None:
+        memo = ToolMemo(timeout=COMPARISON_TIMEOUT_SECONDS)
     
     # Step 1: Get user profile
-    profile = get_user_profile_tool(user_id)
+    with timed_stage("profile", endpoint):
+        profile = memo.call(get_user_profile_tool, user_id)
     
     # Step 2: Extract destination from query (enhanced parsing)
     destination = "Maui"  # Default
     destination_country = "USA"
     airport_code = "OGG"
     
-    # Destination mapping: city -> (display_name, country, airport_code)
-    destinations = {
-        "paris": ("Paris", "France", "CDG"),
-        "tokyo": ("Tokyo", "Japan", "NRT"),
-        "bali": ("Bali", "Indonesia", "DPS"),
-        "hawaii": ("Maui", "USA", "OGG"),
-        "maui": ("Maui", "USA", "OGG"),
-        # India - Major Cities
-        "bangalore": ("Bangalore", "India", "BLR"),
-        "bengaluru": ("Bangalore", "India", "BLR"),
-        "mumbai": ("Mumbai", "India", "BOM"),
-        "bombay": ("Mumbai", "India", "BOM"),
-        "delhi": ("Delhi", "India", "DEL"),
-        "new delhi": ("Delhi", "India", "DEL"),
-        "hyderabad": ("Hyderabad", "India", "HYD"),
-        "chennai": ("Chennai", "India", "MAA"),
-        "madras": ("Chennai", "India", "MAA"),
-        "kolkata": ("Kolkata", "India", "CCU"),
-        "calcutta": ("Kolkata", "India", "CCU"),
-        "pune": ("Pune", "India", "PNQ"),
-        "ahmedabad": ("Ahmedabad", "India", "AMD"),
-        "jaipur": ("Jaipur", "India", "JAI"),
-        "goa": ("Goa", "India", "GOI"),
-        "kochi": ("Kochi", "India", "COK"),
-        "cochin": ("Kochi", "India", "COK"),
-        "trivandrum": ("Trivandrum", "India", "TRV"),
-        "thiruvananthapuram": ("Trivandrum", "India", "TRV"),
-        "chandigarh": ("Chandigarh", "India", "IXC"),
-        "lucknow": ("Lucknow", "India", "LKO"),
-        "indore": ("Indore", "India", "IDR"),
-        "bhubaneswar": ("Bhubaneswar", "India", "BBI"),
-        "coimbatore": ("Coimbatore", "India", "CJB"),
-        "visakhapatnam": ("Visakhapatnam", "India", "VTZ"),
-        "vizag": ("Visakhapatnam", "India", "VTZ"),
-        "nagpur": ("Nagpur", "India", "NAG"),
-        "surat": ("Surat", "India", "STV"),
-        "vadodara": ("Vadodara", "India", "BDQ"),
-        "baroda": ("Vadodara", "India", "BDQ"),
-        "amritsar": ("Amritsar", "India", "ATQ"),
-        "varanasi": ("Varanasi", "India", "VNS"),
-        "banaras": ("Varanasi", "India", "VNS"),
-        "agra": ("Agra", "India", "AGR"),
-        "udaipur": ("Udaipur", "India", "UDR"),
-        "jodhpur": ("Jodhpur", "India", "JDH"),
-        "mangalore": ("Mangalore", "India", "IXE"),
-        "mangaluru": ("Mangalore", "India", "IXE"),
-        # Other destinations
-        "london": ("London", "UK", "LHR"),
-        "new york": ("New York", "USA", "JFK"),
-        "nyc": ("New York", "USA", "JFK"),
-        "los angeles": ("Los Angeles", "USA", "LAX"),
-        "la": ("Los Angeles", "USA", "LAX"),
-        "san francisco": ("San Francisco", "USA", "SFO"),
-        "sf": ("San Francisco", "USA", "SFO"),
-        "dubai": ("Dubai", "UAE", "DXB"),
-        "singapore": ("Singapore", "Singapore", "SIN"),
-        "hong kong": ("Hong Kong", "Hong Kong", "HKG"),
-        "sydney": ("Sydney", "Australia", "SYD"),
-        "melbourne": ("Melbourne", "Australia", "MEL"),
-        "bangkok": ("Bangkok", "Thailand", "BKK"),
-        "shanghai": ("Shanghai", "China", "PVG"),
-        "beijing": ("Beijing", "China", "PEK"),
-        "seoul": ("Seoul", "South Korea", "ICN"),
-        "rome": ("Rome", "Italy", "FCO"),
-        "barcelona": ("Barcelona", "Spain", "BCN"),
-        "amsterdam": ("Amsterdam", "Netherlands", "AMS"),
-        "berlin": ("Berlin", "Germany", "BER"),
-        "zurich": ("Zurich", "Switzerland", "ZRH"),
-        "switzerland": ("Zurich", "Switzerland", "ZRH"),
-        "geneva": ("Geneva", "Switzerland", "GVA"),
-        "vienna": ("Vienna", "Austria", "VIE"),
-        "prague": ("Prague", "Czech Republic", "PRG"),
-        "istanbul": ("Istanbul", "Turkey", "IST"),
-        "cairo": ("Cairo", "Egypt", "CAI"),
-        "cape town": ("Cape Town", "South Africa", "CPT"),
-        "rio": ("Rio de Janeiro", "Brazil", "GIG"),
-        "rio de janeiro": ("Rio de Janeiro", "Brazil", "GIG"),
-        "buenos aires": ("Buenos Aires", "Argentina", "EZE"),
-        "mexico city": ("Mexico City", "Mexico", "MEX"),
-        "cancun": ("Cancun", "Mexico", "CUN"),
-        "toronto": ("Toronto", "Canada", "YYZ"),
-        "vancouver": ("Vancouver", "Canada", "YVR"),
-        "montreal": ("Montreal", "Canada", "YUL"),
-    }
-    
     # Search for destinations in query - check if multiple destinations mentioned
     query_lower = query.lower()
-    all_destinations = extract_all_destinations(query, destinations)
+    with timed_stage("destination_match", endpoint):
+        all_destinations = extract_all_destinations(query)
     
     # Check if this is a comparison query (multiple destinations with "or")
     is_comparison = len(all_destinations) > 1 and (" or " in query_lower or " vs " in query_lower)
     
     if is_comparison:
         # Handle multi-destination comparison
-        return get_multi_destination_comparison(query, user_id, all_destinations, profile)
+        with timed_stage("comparison", endpoint):
+            comparison = get_multi_destination_comparison(
+                query, user_id, all_destinations, profile, memo, endpoint
+            )
+        yield "comparison", comparison
+        return
     
     # Single destination query - use first found destination or return error
     if all_destinations:
         destination, destination_country, airport_code = all_destinations[0]
+    elif "visa" in query_lower and any(word in query_lower for word in ("without", "free", "no visa")):
+        # "Where can I travel without a visa?" - answer from the inverted index
+        yield "visa_suggestions", f"""Here's where you can travel easily as a {profile['citizenship']} citizen:
+
+{suggest_visa_friendly_destinations(profile['citizenship'])}
+💡 Ask me about any of these destinations and I'll check weather, flights and hotels for you!
+"""
+        return
     else:
         # No destination found - provide helpful message
-        return f"""I couldn't identify a specific destination in your query: "{query}"
+        yield "message", f"""I couldn't identify a specific destination in your query: "{query}"
 
 I can help you plan trips to many destinations around the world! Here are some examples:
 
@@ -273,10 +394,12 @@ I can help you plan trips to many destinations around the world! Here are some e
 • "Best time for Bali vacation?"
 
 What destination would you like to know about?"""
+        return
     
     # Step 3: Check visa requirements BEFORE searching flights
     # IMPORTANT: Visa depends on citizenship, not booking location!
-    visa_info = check_visa_requirements(destination_country, profile['citizenship'])
+    with timed_stage("visa", endpoint):
+        visa_info = memo.call(check_visa_requirements, destination_country, profile['citizenship'])
     
     # If visa is required, provide guidance
     if visa_info['required']:
@@ -319,7 +442,7 @@ Apply online at least 72 hours before travel.
 """
         else:
             # Full visa required - stop here
-            return f"""⚠️ IMPORTANT: Visa Required for {destination}
+            yield "visa", f"""⚠️ IMPORTANT: Visa Required for {destination}
 
 Before I search for flights and hotels, I need to inform you that as a {profile['citizenship']} citizen, you need a visa to enter {destination_country}.
 
@@ -343,8 +466,11 @@ NEXT STEPS:
 
 💡 TIP: Some countries offer e-visas or visa-on-arrival which are faster!
 
-Would you like me to suggest visa-free destinations instead?
+🌍 EASIER DESTINATIONS FOR {profile['citizenship']} PASSPORTS
+{suggest_visa_friendly_destinations(profile['citizenship'])}
+Would you like a recommendation for one of these instead?
 """
+            return
     else:
         # No visa required or visa-free
         visa_type = visa_info.get('type', 'visa_free')
@@ -365,36 +491,60 @@ As a {profile['citizenship']} citizen, you can visit {destination_country} visa-
 
 """
     
+    yield "profile", render_profile_section(destination, profile)
+    yield "visa", render_visa_section(visa_note)
+    
     # Step 4: Get weather forecast
-    weather = get_weather_forecast_tool(destination)
+    with timed_stage("weather", endpoint):
+        weather = memo.call(get_weather_forecast_tool, destination)
+    yield "weather", render_weather_section(destination, weather)
     
     # Step 5: Search flights (assuming SFO origin)
-    today = date.today()
-    dep_date = (today + timedelta(days=14)).isoformat()
-    ret_date = (today + timedelta(days=21)).isoformat()
-    
-    flights = search_flights_tool(
-        origin="SFO",
-        destination=airport_code,
-        departure_date=dep_date,
-        return_date=ret_date,
-        flexibility_days=profile['flexibility_days']
-    )
+    dep_date, ret_date = travel_window()
+    
+    with timed_stage("flights", endpoint):
+        flights = memo.call(
+            search_flights_tool,
+            origin="SFO",
+            destination=airport_code,
+            departure_date=dep_date,
+            return_date=ret_date,
+            flexibility_days=profile['flexibility_days']
+        )
+    yield "flights", render_flight_section(profile, flights)
     
     # Step 6: Search hotels
-    hotels = search_hotels_tool(
-        destination=destination,
-        check_in_date=dep_date,
-        check_out_date=ret_date,
-        preferred_brands=profile['preferred_brands']
-    )
+    with timed_stage("hotels", endpoint):
+        hotels = memo.call(
+            search_hotels_tool,
+            destination=destination,
+            check_in_date=dep_date,
+            check_out_date=ret_date,
+            preferred_brands=profile['preferred_brands']
+        )
     
-    # Step 7: Synthesize recommendation (now includes visa info)
-    recommendation = synthesize_recommendation(
-        query, destination, profile, weather, flights, hotels, visa_note
-    )
+    yield "hotels", render_hotel_section(profile, hotels)
     
-    return recommendation
+    # Step 7: Recommend a window from everything gathered above
+    with timed_stage("synthesis", endpoint):
+        window = render_window_section(profile, weather, flights, hotels)
+        frontier = render_frontier_section(profile, weather, flights, hotels)
+        alternatives = render_alternatives_section(profile, flights, hotels)
+    yield "recommended_window", window
+    yield "frontier", frontier
+    yield "alternatives", alternatives
+
+
+def get_travel_recommendation(query, user_id, memo=None, endpoint="/api/recommend"):
+    """
+    Generate a travel recommendation by calling tools directly.
+    This simulates what the agent would do.
+    
+    All tool calls share a request-scoped ``ToolMemo``; pass one in to inspect
+    its hit/miss counters afterwards. Stage timings are recorded under
+    ``endpoint``.
+    """
+    return "".join(text for _, text in iter_recommendation_sections(query, user_id, memo, endpoint))
 
 
 def check_visa_requirements(destination_country, citizenship):
@@ -409,63 +559,8 @@ def check_visa_requirements(destination_country, citizenship):
     Returns:
         Dictionary with visa requirements
     """
-    # Visa requirements matrix: {(citizenship, destination): requirements}
-    # Format: (from_country, to_country): {required, processing_time, cost, type}
-    
-    visa_matrix = {
-        # USA citizens traveling to:
-        ("USA", "USA"): {"required": False, "type": "domestic"},
-        ("USA", "France"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Japan"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Indonesia"): {"required": True, "type": "visa_on_arrival", "processing_time": "On arrival", "cost": "$35", "max_stay": "30 days"},
-        ("USA", "China"): {"required": True, "type": "visa", "processing_time": "4-10 business days", "cost": "$140"},
-        ("USA", "India"): {"required": True, "type": "e-visa", "processing_time": "2-4 business days", "cost": "$25-100"},
-        ("USA", "UK"): {"required": False, "type": "visa_waiver", "max_stay": "6 months"},
-        ("USA", "UAE"): {"required": False, "type": "visa_free", "max_stay": "90 days"},
-        ("USA", "Singapore"): {"required": False, "type": "visa_free", "max_stay": "90 days"},
-        ("USA", "Thailand"): {"required": False, "type": "visa_free", "max_stay": "30 days"},
-        ("USA", "Australia"): {"required": True, "type": "e-visa", "processing_time": "1-2 business days", "cost": "$20"},
-        ("USA", "South Korea"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Hong Kong"): {"required": False, "type": "visa_free", "max_stay": "90 days"},
-        ("USA", "Mexico"): {"required": False, "type": "visa_free", "max_stay": "180 days"},
-        ("USA", "Canada"): {"required": False, "type": "visa_free", "max_stay": "6 months"},
-        ("USA", "Brazil"): {"required": True, "type": "e-visa", "processing_time": "5-10 business days", "cost": "$80"},
-        ("USA", "Argentina"): {"required": False, "type": "visa_free", "max_stay": "90 days"},
-        ("USA", "Italy"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Spain"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Germany"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Netherlands"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Switzerland"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Austria"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Czech Republic"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("USA", "Turkey"): {"required": True, "type": "e-visa", "processing_time": "Instant", "cost": "$50"},
-        ("USA", "Egypt"): {"required": True, "type": "visa_on_arrival", "processing_time": "On arrival", "cost": "$25", "max_stay": "30 days"},
-        ("USA", "South Africa"): {"required": False, "type": "visa_free", "max_stay": "90 days"},
-        
-        # India citizens traveling to:
-        ("India", "India"): {"required": False, "type": "domestic"},
-        ("India", "USA"): {"required": True, "type": "visa", "processing_time": "3-5 weeks", "cost": "$160"},
-        ("India", "France"): {"required": True, "type": "schengen_visa", "processing_time": "15 days", "cost": "€80"},
-        ("India", "Japan"): {"required": True, "type": "visa", "processing_time": "5-7 business days", "cost": "$30"},
-        ("India", "Indonesia"): {"required": False, "type": "visa_free", "max_stay": "30 days"},
-        ("India", "UK"): {"required": True, "type": "visa", "processing_time": "3 weeks", "cost": "£100"},
-        ("India", "UAE"): {"required": False, "type": "visa_on_arrival", "processing_time": "On arrival", "cost": "$60", "max_stay": "60 days"},
-        ("India", "Singapore"): {"required": True, "type": "e-visa", "processing_time": "1-3 business days", "cost": "$30"},
-        ("India", "Thailand"): {"required": False, "type": "visa_on_arrival", "processing_time": "On arrival", "cost": "$35", "max_stay": "15 days"},
-        ("India", "Australia"): {"required": True, "type": "e-visa", "processing_time": "1-2 business days", "cost": "$145"},
-        
-        # UK citizens traveling to:
-        ("UK", "USA"): {"required": False, "type": "esta", "processing_time": "72 hours", "cost": "$21", "max_stay": "90 days"},
-        ("UK", "France"): {"required": False, "type": "visa_free", "max_stay": "90 days"},
-        ("UK", "Japan"): {"required": False, "type": "visa_waiver", "max_stay": "90 days"},
-        ("UK", "Indonesia"): {"required": False, "type": "visa_free", "max_stay": "30 days"},
-        ("UK", "India"): {"required": True, "type": "e-visa", "processing_time": "2-4 business days", "cost": "$25-100"},
-        ("UK", "Australia"): {"required": True, "type": "e-visa", "processing_time": "1-2 business days", "cost": "$20"},
-    }
-    
-    # Get visa requirement
-    key = (citizenship, destination_country)
-    visa_req = visa_matrix.get(key)
+    # Indexed matrix loaded once from core/data/visa_requirements.json
+    visa_req = get_visa_matrix().lookup(citizenship, destination_country)
     
     if not visa_req:
         # Default: assume visa required if not in matrix
@@ -490,21 +585,79 @@ def check_visa_requirements(destination_country, citizenship):
     }
 
 
-def synthesize_recommendation(query, destination, profile, weather, flights, hotels, visa_note):
-    """Synthesize a comprehensive travel recommendation."""
+def suggest_visa_friendly_destinations(citizenship, limit=8):
+    """
+    Describe destinations that are easy to enter on this passport.
+    
+    Uses the visa matrix's inverted index, so no pairs are scanned.
+    """
+    matrix = get_visa_matrix()
+    registry = get_registry()
+    
+    def describe(countries):
+        entries = []
+        for country in countries[:limit]:
+            cities = [d.city for d in registry.in_country(country)][:2]
+            entries.append(f"{country} ({', '.join(cities)})" if cities else country)
+        return ", ".join(entries)
+    
+    visa_free = matrix.visa_free_destinations(citizenship)
+    easy_visa = matrix.easy_visa_destinations(citizenship)
     
-    # Analyze weather
+    if not visa_free and not easy_visa:
+        return f"I don't have visa data for {citizenship} passports yet. Please check with the embassy of your destination.\n"
+    
+    suggestions = ""
+    if visa_free:
+        suggestions += f"✅ No visa needed: {describe(visa_free)}\n"
+    if easy_visa:
+        suggestions += f"⚡ E-visa or visa on arrival: {describe(easy_visa)}\n"
+    return suggestions
+
+
+def render_profile_section(destination, profile):
+    """Opening line and the traveller's profile summary."""
     temp_min, temp_max = profile['preferred_temp_range']
+    return f"""Based on your travel preferences and current conditions, here's my analysis for {destination}:
+
+👤 YOUR PROFILE
+Citizenship: {profile.get('citizenship', 'USA')}
+Temperature preference: {temp_min}°F - {temp_max}°F
+Flight budget: ${profile['airfare_budget_soft']:.0f} (soft) / ${profile['airfare_budget_hard']:.0f} (hard)
+Hotel budget: ${profile['hotel_budget_min']:.0f} - ${profile['hotel_budget_max']:.0f}/night
+Preferred brands: {', '.join(profile['preferred_brands']) if profile['preferred_brands'] else 'None'}
+Safety conscious: {'Yes' if profile['safety_conscious'] else 'No'}
+Flexibility: ±{profile['flexibility_days']} days
+
+"""
+
+
+def render_visa_section(visa_note):
+    """Visa and entry requirements."""
+    return f"""🛂 VISA & ENTRY REQUIREMENTS
+{visa_note}
+
+"""
+
+
+def render_weather_section(destination, weather):
+    """Weather summary with storm alerts."""
     weather_analysis = f"Weather forecast for {destination}: {weather['overall_summary']}\n\n"
     
     storm_periods = [p for p in weather['periods'] if p['storm_risk']]
     if storm_periods:
         weather_analysis += f"⚠️ Storm Alert: {len(storm_periods)} period(s) with storm risk detected.\n"
     
-    # Analyze flights
+    return f"""🌤️ WEATHER ANALYSIS
+{weather_analysis}
+
+"""
+
+
+def render_flight_section(profile, flights):
+    """Flight price range, budget fit and the top 3 options."""
     flight_options = flights['options']
     affordable_flights = [f for f in flight_options if f['price_usd'] <= profile['airfare_budget_soft']]
-    budget_flights = [f for f in flight_options if f['price_usd'] <= profile['airfare_budget_hard']]
     
     flight_analysis = f"\n✈️ FLIGHT OPTIONS ({len(flight_options)} found)\n"
     
@@ -523,18 +676,23 @@ def synthesize_recommendation(query, destination, profile, weather, flights, hot
     else:
         flight_analysis += "No flight options available for the specified dates.\n"
     
-    # Analyze hotels
+    return f"{flight_analysis}\n\n"
+
+
+def render_hotel_section(profile, hotels):
+    """Hotel rate range, budget and brand fit, and the top 3 options."""
     hotel_options = hotels['options']
-    affordable_hotels = [h for h in hotel_options if h['nightly_rate_usd'] >= profile['hotel_budget_min'] and h['nightly_rate_usd'] <= profile['hotel_budget_max']]
-    preferred_hotels = [h for h in affordable_hotels if h['brand'] in profile['preferred_brands']]
-    anomalous_hotels = [h for h in hotel_options if h['is_anomalous_pricing']]
+    # A request's few options are counted directly; building an index costs more
+    affordable_hotels = [h for h in hotel_options if profile['hotel_budget_min'] <= h['nightly_rate_usd'] <= profile['hotel_budget_max']]
+    affordable_count = len(affordable_hotels)
+    preferred_count = sum(1 for h in affordable_hotels if h['brand'] in profile['preferred_brands'])
     
     hotel_analysis = f"\n🏨 HOTEL OPTIONS ({len(hotel_options)} found)\n"
     
     if hotel_options:
         hotel_analysis += f"Nightly rate range: ${min(h['nightly_rate_usd'] for h in hotel_options):.0f} - ${max(h['nightly_rate_usd'] for h in hotel_options):.0f}\n"
-        hotel_analysis += f"Within your budget: {len(affordable_hotels)} options\n"
-        hotel_analysis += f"Preferred brands available: {len(preferred_hotels)} options\n"
+        hotel_analysis += f"Within your budget: {affordable_count} options\n"
+        hotel_analysis += f"Preferred brands available: {preferred_count} options\n"
         
         # Always show top 3 hotel options
         hotel_analysis += f"\n📋 Top 3 Hotel Options:\n"
@@ -551,30 +709,20 @@ def synthesize_recommendation(query, destination, profile, weather, flights, hot
     else:
         hotel_analysis += "No hotel options available for the specified dates.\n"
     
-    # Build recommendation with visa info first
-    recommendation = f"""Based on your travel preferences and current conditions, here's my analysis for {destination}:
+    return f"{hotel_analysis}\n\n"
 
-👤 YOUR PROFILE
-Citizenship: {profile.get('citizenship', 'USA')}
-Temperature preference: {temp_min}°F - {temp_max}°F
-Flight budget: ${profile['airfare_budget_soft']:.0f} (soft) / ${profile['airfare_budget_hard']:.0f} (hard)
-Hotel budget: ${profile['hotel_budget_min']:.0f} - ${profile['hotel_budget_max']:.0f}/night
-Preferred brands: {', '.join(profile['preferred_brands']) if profile['preferred_brands'] else 'None'}
-Safety conscious: {'Yes' if profile['safety_conscious'] else 'No'}
-Flexibility: ±{profile['flexibility_days']} days
 
-🛂 VISA & ENTRY REQUIREMENTS
-{visa_note}
-
-🌤️ WEATHER ANALYSIS
-{weather_analysis}
-
-{flight_analysis}
-
-{hotel_analysis}
-
-✨ RECOMMENDED TRAVEL WINDOW
-"""
+def render_window_section(profile, weather, flights, hotels):
+    """Recommended travel window built from the best flight and hotel."""
+    flight_options = flights['options']
+    hotel_options = hotels['options']
+    affordable_flights = [f for f in flight_options if f['price_usd'] <= profile['airfare_budget_soft']]
+    affordable_hotel_count = sum(
+        1 for h in hotel_options if profile['hotel_budget_min'] <= h['nightly_rate_usd'] <= profile['hotel_budget_max']
+    )
+    storm_periods = [p for p in weather['periods'] if p['storm_risk']]
+    
+    recommendation = "✨ RECOMMENDED TRAVEL WINDOW\n"
     
     # Use the best available option (first in sorted list)
     if flight_options and hotel_options:
@@ -614,12 +762,107 @@ Why this option:
                     recommendation += f"• This hotel is below your minimum budget (great value!)\n"
                 else:
                     recommendation += f"• Hotel is ${best_hotel['nightly_rate_usd'] - profile['hotel_budget_max']:.0f}/night over your budget\n"
-                if affordable_hotels:
-                    recommendation += f"• {len(affordable_hotels)} hotel(s) within your budget available\n"
+                if affordable_hotel_count:
+                    recommendation += f"• {affordable_hotel_count} hotel(s) within your budget available\n"
     
     else:
         recommendation += "\nBased on current availability, I recommend adjusting your dates or budget for better options.\n"
     
+    return recommendation
+
+
+def index_weather_scores(profile, weather):
+    """Interval index of (period, score) pairs, each forecast period scored for the traveller."""
+    scoring_profile = UserProfile(
+        user_id=profile.get('user_id', 'default'),
+        preferred_temp_range=tuple(profile['preferred_temp_range']),
+        safety_conscious=profile['safety_conscious'],
+    )
+    periods = [weather_period_from_dict(p) for p in weather['periods']]
+    return index_scored_periods([(period, score_weather_period(period, scoring_profile)[0]) for period in periods])
+
+
+def trip_frontier(profile, weather, flights, hotels):
+    """
+    Flight + hotel trips that no other trip beats on total price, flight time,
+    hotel rating and departure-week weather all at once, cheapest first.
+    
+    Each side is reduced to its own frontier before pairing: a flight beaten on
+    price, duration and weather (or a hotel beaten on price and rating) is
+    beaten by the same swap in every trip it appears in.
+    """
+    weather_index = index_weather_scores(profile, weather)
+    flight_entries = []
+    for flight in flights['options']:
+        match = weather_index.stab(date.fromisoformat(flight['departure_date']))
+        flight_entries.append((flight, match[1] if match else 0.0))
+    
+    flight_frontier = pareto_frontier(
+        flight_entries,
+        (lambda e: e[0]['price_usd'], lambda e: e[0]['total_duration_hours'], itemgetter(1)),
+        maximize=(False, False, True),
+    )
+    hotel_frontier = pareto_frontier(
+        hotels['options'], (itemgetter('total_price_usd'), itemgetter('rating')), maximize=(False, True)
+    )
+    trips = [
+        {
+            "flight": flight,
+            "hotel": hotel,
+            "total_price_usd": flight['price_usd'] + hotel['total_price_usd'],
+            "duration_hours": flight['total_duration_hours'],
+            "rating": hotel['rating'],
+            "weather_score": weather_score,
+        }
+        for flight, weather_score in flight_frontier
+        for hotel in hotel_frontier
+    ]
+    return pareto_frontier(
+        trips,
+        (itemgetter('total_price_usd'), itemgetter('duration_hours'), itemgetter('rating'), itemgetter('weather_score')),
+        maximize=(False, False, True, True),
+    )
+
+
+def render_frontier_section(profile, weather, flights, hotels):
+    """Non-dominated trade-offs: cheapest, fastest, best-rated and best-weather trips."""
+    frontier = trip_frontier(profile, weather, flights, hotels)
+    if not frontier:
+        return ""
+    
+    # The best trip on each criterion is always listed; the rest fill by price
+    labels = {}
+    for label, key, best in (
+        ("Cheapest", 'total_price_usd', min),
+        ("Shortest flight", 'duration_hours', min),
+        ("Best-rated hotel", 'rating', max),
+        ("Best weather", 'weather_score', max),
+    ):
+        trip = best(frontier, key=itemgetter(key))
+        labels.setdefault(id(trip), []).append(label)
+    shown = [trip for trip in frontier if id(trip) in labels]
+    shown += [trip for trip in frontier if id(trip) not in labels][:max(0, FRONTIER_MAX_OPTIONS - len(shown))]
+    shown.sort(key=itemgetter('total_price_usd'))
+    
+    section = f"\n📊 TRADE-OFFS ({len(frontier)} option(s) not beaten on price, flight time, hotel rating and weather)\n"
+    for i, trip in enumerate(shown, 1):
+        flight, hotel = trip['flight'], trip['hotel']
+        tags = f" - {', '.join(labels[id(trip)])}" if id(trip) in labels else ""
+        section += f"\n{i}. ${trip['total_price_usd']:.0f} total{tags}\n"
+        section += f"   Flight: {flight['airline']} ${flight['price_usd']:.0f}, {flight['departure_date']} to {flight['return_date']}, {trip['duration_hours']:.1f}h\n"
+        section += f"   Hotel: {hotel['name']} ${hotel['total_price_usd']:.0f}, rated {trip['rating']:.1f}/5.0\n"
+        section += f"   Weather match: {trip['weather_score']:.2f}\n"
+    return f"{section}\n"
+
+
+def render_alternatives_section(profile, flights, hotels):
+    """Runner-up flight and hotel, rejected periods and follow-up prompts."""
+    flight_options = flights['options']
+    hotel_options = hotels['options']
+    affordable_flights = [f for f in flight_options if f['price_usd'] <= profile['airfare_budget_soft']]
+    
+    recommendation = ""
+    
     # Add alternatives if available - format like Top 3 options
     if len(flight_options) > 1 and len(hotel_options) > 1:
         alt_flight = flight_options[1]
@@ -662,12 +905,45 @@ Why this option:
     return recommendation
 
 
+def synthesize_recommendation(query, destination, profile, weather, flights, hotels, visa_note):
+    """Synthesize a comprehensive travel recommendation."""
+    return (
+        render_profile_section(destination, profile)
+        + render_visa_section(visa_note)
+        + render_weather_section(destination, weather)
+        + render_flight_section(profile, flights)
+        + render_hotel_section(profile, hotels)
+        + render_window_section(profile, weather, flights, hotels)
+        + render_frontier_section(profile, weather, flights, hotels)
+        + render_alternatives_section(profile, flights, hotels)
+    )
+
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Request, stage, error and cache metrics in Prometheus text format."""
+    return Response(METRICS.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint."""
     return jsonify({"status": "healthy", "service": "Travel Genie API"})
 
 
+def _profile_version(profile):
+    """Stable fingerprint of a profile, so edits invalidate cached responses."""
+    encoded = json.dumps(profile, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def response_cache_key(query, user_id):
+    """Cache key: (normalized query, user_id, profile version, today's date)."""
+    normalized_query = " ".join(query.lower().split())
+    profile = get_user_profile_tool(user_id)
+    return (normalized_query, user_id, _profile_version(profile), date.today().isoformat())
+
+
 @app.route('/api/recommend', methods=['POST'])
 def get_recommendation():
     """Get travel recommendation from the agent."""
@@ -679,19 +955,36 @@ def get_recommendation():
         if not query:
             return jsonify({"error": "Query is required"}), 400
         
-        # Generate recommendation
-        recommendation_text = get_travel_recommendation(query, user_id)
+        # Identical requests on the same day produce identical output
+        cache_key = response_cache_key(query, user_id)
+        recommendation_text = RESPONSE_CACHE.get(cache_key)
+        cache_status = "HIT"
+        if recommendation_text is None:
+            cache_status = "MISS"
+            recommendation_text = get_travel_recommendation(query, user_id)
+            RESPONSE_CACHE.put(cache_key, recommendation_text)
         
-        return jsonify({
+        payload = {
             "success": True,
             "query": query,
             "userId": user_id,
             "recommendation": recommendation_text,
             "timestamp": None
-        })
+        }
+        etag = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:32]
+        
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = jsonify(payload)
+        response.set_etag(etag)
+        response.headers['X-Cache'] = cache_status
+        response.headers['Cache-Control'] = f"private, max-age={int(RESPONSE_CACHE.ttl_remaining(cache_key))}"
+        return response
             
     except Exception as e:
         print(f"Error processing recommendation: {e}")
+        REQUEST_ERRORS.inc(endpoint="/api/recommend")
         import traceback
         traceback.print_exc()
         return jsonify({
@@ -700,13 +993,131 @@ def get_recommendation():
         }), 500
 
 
+def _sse_event(event, data):
+    """Format one Server-Sent Event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/api/recommend/stream', methods=['GET', 'POST'])
+def stream_recommendation():
+    """
+    Stream a travel recommendation as Server-Sent Events.
+    
+    Each section is sent as a ``section`` event as soon as it is ready,
+    followed by a ``done`` event; failures mid-stream arrive as an ``error``
+    event. Accepts ``query``/``userId`` as JSON (POST) or query-string
+    parameters (GET, for ``EventSource``). A response-cache hit is sent as a
+    single ``recommendation`` section.
+    """
+    if request.method == 'POST':
+        data = request.get_json(silent=True) or {}
+    else:
+        data = request.args
+    query = data.get('query', '')
+    user_id = data.get('userId', 'default')
+    
+    if not query:
+        return jsonify({"error": "Query is required"}), 400
+    
+    cache_key = response_cache_key(query, user_id)
+    cached_text = RESPONSE_CACHE.get(cache_key)
+    
+    def generate():
+        if cached_text is not None:
+            yield _sse_event("section", {"section": "recommendation", "text": cached_text})
+            yield _sse_event("done", {"success": True, "query": query, "userId": user_id})
+            return
+        
+        parts = []
+        try:
+            for section, text in iter_recommendation_sections(query, user_id, endpoint="/api/recommend/stream"):
+                parts.append(text)
+                yield _sse_event("section", {"section": section, "text": text})
+        except Exception as e:
+            print(f"Error streaming recommendation: {e}")
+            REQUEST_ERRORS.inc(endpoint="/api/recommend/stream")
+            import traceback
+            traceback.print_exc()
+            yield _sse_event("error", {"success": False, "error": str(e)})
+            return
+        
+        RESPONSE_CACHE.put(cache_key, "".join(parts))
+        yield _sse_event("done", {"success": True, "query": query, "userId": user_id})
+    
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Don't let nginx buffer the stream
+    response.headers['X-Cache'] = "HIT" if cached_text is not None else "MISS"
+    return response
+
+
+def iter_batch_recommendations(requests_list, memo=None):
+    """
+    Generate recommendations for many (query, user) pairs, in input order.
+    
+    Every request goes through one batch-wide ``ToolMemo``, so each tool runs
+    once per unique argument set across the whole batch, and repeated
+    (query, user) pairs are served from ``RESPONSE_CACHE``. Each result dict
+    is yielded as soon as its request completes, so nothing waits on later
+    requests.
+    """
+    if memo is None:
+        memo = ToolMemo(timeout=COMPARISON_TIMEOUT_SECONDS)
+    
+    for index, item in enumerate(requests_list):
+        if not isinstance(item, dict) or not item.get('query'):
+            yield {"index": index, "success": False, "error": "Query is required"}
+            continue
+        query = item['query']
+        user_id = item.get('userId', 'default')
+        try:
+            cache_key = response_cache_key(query, user_id)
+            text = RESPONSE_CACHE.get(cache_key)
+            if text is None:
+                text = get_travel_recommendation(query, user_id, memo, endpoint="/api/recommend/batch")
+                RESPONSE_CACHE.put(cache_key, text)
+        except Exception as e:
+            print(f"Error processing batch request {index}: {e}")
+            REQUEST_ERRORS.inc(endpoint="/api/recommend/batch")
+            yield {"index": index, "success": False, "error": str(e)}
+            continue
+        yield {
+            "index": index,
+            "success": True,
+            "query": query,
+            "userId": user_id,
+            "recommendation": text,
+        }
+
+
+@app.route('/api/recommend/batch', methods=['POST'])
+def batch_recommendations():
+    """
+    Generate recommendations for an array of requests, streamed as NDJSON.
+    
+    Accepts ``[{"query": ..., "userId": ...}, ...]`` or the same list under a
+    ``requests`` key. Each output line is one result, in input order.
+    """
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get('requests')
+    if not isinstance(data, list):
+        return jsonify({"error": "Expected a JSON array of requests"}), 400
+    if len(data) > BATCH_MAX_REQUESTS:
+        return jsonify({"error": f"At most {BATCH_MAX_REQUESTS} requests per batch"}), 413
+    
+    def generate():
+        for result in iter_batch_recommendations(data):
+            yield json.dumps(result) + "\n"
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
 @app.route('/api/user-profile/<user_id>', methods=['GET'])
 def get_user_profile(user_id):
     """Get user profile information."""
     try:
-        from tools.user_profile import _MOCK_PROFILES
-        
-        profile = _MOCK_PROFILES.get(user_id, _MOCK_PROFILES.get("default"))
+        profile = MOCK_PROFILES.get(user_id, MOCK_PROFILES.get("default"))
         
         if not profile:
             return jsonify({"error": "User not found"}), 404
@@ -728,6 +1139,7 @@ def get_user_profile(user_id):
         
     except Exception as e:
         print(f"Error getting user profile: {e}")
+        REQUEST_ERRORS.inc(endpoint="/api/user-profile/<user_id>")
         return jsonify({"error": str(e)}), 500
 
 
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: scalar vs. columnar scoring of flight and hotel candidates.
+
+Run from the project root:
+    python benchmarks/bench_batch_scoring.py
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analysis import score_flight_option, score_hotel_option
+from core.batch import FlightBatch, HotelBatch, score_flights_batch, score_hotels_batch
+from core.models import FlightOption, HotelOption, UserProfile
+
+BRANDS = ["Marriott", "Hilton", "Hyatt", "Westin", "Four Seasons", "Budget Inn"]
+
+
+def random_flights(count, seed=1):
+    rng = random.Random(seed)
+    today = date.today()
+    return [
+        FlightOption(today, today + timedelta(days=7), rng.uniform(200, 1500), "United", "08:30", "14:20",
+                     rng.random() < 0.5, rng.random() < 0.7, rng.randrange(3), 8.0, f"FLT-{i}")
+        for i in range(count)
+    ]
+
+
+def random_hotels(count, seed=1):
+    rng = random.Random(seed)
+    today = date.today()
+    hotels = []
+    for i in range(count):
+        anomalous = rng.random() < 0.3
+        hotels.append(HotelOption(
+            today, today + timedelta(days=5), rng.uniform(60, 600), 0.0, rng.choice(BRANDS), f"Hotel {i}",
+            round(rng.uniform(2.5, 5.0), 1), anomalous, "Storm discount" if anomalous else None, f"HTL-{i}",
+        ))
+    return hotels
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    profile = UserProfile(user_id="bench", preferred_brands=["Marriott"])
+    print(f"{'kind':>7} {'rows':>7} {'scalar ms':>10} {'batch ms':>9} {'speedup':>8}")
+    for size in (1000, 100000):
+        flights = random_flights(size)
+        hotels = random_hotels(size)
+        flight_batch = FlightBatch.from_options(flights)
+        hotel_batch = HotelBatch.from_options(hotels)
+        for kind, scalar, batch in (
+            ("flights", lambda: [score_flight_option(f, profile) for f in flights],
+             lambda: score_flights_batch(flight_batch, profile)),
+            ("hotels", lambda: [score_hotel_option(h, profile) for h in hotels],
+             lambda: score_hotels_batch(hotel_batch, profile)),
+        ):
+            slow, fast = best_of(scalar), best_of(batch)
+            print(f"{kind:>7} {size:>7} {slow * 1e3:>10.2f} {fast * 1e3:>9.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: substring alias scan vs. compiled destination matcher.
+
+Run from the project root:
+    python benchmarks/bench_destination_matcher.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.destinations import get_registry
+from core.matcher import DestinationMatcher
+
+DESTINATIONS = get_registry().alias_locations
+
+QUERIES = [
+    "Is it a good time to go to Paris?",
+    "Should I visit Mumbai or New Delhi in spring?",
+    "Help me plan a relaxing trip to Rio de Janeiro with my family",
+    "Zurich vs Dubai vs Tokyo for a week in December",
+]
+
+
+def legacy_extract(query, destinations_map):
+    """The previous implementation: sort every call, substring-scan every alias."""
+    query_lower = query.lower()
+    found = []
+    for key in sorted(destinations_map.keys(), key=len, reverse=True):
+        if key in query_lower:
+            city, country, airport = destinations_map[key]
+            if not any(d[0] == city for d in found):
+                found.append((city, country, airport))
+    return found
+
+
+def alias_table(size):
+    """Real aliases padded with synthetic cities up to ``size`` entries."""
+    table = dict(DESTINATIONS)
+    i = 0
+    while len(table) < size:
+        table[f"testcity{i:05d} springs"] = (f"Testcity {i}", "Testland", f"T{i % 1000:03d}")
+        i += 1
+    return table
+
+
+def bench(size, number=200):
+    table = alias_table(size)
+    matcher = DestinationMatcher(table)
+
+    legacy = timeit.timeit(lambda: [legacy_extract(q, table) for q in QUERIES], number=number)
+    compiled = timeit.timeit(lambda: [matcher.find_unique(q, key=lambda d: d[0]) for q in QUERIES], number=number)
+
+    per_query = number * len(QUERIES)
+    return legacy / per_query * 1e6, compiled / per_query * 1e6
+
+
+def main():
+    print(f"{'aliases':>8} {'legacy us/query':>16} {'matcher us/query':>17} {'speedup':>8}")
+    for size in (len(DESTINATIONS), 500, 1000, 5000, 10000):
+        legacy_us, compiled_us = bench(size)
+        print(f"{size:>8} {legacy_us:>16.1f} {compiled_us:>17.1f} {legacy_us / compiled_us:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: nested-loop flight search vs. the vectorized fare grid,
+plus the pruned 2-D departure x return search.
+
+Run from the project root:
+    python benchmarks/bench_fare_grid.py
+"""
+
+import os
+import sys
+import timeit
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.destinations import get_registry
+from tools.fare_grid import flexible_search, paired_fare_grid
+
+
+def legacy_search(profile, dep_date, ret_date, flexibility_days):
+    """The previous implementation: build every option dict, sort, keep 10."""
+    options = []
+    base_prices = [profile.base_price_usd + i * 30 for i in range(7)]
+    for day_offset in range(-flexibility_days, flexibility_days + 1):
+        candidate_dep = dep_date + timedelta(days=day_offset)
+        candidate_ret = ret_date + timedelta(days=day_offset)
+        if candidate_dep >= date.today() and candidate_ret > candidate_dep:
+            day_of_week = candidate_dep.weekday()
+            price = base_prices[day_of_week] + (day_offset * 20) + (50 if day_of_week >= 5 else 0)
+            for variant in range(2):
+                is_red_eye = variant == 1
+                if is_red_eye:
+                    price *= 0.85
+                options.append({
+                    "departure_date": candidate_dep.isoformat(),
+                    "return_date": candidate_ret.isoformat(),
+                    "price_usd": price,
+                    "airline": profile.airlines[variant % len(profile.airlines)],
+                    "departure_time": "08:30" if not is_red_eye else "23:45",
+                    "return_time": "14:20",
+                    "is_red_eye": is_red_eye,
+                    "is_weekday": day_of_week < 5,
+                    "layovers": 0 if is_red_eye else 1,
+                    "total_duration_hours": profile.duration_hours if is_red_eye else profile.duration_with_layover_hours,
+                    "booking_code": f"FLT-{candidate_dep.isoformat()}-{variant}",
+                })
+    options.sort(key=lambda x: x["price_usd"])
+    return options[:10]
+
+
+def main(number=2000):
+    profile = get_registry().flight_profile("NRT")
+    dep = date.today() + timedelta(days=60)
+    ret = dep + timedelta(days=7)
+
+    print(f"{'flex days':>9} {'legacy us':>10} {'grid us':>8} {'speedup':>8}")
+    for flex in (3, 7, 14, 30):
+        legacy = timeit.timeit(lambda: legacy_search(profile, dep, ret, flex), number=number)
+        grid = timeit.timeit(lambda: paired_fare_grid(profile, dep, ret, flex).options(10), number=number)
+        print(f"{flex:>9} {legacy / number * 1e6:>10.1f} {grid / number * 1e6:>8.1f} {legacy / grid:>7.1f}x")
+
+    print()
+    print(f"{'flex days':>9} {'2-D grid us':>12} {'candidates':>11} {'evaluated':>10} {'pruned':>7}")
+    for flex in (3, 7, 14, 30):
+        result = flexible_search(profile, dep, ret, flex, flex, k=10)
+        elapsed = timeit.timeit(lambda: flexible_search(profile, dep, ret, flex, flex, k=10), number=number)
+        print(f"{flex:>9} {elapsed / number * 1e6:>12.1f} {result.candidates:>11} "
+              f"{result.evaluated:>10} {result.pruned:>7}")
+
+
+if __name__ == "__main__":
+    main()
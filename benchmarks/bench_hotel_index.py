@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: linear budget/brand filtering vs. building and querying the hotel index.
+
+Run from the project root:
+    python benchmarks/bench_hotel_index.py
+"""
+
+import os
+import random
+import sys
+import timeit
+from operator import itemgetter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.hotel_index import HotelIndex
+
+BRANDS = ["Marriott", "Hilton", "Hyatt", "Westin", "Four Seasons", "Budget Inn"]
+
+
+def catalog(size, seed=1):
+    rng = random.Random(seed)
+    return [
+        {
+            "brand": rng.choice(BRANDS),
+            "nightly_rate_usd": float(rng.randrange(60, 1200)),
+            "rating": round(rng.uniform(2.5, 5.0), 1),
+        }
+        for _ in range(size)
+    ]
+
+
+def linear(hotels, lo, hi, brands):
+    """The previous approach: scan for budget, then scan again for brands."""
+    affordable = [h for h in hotels if lo <= h["nightly_rate_usd"] <= hi]
+    return [h for h in affordable if h["brand"] in brands]
+
+
+def build(hotels):
+    return HotelIndex(hotels, itemgetter("nightly_rate_usd"), itemgetter("brand"), itemgetter("rating"))
+
+
+def main(number=200):
+    print(f"{'hotels':>7} {'linear us':>10} {'build+query us':>15} {'cached query us':>16} {'cached x':>8}")
+    for size in (6, 100, 1000, 10000):
+        hotels = catalog(size)
+        args = (150.0, 250.0, ["Marriott", "Hilton"])
+        scan = timeit.timeit(lambda: linear(hotels, *args), number=number)
+        # Indexing a fresh option list per request pays for the build every time
+        fresh = timeit.timeit(lambda: build(hotels).query(args[0], args[1], brands=args[2]), number=number)
+        # A cached catalog index (get_catalog_index) only pays for the query
+        index = build(hotels)
+        cached = timeit.timeit(lambda: index.query(args[0], args[1], brands=args[2]), number=number)
+        print(
+            f"{size:>7} {scan / number * 1e6:>10.1f} {fresh / number * 1e6:>15.1f} "
+            f"{cached / number * 1e6:>16.1f} {scan / cached:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-user scalar scoring vs. the profiles x candidates matrix.
+
+Run from the project root:
+    python benchmarks/bench_profile_matrix.py
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.analysis import score_flight_option, score_hotel_option, score_weather_period
+from core.batch import CandidateBatch, ProfileBatch, score_profiles
+from core.models import ComfortLevel, FlightOption, HotelOption, UserProfile, WeatherPeriod
+
+BRANDS = ["Marriott", "Hilton", "Hyatt", "Westin", "Four Seasons", "Budget Inn"]
+
+
+def random_candidates(count, seed=1):
+    rng = random.Random(seed)
+    today = date.today()
+    candidates = []
+    for i in range(count):
+        anomalous = rng.random() < 0.3
+        candidates.append((
+            WeatherPeriod(today, today + timedelta(days=7), rng.uniform(40, 100), 0.0, 0.0,
+                          rng.uniform(0, 4), rng.random() < 0.3, None, ""),
+            FlightOption(today, today + timedelta(days=7), rng.uniform(200, 1500), "United", "08:30", "14:20",
+                         rng.random() < 0.5, rng.random() < 0.7, rng.randrange(3), 8.0, f"FLT-{i}"),
+            HotelOption(today, today + timedelta(days=5), rng.uniform(60, 600), 0.0, rng.choice(BRANDS),
+                        f"Hotel {i}", round(rng.uniform(2.5, 5.0), 1), anomalous,
+                        "Storm discount" if anomalous else None, f"HTL-{i}"),
+        ))
+    return candidates
+
+
+def random_profiles(count, seed=1):
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        low, soft = rng.uniform(50, 80), rng.uniform(200, 1000)
+        profiles.append(UserProfile(
+            user_id=f"user-{i}", preferred_temp_range=(low, low + 15.0),
+            airfare_budget_soft=soft, airfare_budget_hard=soft + 300.0,
+            preferred_brands=rng.sample(BRANDS, rng.randrange(3)),
+            comfort_level=rng.choice(list(ComfortLevel)), safety_conscious=rng.random() < 0.5,
+        ))
+    return profiles
+
+
+def scalar_scores(candidates, profiles):
+    return [
+        [
+            score_weather_period(period, profile)[0] * 0.4
+            + score_flight_option(flight, profile)[0] * 0.3
+            + score_hotel_option(hotel, profile)[0] * 0.3
+            for period, flight, hotel in candidates
+        ]
+        for profile in profiles
+    ]
+
+
+def main():
+    candidates = random_candidates(500)
+    batch = CandidateBatch.from_candidates(candidates)
+    print(f"{'profiles':>9} {'candidates':>10} {'scalar ms':>10} {'matrix ms':>10} {'speedup':>8}")
+    for users in (200, 20000):
+        profiles = random_profiles(users)
+        profile_batch = ProfileBatch.from_profiles(profiles)
+        start = time.perf_counter()
+        score_profiles(batch, profile_batch)
+        fast = time.perf_counter() - start
+        # Scalar scoring of the big case takes minutes; time a slice and scale it
+        sample = profiles[:200]
+        start = time.perf_counter()
+        scalar_scores(candidates, sample)
+        slow = (time.perf_counter() - start) * users / len(sample)
+        print(f"{users:>9} {len(candidates):>10} {slow * 1e3:>10.0f} {fast * 1e3:>10.1f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Startup benchmark: cold import and first request of the API server.
+
+Each sample runs in a fresh interpreter. "eager agent" reproduces the old
+behaviour, where serving a request imported agent.coordinator and built the
+ADK agent; "lazy agent" is the current path through tools.engine.
+
+Run from the project root:
+    python benchmarks/bench_startup.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import time
+t0 = time.perf_counter()
+import api_server
+t1 = time.perf_counter()
+{prelude}
+api_server.get_travel_recommendation("Should I go to Maui?", "default")
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t0)
+"""
+
+MODES = {
+    "lazy agent": "",
+    "eager agent": "from agent.coordinator import root_agent",
+}
+
+
+def sample(prelude):
+    out = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(prelude=prelude)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.split()
+    return float(out[0]), float(out[1])
+
+
+def main(runs=5):
+    print(f"{'mode':>12} {'import ms':>10} {'first request ms':>17}")
+    for mode, prelude in MODES.items():
+        samples = [sample(prelude) for _ in range(runs)]
+        import_ms = statistics.median(s[0] for s in samples) * 1000
+        first_ms = statistics.median(s[1] for s in samples) * 1000
+        print(f"{mode:>12} {import_ms:>10.0f} {first_ms:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """Analysis logic for weather, flights, and hotels - pure business logic."""
 
 from datetime import date, timedelta
-from typing import List, Tuple, Optional
+from operator import attrgetter
+from typing import List, Tuple, Optional, Sequence, Union
 
 from .models import (
     UserProfile,
@@ -11,6 +12,107 @@ from .models import (
     HotelOption,
     TemperaturePreference,
 )
+from .hotel_index import HotelIndex
+from .intervals import IntervalIndex
+
+
+# Scoring records compact reason codes - (code, *values) tuples - and only
+# renders them to text when an explanation is actually shown.
+Reasons = Tuple[tuple, ...]
+
+REASON_TEMPLATES = {
+    "temp_match": "Temperature {:.0f}°F matches preference",
+    "temp_below": "Temperature {:.0f}°F is {:.0f}°F below preference",
+    "temp_above": "Temperature {:.0f}°F is {:.0f}°F above preference",
+    "storm_major": "Storm risk ({}) - major concern",
+    "storm_moderate": "Storm risk ({}) - moderate concern",
+    "high_precipitation": "High precipitation ({:.1f}\")",
+    "flight_price_ok": "Price within preferred budget",
+    "flight_price_over": "Price ${:.0f} exceeds preferred budget by ${:.0f}",
+    "weekday": "Weekday departure",
+    "red_eye": "Red-eye flight",
+    "layovers": "{} layover(s)",
+    "brand_match": "{} brand matches preference",
+    "hotel_price_ok": "Price within budget",
+    "hotel_price_over": "Price ${:.0f} exceeds mid-budget",
+    "anomalous_pricing": "Anomalous pricing: {}",
+    "below_luxury": "Rating below luxury expectation",
+    "above_budget": "Rating exceeds budget expectation",
+}
+
+
+def render_reasons(reasons: Reasons) -> str:
+    """Human-readable explanation for a tuple of reason codes."""
+    return "; ".join(REASON_TEMPLATES[code].format(*values) for code, *values in reasons)
+
+
+def weather_period_from_dict(data: dict) -> WeatherPeriod:
+    """
+    ``WeatherPeriod`` from a weather tool period dict (ISO dates).
+    
+    The tool reports only the average temperature, so the minimum and maximum
+    default to it, and precipitation defaults to none.
+    """
+    return WeatherPeriod(
+        start_date=date.fromisoformat(data["start_date"]),
+        end_date=date.fromisoformat(data["end_date"]),
+        avg_temp_f=data["avg_temp_f"],
+        min_temp_f=data.get("min_temp_f", data["avg_temp_f"]),
+        max_temp_f=data.get("max_temp_f", data["avg_temp_f"]),
+        precipitation_inches=data.get("precipitation_inches", 0.0),
+        storm_risk=data["storm_risk"],
+        storm_severity=data.get("storm_severity"),
+        conditions_summary=data.get("conditions_summary", ""),
+    )
+
+
+def score_weather_period(period: WeatherPeriod, profile: UserProfile) -> Tuple[float, Reasons]:
+    """
+    Score one weather period against user preferences.
+    
+    Returns: (score 0-1, reason codes)
+    """
+    score = 1.0
+    reasons = []
+    
+    # Temperature matching
+    avg_temp = period.avg_temp_f
+    min_pref, max_pref = profile.preferred_temp_range
+    
+    if min_pref <= avg_temp <= max_pref:
+        temp_score = 1.0
+        reasons.append(("temp_match", avg_temp))
+    elif avg_temp < min_pref:
+        temp_score = max(0.0, 1.0 - (min_pref - avg_temp) / 20.0)
+        reasons.append(("temp_below", avg_temp, min_pref - avg_temp))
+    else:
+        temp_score = max(0.0, 1.0 - (avg_temp - max_pref) / 20.0)
+        reasons.append(("temp_above", avg_temp, avg_temp - max_pref))
+    
+    score *= temp_score
+    
+    # Storm risk penalty
+    if period.storm_risk:
+        if profile.safety_conscious:
+            score *= 0.2  # Heavy penalty for safety-conscious users
+            reasons.append(("storm_major", period.storm_severity))
+        else:
+            score *= 0.6  # Moderate penalty
+            reasons.append(("storm_moderate", period.storm_severity))
+    
+    # Precipitation penalty
+    if period.precipitation_inches > 2.0:
+        score *= 0.7
+        reasons.append(("high_precipitation", period.precipitation_inches))
+    
+    return score, tuple(reasons)
+
+
+def analyze_weather_coded(
+    forecast: WeatherForecast, profile: UserProfile
+) -> List[Tuple[WeatherPeriod, float, Reasons]]:
+    """Like ``analyze_weather_for_user`` but with reason codes instead of text."""
+    return [(period, *score_weather_period(period, profile)) for period in forecast.forecast_periods]
 
 
 def analyze_weather_for_user(
@@ -22,45 +124,10 @@ def analyze_weather_for_user(
     Returns: List of (period, score, reasoning) tuples.
     Score is 0-1, where 1 is perfect match.
     """
-    results = []
-    
-    for period in forecast.forecast_periods:
-        score = 1.0
-        reasons = []
-        
-        # Temperature matching
-        avg_temp = period.avg_temp_f
-        min_pref, max_pref = profile.preferred_temp_range
-        
-        if min_pref <= avg_temp <= max_pref:
-            temp_score = 1.0
-            reasons.append(f"Temperature {avg_temp:.0f}°F matches preference")
-        elif avg_temp < min_pref:
-            temp_score = max(0.0, 1.0 - (min_pref - avg_temp) / 20.0)
-            reasons.append(f"Temperature {avg_temp:.0f}°F is {min_pref - avg_temp:.0f}°F below preference")
-        else:
-            temp_score = max(0.0, 1.0 - (avg_temp - max_pref) / 20.0)
-            reasons.append(f"Temperature {avg_temp:.0f}°F is {avg_temp - max_pref:.0f}°F above preference")
-        
-        score *= temp_score
-        
-        # Storm risk penalty
-        if period.storm_risk:
-            if profile.safety_conscious:
-                score *= 0.2  # Heavy penalty for safety-conscious users
-                reasons.append(f"Storm risk ({period.storm_severity}) - major concern")
-            else:
-                score *= 0.6  # Moderate penalty
-                reasons.append(f"Storm risk ({period.storm_severity}) - moderate concern")
-        
-        # Precipitation penalty
-        if period.precipitation_inches > 2.0:
-            score *= 0.7
-            reasons.append(f"High precipitation ({period.precipitation_inches:.1f}\")")
-        
-        results.append((period, score, "; ".join(reasons)))
-    
-    return results
+    return [
+        (period, score, render_reasons(reasons))
+        for period, score, reasons in analyze_weather_coded(forecast, profile)
+    ]
 
 
 def filter_flights_by_budget(
@@ -83,11 +150,11 @@ def filter_flights_by_budget(
     return affordable, rejected
 
 
-def score_flight_option(flight: FlightOption, profile: UserProfile) -> Tuple[float, str]:
+def score_flight_coded(flight: FlightOption, profile: UserProfile) -> Tuple[float, Reasons]:
     """
     Score a flight option based on user preferences.
     
-    Returns: (score 0-1, reasoning)
+    Returns: (score 0-1, reason codes)
     """
     score = 1.0
     reasons = []
@@ -95,41 +162,70 @@ def score_flight_option(flight: FlightOption, profile: UserProfile) -> Tuple[flo
     # Price scoring (within budget)
     if flight.price_usd <= profile.airfare_budget_soft:
         price_score = 1.0
-        reasons.append("Price within preferred budget")
+        reasons.append(("flight_price_ok",))
     else:
         # Linear penalty between soft and hard budget
         overage = flight.price_usd - profile.airfare_budget_soft
         max_overage = profile.airfare_budget_hard - profile.airfare_budget_soft
         price_score = max(0.5, 1.0 - (overage / max_overage) * 0.5)
-        reasons.append(f"Price ${flight.price_usd:.0f} exceeds preferred budget by ${overage:.0f}")
+        reasons.append(("flight_price_over", flight.price_usd, overage))
     
     score *= price_score
     
     # Schedule preferences
     if flight.is_weekday:
         score *= 1.1  # Slight bonus for weekday (usually cheaper)
-        reasons.append("Weekday departure")
+        reasons.append(("weekday",))
     
     if flight.is_red_eye:
         score *= 0.9  # Slight penalty for red-eye
-        reasons.append("Red-eye flight")
+        reasons.append(("red_eye",))
     
     # Layover penalty
     if flight.layovers > 0:
         score *= (1.0 - flight.layovers * 0.1)
-        reasons.append(f"{flight.layovers} layover(s)")
+        reasons.append(("layovers", flight.layovers))
+    
+    return min(1.0, score), tuple(reasons)
+
+
+def score_flight_option(flight: FlightOption, profile: UserProfile) -> Tuple[float, str]:
+    """
+    Score a flight option based on user preferences.
     
-    return min(1.0, score), "; ".join(reasons)
+    Returns: (score 0-1, reasoning)
+    """
+    score, reasons = score_flight_coded(flight, profile)
+    return score, render_reasons(reasons)
+
+
+def index_hotels(hotels: Sequence[HotelOption]) -> HotelIndex:
+    """Hotel index over options by nightly rate, brand and rating."""
+    return HotelIndex(
+        hotels,
+        rate=attrgetter("nightly_rate_usd"),
+        brand=attrgetter("brand"),
+        rating=attrgetter("rating"),
+    )
 
 
 def filter_hotels_by_budget(
-    hotels: List[HotelOption], profile: UserProfile
+    hotels: Union[List[HotelOption], HotelIndex], profile: UserProfile
 ) -> Tuple[List[HotelOption], List[HotelOption]]:
     """
     Separate hotels into affordable vs. over-budget.
     
+    ``hotels`` may be a ``HotelIndex`` built once (see ``index_hotels``) and
+    reused across profiles; the split is then two bisects and both lists come
+    back cheapest first. A plain list is scanned and keeps its order.
+    
     Returns: (affordable_hotels, rejected_hotels)
     """
+    if isinstance(hotels, HotelIndex):
+        return (
+            hotels.in_budget(profile.hotel_budget_min, profile.hotel_budget_max),
+            hotels.outside_budget(profile.hotel_budget_min, profile.hotel_budget_max),
+        )
     affordable = []
     rejected = []
     
@@ -142,11 +238,11 @@ def filter_hotels_by_budget(
     return affordable, rejected
 
 
-def score_hotel_option(hotel: HotelOption, profile: UserProfile) -> Tuple[float, str]:
+def score_hotel_coded(hotel: HotelOption, profile: UserProfile) -> Tuple[float, Reasons]:
     """
     Score a hotel option based on user preferences.
     
-    Returns: (score 0-1, reasoning)
+    Returns: (score 0-1, reason codes)
     """
     score = 1.0
     reasons = []
@@ -154,18 +250,18 @@ def score_hotel_option(hotel: HotelOption, profile: UserProfile) -> Tuple[float,
     # Brand loyalty bonus
     if hotel.brand in profile.preferred_brands:
         score *= 1.2
-        reasons.append(f"{hotel.brand} brand matches preference")
+        reasons.append(("brand_match", hotel.brand))
     
     # Price scoring (within budget range)
     budget_mid = (profile.hotel_budget_min + profile.hotel_budget_max) / 2
     if hotel.nightly_rate_usd <= budget_mid:
         price_score = 1.0
-        reasons.append("Price within budget")
+        reasons.append(("hotel_price_ok",))
     else:
         overage = hotel.nightly_rate_usd - budget_mid
         max_overage = profile.hotel_budget_max - budget_mid
         price_score = max(0.6, 1.0 - (overage / max_overage) * 0.4)
-        reasons.append(f"Price ${hotel.nightly_rate_usd:.0f} exceeds mid-budget")
+        reasons.append(("hotel_price_over", hotel.nightly_rate_usd))
     
     score *= price_score
     
@@ -173,30 +269,52 @@ def score_hotel_option(hotel: HotelOption, profile: UserProfile) -> Tuple[float,
     if hotel.is_anomalous_pricing:
         if "discount" in hotel.anomalous_reason.lower():
             score *= 1.1
-            reasons.append(f"Anomalous pricing: {hotel.anomalous_reason}")
         else:
             score *= 0.9
-            reasons.append(f"Anomalous pricing: {hotel.anomalous_reason}")
+        reasons.append(("anomalous_pricing", hotel.anomalous_reason))
     
     # Comfort level matching
     if profile.comfort_level.value == "luxury" and hotel.rating < 4.5:
         score *= 0.8
-        reasons.append("Rating below luxury expectation")
+        reasons.append(("below_luxury",))
     elif profile.comfort_level.value == "budget" and hotel.rating > 4.0:
         score *= 0.9  # Slight penalty for over-quality
-        reasons.append("Rating exceeds budget expectation")
+        reasons.append(("above_budget",))
+    
+    return min(1.0, score), tuple(reasons)
+
+
+def score_hotel_option(hotel: HotelOption, profile: UserProfile) -> Tuple[float, str]:
+    """
+    Score a hotel option based on user preferences.
     
-    return min(1.0, score), "; ".join(reasons)
+    Returns: (score 0-1, reasoning)
+    """
+    score, reasons = score_hotel_coded(hotel, profile)
+    return score, render_reasons(reasons)
+
+
+def index_weather_periods(weather_periods: Sequence[WeatherPeriod]) -> IntervalIndex:
+    """Interval index over weather periods by their start and end dates."""
+    return IntervalIndex(weather_periods, start=attrgetter("start_date"), end=attrgetter("end_date"))
+
+
+def index_scored_periods(entries: Sequence[tuple]) -> IntervalIndex:
+    """Interval index over (period, score, ...) entries by their period's dates."""
+    return IntervalIndex(entries, start=lambda e: e[0].start_date, end=lambda e: e[0].end_date)
 
 
 def find_overlapping_periods(
-    weather_periods: List[WeatherPeriod],
+    weather_periods: Union[Sequence[WeatherPeriod], IntervalIndex],
     flight_dates: Tuple[date, date],
     hotel_dates: Tuple[date, date],
 ) -> Optional[Tuple[date, date]]:
     """
     Find overlapping date range for weather, flight, and hotel availability.
     
+    ``weather_periods`` may be an ``IntervalIndex`` built once per forecast,
+    which turns the coverage check into a bisect instead of a scan.
+    
     Returns: (start_date, end_date) if overlap exists, None otherwise
     """
     flight_start, flight_end = flight_dates
@@ -210,6 +328,8 @@ def find_overlapping_periods(
         return None
     
     # Check if any weather period covers this overlap
+    if isinstance(weather_periods, IntervalIndex):
+        return (overlap_start, overlap_end) if weather_periods.covers(overlap_start, overlap_end) else None
     for period in weather_periods:
         if period.start_date <= overlap_start and overlap_end <= period.end_date:
             return (overlap_start, overlap_end)
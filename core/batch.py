@@ -0,0 +1,347 @@
+"""Columnar flight and hotel batches with vectorized scoring.
+
+``score_flight_option`` and ``score_hotel_option`` in ``core.analysis`` are the
+reference implementations; the batch scorers apply the same multipliers in
+the same order with NumPy, so every score is bit-for-bit identical to the
+scalar result while a whole deal scan is scored in a few array operations.
+
+``ProfileBatch`` does the same for the other axis: many users' preferences as
+columns. The ``*_matrix`` scorers broadcast profiles against candidates into
+a (profiles x candidates) score matrix, which is how a campaign scores one
+destination's trips against tens of thousands of users.
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Iterator, Sequence, Tuple
+
+import numpy as np
+
+from .models import ComfortLevel, FlightOption, HotelOption, UserProfile, WeatherPeriod
+
+# Anomalous-pricing codes stored per hotel instead of the reason text
+ANOMALY_NONE = 0
+ANOMALY_DISCOUNT = 1
+ANOMALY_OTHER = 2
+
+
+# Comfort levels stored per profile; only budget and luxury change hotel scores
+COMFORT_CODES = {level: code for code, level in enumerate(ComfortLevel)}
+COMFORT_BUDGET = COMFORT_CODES[ComfortLevel.BUDGET]
+COMFORT_LUXURY = COMFORT_CODES[ComfortLevel.LUXURY]
+
+MATRIX_CHUNK_CELLS = 1 << 20  # Scores computed per chunk of a profile x candidate matrix
+
+
+def _column(values, dtype) -> np.ndarray:
+    return np.ascontiguousarray(np.asarray(values, dtype=dtype))
+
+
+@dataclass(frozen=True)
+class FlightBatch:
+    """Scoring columns for many flight options; row ``i`` is one itinerary."""
+    price_usd: np.ndarray
+    layovers: np.ndarray
+    is_weekday: np.ndarray
+    is_red_eye: np.ndarray
+
+    def __post_init__(self):
+        object.__setattr__(self, "price_usd", _column(self.price_usd, np.float64))
+        object.__setattr__(self, "layovers", _column(self.layovers, np.int64))
+        object.__setattr__(self, "is_weekday", _column(self.is_weekday, bool))
+        object.__setattr__(self, "is_red_eye", _column(self.is_red_eye, bool))
+        if not (len(self.price_usd) == len(self.layovers) == len(self.is_weekday) == len(self.is_red_eye)):
+            raise ValueError("FlightBatch columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.price_usd)
+
+    @classmethod
+    def from_options(cls, flights: Sequence[FlightOption]) -> "FlightBatch":
+        """Columns for a list of ``FlightOption`` dataclasses, in order."""
+        return cls(
+            price_usd=[f.price_usd for f in flights],
+            layovers=[f.layovers for f in flights],
+            is_weekday=[f.is_weekday for f in flights],
+            is_red_eye=[f.is_red_eye for f in flights],
+        )
+
+
+@dataclass(frozen=True)
+class HotelBatch:
+    """
+    Scoring columns for many hotel options; row ``i`` is one stay.
+
+    Brands are stored as integer codes into ``brands`` and anomalous pricing
+    as one of the ``ANOMALY_*`` codes, so no strings are touched while scoring.
+    """
+    nightly_rate_usd: np.ndarray
+    rating: np.ndarray
+    brand_codes: np.ndarray
+    brands: Tuple[str, ...]
+    anomaly: np.ndarray
+
+    def __post_init__(self):
+        object.__setattr__(self, "nightly_rate_usd", _column(self.nightly_rate_usd, np.float64))
+        object.__setattr__(self, "rating", _column(self.rating, np.float64))
+        object.__setattr__(self, "brand_codes", _column(self.brand_codes, np.int64))
+        object.__setattr__(self, "brands", tuple(self.brands))
+        object.__setattr__(self, "anomaly", _column(self.anomaly, np.int8))
+        if not (len(self.nightly_rate_usd) == len(self.rating) == len(self.brand_codes) == len(self.anomaly)):
+            raise ValueError("HotelBatch columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.nightly_rate_usd)
+
+    @classmethod
+    def from_options(cls, hotels: Sequence[HotelOption]) -> "HotelBatch":
+        """Columns for a list of ``HotelOption`` dataclasses, in order."""
+        codes = {}
+        for hotel in hotels:
+            codes.setdefault(hotel.brand, len(codes))
+        return cls(
+            nightly_rate_usd=[h.nightly_rate_usd for h in hotels],
+            rating=[h.rating for h in hotels],
+            brand_codes=[codes[h.brand] for h in hotels],
+            brands=tuple(codes),
+            anomaly=[anomaly_code(h) for h in hotels],
+        )
+
+    def brand_mask(self, brands: Sequence[str]) -> np.ndarray:
+        """Boolean column: the hotel's brand is one of ``brands``."""
+        wanted = [code for code, name in enumerate(self.brands) if name in brands]
+        return np.isin(self.brand_codes, wanted)
+
+
+def anomaly_code(hotel: HotelOption) -> int:
+    """``ANOMALY_*`` code for a hotel's pricing, as ``score_hotel_option`` classifies it."""
+    if not hotel.is_anomalous_pricing:
+        return ANOMALY_NONE
+    if "discount" in hotel.anomalous_reason.lower():
+        return ANOMALY_DISCOUNT
+    return ANOMALY_OTHER
+
+
+@dataclass(frozen=True)
+class WeatherBatch:
+    """Scoring columns for many weather periods; row ``i`` is one period."""
+    avg_temp_f: np.ndarray
+    storm_risk: np.ndarray
+    precipitation_inches: np.ndarray
+
+    def __post_init__(self):
+        object.__setattr__(self, "avg_temp_f", _column(self.avg_temp_f, np.float64))
+        object.__setattr__(self, "storm_risk", _column(self.storm_risk, bool))
+        object.__setattr__(self, "precipitation_inches", _column(self.precipitation_inches, np.float64))
+        if not (len(self.avg_temp_f) == len(self.storm_risk) == len(self.precipitation_inches)):
+            raise ValueError("WeatherBatch columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.avg_temp_f)
+
+    @classmethod
+    def from_periods(cls, periods: Sequence[WeatherPeriod]) -> "WeatherBatch":
+        """Columns for a list of ``WeatherPeriod`` dataclasses, in order."""
+        return cls(
+            avg_temp_f=[p.avg_temp_f for p in periods],
+            storm_risk=[p.storm_risk for p in periods],
+            precipitation_inches=[p.precipitation_inches for p in periods],
+        )
+
+
+@dataclass(frozen=True)
+class CandidateBatch:
+    """
+    Trip candidates: row ``i`` combines weather row ``i``, flight row ``i`` and hotel row ``i``.
+
+    Scored with the same weights as ``core.scoring`` ranks combinations.
+    """
+    weather: WeatherBatch
+    flights: FlightBatch
+    hotels: HotelBatch
+
+    def __post_init__(self):
+        if not (len(self.weather) == len(self.flights) == len(self.hotels)):
+            raise ValueError("CandidateBatch components must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.flights)
+
+    @classmethod
+    def from_candidates(
+        cls, candidates: Sequence[Tuple[WeatherPeriod, FlightOption, HotelOption]]
+    ) -> "CandidateBatch":
+        """Columns for (period, flight, hotel) triples, in order."""
+        return cls(
+            weather=WeatherBatch.from_periods([c[0] for c in candidates]),
+            flights=FlightBatch.from_options([c[1] for c in candidates]),
+            hotels=HotelBatch.from_options([c[2] for c in candidates]),
+        )
+
+
+@dataclass(frozen=True)
+class ProfileBatch:
+    """
+    Preference columns for many users; row ``i`` is one ``UserProfile``.
+
+    Comfort levels are stored as ``COMFORT_CODES`` and preferred brands as one
+    frozenset per profile, matched against a hotel batch's brand table once
+    per scoring call.
+    """
+    airfare_budget_soft: np.ndarray
+    airfare_budget_hard: np.ndarray
+    hotel_budget_min: np.ndarray
+    hotel_budget_max: np.ndarray
+    temp_min: np.ndarray
+    temp_max: np.ndarray
+    safety_conscious: np.ndarray
+    comfort: np.ndarray
+    preferred_brands: Tuple[FrozenSet[str], ...]
+
+    def __post_init__(self):
+        for name in ("airfare_budget_soft", "airfare_budget_hard", "hotel_budget_min",
+                     "hotel_budget_max", "temp_min", "temp_max"):
+            object.__setattr__(self, name, _column(getattr(self, name), np.float64))
+        object.__setattr__(self, "safety_conscious", _column(self.safety_conscious, bool))
+        object.__setattr__(self, "comfort", _column(self.comfort, np.int8))
+        object.__setattr__(self, "preferred_brands", tuple(frozenset(b) for b in self.preferred_brands))
+        lengths = {len(getattr(self, name)) for name in self.__dataclass_fields__}
+        if len(lengths) > 1:
+            raise ValueError("ProfileBatch columns must have the same length")
+
+    def __len__(self) -> int:
+        return len(self.airfare_budget_soft)
+
+    def __getitem__(self, rows: slice) -> "ProfileBatch":
+        """Contiguous slice of profiles."""
+        return ProfileBatch(
+            **{name: getattr(self, name)[rows] for name in self.__dataclass_fields__}
+        )
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[UserProfile]) -> "ProfileBatch":
+        """Columns for a list of ``UserProfile`` dataclasses, in order."""
+        return cls(
+            airfare_budget_soft=[p.airfare_budget_soft for p in profiles],
+            airfare_budget_hard=[p.airfare_budget_hard for p in profiles],
+            hotel_budget_min=[p.hotel_budget_min for p in profiles],
+            hotel_budget_max=[p.hotel_budget_max for p in profiles],
+            temp_min=[p.preferred_temp_range[0] for p in profiles],
+            temp_max=[p.preferred_temp_range[1] for p in profiles],
+            safety_conscious=[p.safety_conscious for p in profiles],
+            comfort=[COMFORT_CODES[p.comfort_level] for p in profiles],
+            preferred_brands=[p.preferred_brands for p in profiles],
+        )
+
+    def brand_matrix(self, brands: Sequence[str]) -> np.ndarray:
+        """(profiles x brands) boolean matrix: the brand is one of the profile's preferred brands."""
+        rows = {}
+        for preferred in self.preferred_brands:
+            if preferred not in rows:
+                rows[preferred] = [brand in preferred for brand in brands]
+        matrix = [rows[preferred] for preferred in self.preferred_brands]
+        return np.array(matrix, dtype=bool).reshape(len(self), len(brands))
+
+
+def score_weather_matrix(batch: WeatherBatch, profiles: ProfileBatch) -> np.ndarray:
+    """(profiles x periods) scores equal to ``score_weather_period``."""
+    temp = batch.avg_temp_f[None, :]
+    low = profiles.temp_min[:, None]
+    high = profiles.temp_max[:, None]
+    temp_score = np.where(
+        temp < low,
+        np.maximum(0.0, 1.0 - (low - temp) / 20.0),
+        np.where(temp > high, np.maximum(0.0, 1.0 - (temp - high) / 20.0), 1.0),
+    )
+    storm_penalty = np.where(profiles.safety_conscious, 0.2, 0.6)[:, None]
+    score = temp_score * np.where(batch.storm_risk[None, :], storm_penalty, 1.0)
+    score = score * np.where(batch.precipitation_inches > 2.0, 0.7, 1.0)[None, :]
+    return score
+
+
+def score_flights_matrix(batch: FlightBatch, profiles: ProfileBatch) -> np.ndarray:
+    """(profiles x flights) scores equal to ``score_flight_option``."""
+    price = batch.price_usd[None, :]
+    soft = profiles.airfare_budget_soft[:, None]
+    overage = price - soft
+    max_overage = (profiles.airfare_budget_hard - profiles.airfare_budget_soft)[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        over_score = np.maximum(0.5, 1.0 - (overage / max_overage) * 0.5)
+    score = np.where(price <= soft, 1.0, over_score)
+
+    score = score * np.where(batch.is_weekday, 1.1, 1.0)
+    score = score * np.where(batch.is_red_eye, 0.9, 1.0)
+    score = score * np.where(batch.layovers > 0, 1.0 - batch.layovers * 0.1, 1.0)
+    return np.minimum(1.0, score)
+
+
+def score_hotels_matrix(batch: HotelBatch, profiles: ProfileBatch) -> np.ndarray:
+    """(profiles x hotels) scores equal to ``score_hotel_option``."""
+    preferred = profiles.brand_matrix(batch.brands)[:, batch.brand_codes]
+    score = np.where(preferred, 1.2, 1.0)
+
+    rate = batch.nightly_rate_usd[None, :]
+    budget_mid = ((profiles.hotel_budget_min + profiles.hotel_budget_max) / 2)[:, None]
+    overage = rate - budget_mid
+    max_overage = profiles.hotel_budget_max[:, None] - budget_mid
+    with np.errstate(divide="ignore", invalid="ignore"):
+        over_score = np.maximum(0.6, 1.0 - (overage / max_overage) * 0.4)
+    score = score * np.where(rate <= budget_mid, 1.0, over_score)
+
+    score = score * np.select(
+        [batch.anomaly == ANOMALY_DISCOUNT, batch.anomaly == ANOMALY_OTHER], [1.1, 0.9], 1.0
+    )
+
+    comfort = profiles.comfort[:, None]
+    score = score * np.where(
+        comfort == COMFORT_LUXURY,
+        np.where(batch.rating < 4.5, 0.8, 1.0),
+        np.where(comfort == COMFORT_BUDGET, np.where(batch.rating > 4.0, 0.9, 1.0), 1.0),
+    )
+    return np.minimum(1.0, score)
+
+
+def score_candidates_matrix(batch: CandidateBatch, profiles: ProfileBatch) -> np.ndarray:
+    """(profiles x candidates) combined scores, as ``core.scoring`` weighs a combination."""
+    return (
+        score_weather_matrix(batch.weather, profiles) * 0.4
+        + score_flights_matrix(batch.flights, profiles) * 0.3
+        + score_hotels_matrix(batch.hotels, profiles) * 0.3
+    )
+
+
+def iter_score_chunks(
+    batch: CandidateBatch, profiles: ProfileBatch, chunk_cells: int = MATRIX_CHUNK_CELLS
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Combined scores a block of profiles at a time.
+
+    Yields ``(rows, scores)`` where ``scores`` is the (profiles x candidates)
+    block for ``profiles[rows]``. Each block holds about ``chunk_cells``
+    scores, so intermediates stay bounded however many profiles there are;
+    callers that only need e.g. the best candidate per user never hold the
+    whole matrix.
+    """
+    rows_per_chunk = max(1, chunk_cells // max(1, len(batch)))
+    for start in range(0, len(profiles), rows_per_chunk):
+        rows = slice(start, min(start + rows_per_chunk, len(profiles)))
+        yield rows, score_candidates_matrix(batch, profiles[rows])
+
+
+def score_profiles(
+    batch: CandidateBatch, profiles: ProfileBatch, chunk_cells: int = MATRIX_CHUNK_CELLS
+) -> np.ndarray:
+    """The full (profiles x candidates) combined score matrix, computed in bounded chunks."""
+    scores = np.empty((len(profiles), len(batch)), dtype=np.float64)
+    for rows, block in iter_score_chunks(batch, profiles, chunk_cells):
+        scores[rows] = block
+    return scores
+
+
+def score_flights_batch(batch: FlightBatch, profile: UserProfile) -> np.ndarray:
+    """Scores equal to ``score_flight_option`` for every row of ``batch``."""
+    return score_flights_matrix(batch, ProfileBatch.from_profiles([profile]))[0]
+
+
+def score_hotels_batch(batch: HotelBatch, profile: UserProfile) -> np.ndarray:
+    """Scores equal to ``score_hotel_option`` for every row of ``batch``."""
+    return score_hotels_matrix(batch, ProfileBatch.from_profiles([profile]))[0]
@@ -0,0 +1,173 @@
+"""Destination registry loaded once from a data file - pure Python, no external frameworks."""
+
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Optional, Tuple
+
+DEFAULT_DATA_FILE = Path(__file__).parent / "data" / "destinations.json"
+
+
+def name_key(name: str) -> str:
+    """Lookup key for a city, alias or country name: trimmed and lower-cased."""
+    return name.strip().lower()
+
+
+@dataclass(frozen=True)
+class WeatherProfile:
+    """Climate parameters used by the mock weather forecast."""
+    base_temp_f: float
+    temp_variation_f: float
+    storm_week: Optional[int]  # Day offset of the stormy week, if any
+    climate: str  # e.g., "tropical", "temperate", "alpine"
+
+
+@dataclass(frozen=True)
+class FlightProfile:
+    """Route parameters used by the mock flight search (from SFO)."""
+    duration_hours: float
+    duration_with_layover_hours: float
+    airlines: Tuple[str, ...]
+    base_price_usd: float
+
+
+@dataclass(frozen=True)
+class Destination:
+    """A destination city with its lookup aliases and tool profiles."""
+    city: str
+    country: str
+    airport_code: str
+    aliases: Tuple[str, ...]
+    weather: Optional[WeatherProfile] = None
+    flight: Optional[FlightProfile] = None
+
+    @property
+    def location(self) -> Tuple[str, str, str]:
+        """(city, country, airport_code) tuple used by the API server."""
+        return (self.city, self.country, self.airport_code)
+
+
+class DestinationRegistry:
+    """
+    Immutable set of destinations with prebuilt lookup indexes.
+
+    Indexes cover aliases, canonical city names (case-insensitive), IATA
+    airport codes and countries, so every lookup is a single dict access
+    regardless of how many destinations are registered.
+    """
+
+    def __init__(
+        self,
+        destinations: Iterable[Destination],
+        default_weather: WeatherProfile,
+        default_flight: FlightProfile,
+    ):
+        self._destinations = tuple(destinations)
+        self.default_weather = default_weather
+        self.default_flight = default_flight
+
+        aliases = {}
+        cities = {}
+        airports = {}
+        countries = {}
+        for dest in self._destinations:
+            for alias in dest.aliases:
+                aliases[name_key(alias)] = dest
+            cities[name_key(dest.city)] = dest
+            airports[dest.airport_code.upper()] = dest
+            countries.setdefault(name_key(dest.country), []).append(dest)
+
+        self.aliases: Mapping[str, Destination] = MappingProxyType(aliases)
+        self.cities: Mapping[str, Destination] = MappingProxyType(cities)
+        self.airports: Mapping[str, Destination] = MappingProxyType(airports)
+        self.countries: Mapping[str, Tuple[Destination, ...]] = MappingProxyType(
+            {country: tuple(dests) for country, dests in countries.items()}
+        )
+        self.alias_locations: Mapping[str, Tuple[str, str, str]] = MappingProxyType(
+            {alias: dest.location for alias, dest in aliases.items()}
+        )
+
+    def __iter__(self) -> Iterator[Destination]:
+        return iter(self._destinations)
+
+    def __len__(self) -> int:
+        return len(self._destinations)
+
+    def by_alias(self, alias: str) -> Optional[Destination]:
+        """Look up a destination by any of its aliases."""
+        return self.aliases.get(name_key(alias))
+
+    def by_city(self, city: str) -> Optional[Destination]:
+        """Look up a destination by its canonical city name."""
+        return self.cities.get(name_key(city))
+
+    def by_airport(self, airport_code: str) -> Optional[Destination]:
+        """Look up a destination by IATA airport code."""
+        return self.airports.get(airport_code.upper())
+
+    def in_country(self, country: str) -> Tuple[Destination, ...]:
+        """Return every destination in a country."""
+        return self.countries.get(name_key(country), ())
+
+    def weather_profile(self, city: str) -> WeatherProfile:
+        """Weather profile for a city, falling back to a moderate default."""
+        dest = self.by_city(city)
+        if dest is None or dest.weather is None:
+            return self.default_weather
+        return dest.weather
+
+    def flight_profile(self, airport_code: str) -> FlightProfile:
+        """Flight profile for an airport, falling back to a medium-haul default."""
+        dest = self.by_airport(airport_code)
+        if dest is None or dest.flight is None:
+            return self.default_flight
+        return dest.flight
+
+
+def _weather_from_dict(data: dict) -> WeatherProfile:
+    return WeatherProfile(
+        base_temp_f=float(data["base_temp_f"]),
+        temp_variation_f=float(data["temp_variation_f"]),
+        storm_week=data.get("storm_week"),
+        climate=data["climate"],
+    )
+
+
+def _flight_from_dict(data: dict) -> FlightProfile:
+    return FlightProfile(
+        duration_hours=float(data["duration_hours"]),
+        duration_with_layover_hours=float(data["duration_with_layover_hours"]),
+        airlines=tuple(data["airlines"]),
+        base_price_usd=data["base_price_usd"],
+    )
+
+
+def load_registry(path: Optional[Path] = None) -> DestinationRegistry:
+    """Load a destination registry from a JSON data file."""
+    with open(path or DEFAULT_DATA_FILE, encoding="utf-8") as f:
+        data = json.load(f)
+
+    destinations = [
+        Destination(
+            city=entry["city"],
+            country=entry["country"],
+            airport_code=entry["airport"],
+            aliases=tuple(entry.get("aliases") or [entry["city"].lower()]),
+            weather=_weather_from_dict(entry["weather"]) if entry.get("weather") else None,
+            flight=_flight_from_dict(entry["flight"]) if entry.get("flight") else None,
+        )
+        for entry in data["destinations"]
+    ]
+    return DestinationRegistry(
+        destinations,
+        default_weather=_weather_from_dict(data["default_weather"]),
+        default_flight=_flight_from_dict(data["default_flight"]),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> DestinationRegistry:
+    """Return the process-wide registry, loading the bundled data file on first use."""
+    return load_registry()
@@ -0,0 +1,169 @@
+"""Group-trip planning across several user profiles."""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from .analysis import find_overlapping_periods, index_weather_periods
+from .batch import CandidateBatch, ProfileBatch, score_profiles
+from .intervals import IntervalIndex
+from .models import FlightOption, HotelOption, UserProfile, WeatherForecast, WeatherPeriod
+from .scoring import stays_overlapping
+
+Window = Tuple[date, date]  # Closed range of acceptable departure dates
+
+GROUP_OBJECTIVES = ("min", "sum")
+
+
+@dataclass(frozen=True)
+class GroupMember:
+    """A traveller and the departure dates they can make, as sorted closed windows."""
+    profile: UserProfile
+    available: Tuple[Window, ...]
+
+    @classmethod
+    def flexible(cls, profile: UserProfile, preferred_start: date) -> "GroupMember":
+        """Member who can leave up to ``profile.flexibility_days`` either side of ``preferred_start``."""
+        slack = timedelta(days=profile.flexibility_days)
+        return cls(profile, ((preferred_start - slack, preferred_start + slack),))
+
+
+@dataclass(frozen=True)
+class DestinationOptions:
+    """Everything the tools returned for one destination."""
+    destination: str
+    forecast: WeatherForecast
+    flights: Sequence[FlightOption]
+    hotels: Sequence[HotelOption]
+
+
+@dataclass(frozen=True)
+class GroupPlan:
+    """One destination, dates, flight and hotel for the whole group."""
+    destination: str
+    start: date
+    end: date
+    flight: FlightOption
+    hotel: HotelOption
+    weather: WeatherPeriod
+    member_scores: Dict[str, float]  # user_id -> combined score
+    score: float  # Objective value: the lowest or the summed member score
+
+
+def merge_windows(windows: Sequence[Window]) -> List[Window]:
+    """Sort windows and merge any that overlap or touch; empty windows are dropped."""
+    merged: List[Window] = []
+    for lo, hi in sorted(w for w in windows if w[0] <= w[1]):
+        if merged and lo <= merged[-1][1] + timedelta(days=1):
+            if hi > merged[-1][1]:
+                merged[-1] = (merged[-1][0], hi)
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def intersect_windows(a: Sequence[Window], b: Sequence[Window]) -> List[Window]:
+    """Intersection of two sorted, disjoint window lists in one two-pointer pass."""
+    result: List[Window] = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        lo = max(a[i][0], b[j][0])
+        hi = min(a[i][1], b[j][1])
+        if lo <= hi:
+            result.append((lo, hi))
+        # The window that ends first cannot meet anything further along the other list
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def common_windows(members: Sequence[GroupMember]) -> List[Window]:
+    """Departure windows every member can make."""
+    if not members:
+        return []
+    shared = merge_windows(members[0].available)
+    for member in members[1:]:
+        if not shared:
+            break
+        shared = intersect_windows(shared, merge_windows(member.available))
+    return shared
+
+
+def plan_group_trip(
+    members: Sequence[GroupMember],
+    destinations: Sequence[DestinationOptions],
+    objective: str = "min",
+    k: int = 3,
+) -> List[GroupPlan]:
+    """
+    Best ``k`` group trips across all destinations.
+
+    A flight qualifies when it departs inside every member's availability and
+    fits every member's hard airfare budget; a hotel when its nightly rate is
+    within every member's hotel budget range, as ``filter_hotels_by_budget``
+    requires for one user. Each qualifying flight is paired only with
+    the qualifying hotels whose stay overlaps its dates, and with weather,
+    exactly as ``core.scoring`` does; then every member scores every pair in
+    one profile x candidate matrix. ``objective`` is ``"min"`` (the least
+    happy member counts) or ``"sum"`` (total satisfaction).
+
+    Returns: plans sorted by objective value, best first (ties keep input order)
+    """
+    if objective not in GROUP_OBJECTIVES:
+        raise ValueError(f"objective must be one of {GROUP_OBJECTIVES}, got {objective!r}")
+    shared = common_windows(members)
+    if not shared:
+        return []
+    departures = IntervalIndex(shared, start=lambda w: w[0], end=lambda w: w[1])
+    profiles = [member.profile for member in members]
+    airfare_cap = min(p.airfare_budget_hard for p in profiles)
+    nightly_floor = max(p.hotel_budget_min for p in profiles)
+    nightly_cap = min(p.hotel_budget_max for p in profiles)
+
+    candidates: List[Tuple[str, date, date, WeatherPeriod, FlightOption, HotelOption]] = []
+    for options in destinations:
+        periods = index_weather_periods(options.forecast.forecast_periods)
+        flights = [
+            f for f in options.flights
+            if f.price_usd <= airfare_cap and departures.stab(f.departure_date) is not None
+        ]
+        hotels = [h for h in options.hotels if nightly_floor <= h.nightly_rate_usd <= nightly_cap]
+        overlapping = stays_overlapping(hotels)
+        for flight in flights:
+            for j in overlapping(flight.departure_date, flight.return_date):
+                hotel = hotels[j]
+                overlap = find_overlapping_periods(
+                    periods,
+                    (flight.departure_date, flight.return_date),
+                    (hotel.check_in_date, hotel.check_out_date),
+                )
+                if overlap:
+                    # Weather period the trip starts in
+                    weather = periods.stab(overlap[0])
+                    candidates.append((options.destination, *overlap, weather, flight, hotel))
+    if not candidates:
+        return []
+
+    scores = score_profiles(
+        CandidateBatch.from_candidates([c[3:] for c in candidates]),
+        ProfileBatch.from_profiles(profiles),
+    )
+    values = scores.min(axis=0) if objective == "min" else scores.sum(axis=0)
+    order = np.argsort(-values, kind="stable")[:k]
+    return [
+        GroupPlan(
+            destination=candidates[c][0],
+            start=candidates[c][1],
+            end=candidates[c][2],
+            weather=candidates[c][3],
+            flight=candidates[c][4],
+            hotel=candidates[c][5],
+            member_scores={p.user_id: float(s) for p, s in zip(profiles, scores[:, c])},
+            score=float(values[c]),
+        )
+        for c in order.tolist()
+    ]
@@ -0,0 +1,163 @@
+"""Budget, brand and rating index over hotel records - pure Python, no external frameworks."""
+
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Positions of the set bits of ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class HotelIndex(Generic[T]):
+    """
+    Immutable index over hotels sorted by nightly rate.
+
+    Records are stored in rate order, so a budget range is two bisects and a
+    slice. Each brand has a bitmap over those rate-ordered positions, and a
+    rating-sorted secondary index keeps one cumulative bitmap per distinct
+    rating ("rated at least r"). Budget, brand and rating filters combine as
+    bitwise ANDs, and only matching records are touched: O(log n + k) for
+    k results, whether a city has six properties or thousands.
+
+    Key functions extract the rate, brand and rating, so the index works for
+    ``HotelOption`` dataclasses, option dicts or catalog entries alike.
+    """
+
+    def __init__(
+        self,
+        hotels: Iterable[T],
+        rate: Callable[[T], float],
+        brand: Callable[[T], str],
+        rating: Callable[[T], float],
+    ):
+        hotels = list(hotels)
+        # Stable: equal rates keep their input order
+        order = sorted(range(len(hotels)), key=lambda i: rate(hotels[i]))
+        self._hotels: List[T] = [hotels[i] for i in order]
+        self._rates: List[float] = [rate(h) for h in self._hotels]
+
+        brand_bits: Dict[str, int] = {}
+        for position, hotel in enumerate(self._hotels):
+            brand_bits[brand(hotel)] = brand_bits.get(brand(hotel), 0) | (1 << position)
+        self._brand_bits = brand_bits
+
+        # Secondary index: positions by rating (best first, cheapest first on ties)
+        self._by_rating: List[int] = sorted(
+            range(len(self._hotels)), key=lambda p: (-rating(self._hotels[p]), p)
+        )
+        # Ascending negated ratings for bisect, and "rated >= r" bitmaps per distinct rating
+        self._neg_ratings: List[float] = []
+        self._rating_masks: List[int] = []
+        mask = 0
+        for p in self._by_rating:
+            neg = -rating(self._hotels[p])
+            mask |= 1 << p
+            if self._neg_ratings and self._neg_ratings[-1] == neg:
+                self._rating_masks[-1] = mask
+            else:
+                self._neg_ratings.append(neg)
+                self._rating_masks.append(mask)
+
+    def __len__(self) -> int:
+        return len(self._hotels)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._hotels)
+
+    @property
+    def brands(self) -> Tuple[str, ...]:
+        """Every brand in the index."""
+        return tuple(self._brand_bits)
+
+    def _range(self, min_rate: Optional[float], max_rate: Optional[float]) -> Tuple[int, int]:
+        lo = 0 if min_rate is None else bisect_left(self._rates, min_rate)
+        hi = len(self._rates) if max_rate is None else bisect_right(self._rates, max_rate)
+        return lo, max(lo, hi)
+
+    def in_budget(self, min_rate: Optional[float] = None, max_rate: Optional[float] = None) -> List[T]:
+        """Hotels with ``min_rate <= rate <= max_rate``, cheapest first."""
+        lo, hi = self._range(min_rate, max_rate)
+        return self._hotels[lo:hi]
+
+    def outside_budget(self, min_rate: Optional[float] = None, max_rate: Optional[float] = None) -> List[T]:
+        """Hotels below ``min_rate`` or above ``max_rate``, cheapest first."""
+        lo, hi = self._range(min_rate, max_rate)
+        return self._hotels[:lo] + self._hotels[hi:]
+
+    def count_in_budget(self, min_rate: Optional[float] = None, max_rate: Optional[float] = None) -> int:
+        """Number of hotels in the rate range, in O(log n)."""
+        lo, hi = self._range(min_rate, max_rate)
+        return hi - lo
+
+    def brand_mask(self, brands: Sequence[str]) -> int:
+        """Bitmap of rate-ordered positions belonging to any of ``brands``."""
+        mask = 0
+        for name in brands:
+            mask |= self._brand_bits.get(name, 0)
+        return mask
+
+    def _mask(
+        self,
+        min_rate: Optional[float],
+        max_rate: Optional[float],
+        brands: Optional[Sequence[str]],
+        min_rating: Optional[float],
+    ) -> int:
+        lo, hi = self._range(min_rate, max_rate)
+        mask = ((1 << hi) - 1) ^ ((1 << lo) - 1)
+        if brands is not None:
+            mask &= self.brand_mask(brands)
+        if min_rating is not None:
+            level = bisect_right(self._neg_ratings, -min_rating) - 1
+            mask &= self._rating_masks[level] if level >= 0 else 0
+        return mask
+
+    def query(
+        self,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        brands: Optional[Sequence[str]] = None,
+        min_rating: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[T]:
+        """Hotels matching every given filter, cheapest first, at most ``limit``."""
+        results = []
+        if limit is not None and limit <= 0:
+            return results
+        for position in _iter_bits(self._mask(min_rate, max_rate, brands, min_rating)):
+            results.append(self._hotels[position])
+            if limit is not None and len(results) >= limit:
+                break
+        return results
+
+    def count(
+        self,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        brands: Optional[Sequence[str]] = None,
+        min_rating: Optional[float] = None,
+    ) -> int:
+        """Number of hotels matching every given filter."""
+        return self._mask(min_rate, max_rate, brands, min_rating).bit_count()
+
+    def top_rated(
+        self,
+        limit: int,
+        min_rate: Optional[float] = None,
+        max_rate: Optional[float] = None,
+    ) -> List[T]:
+        """Best-rated hotels in the rate range (cheapest first among equal ratings)."""
+        lo, hi = self._range(min_rate, max_rate)
+        results = []
+        for position in self._by_rating:
+            if len(results) >= limit:
+                break
+            if lo <= position < hi:
+                results.append(self._hotels[position])
+        return results
@@ -0,0 +1,80 @@
+"""Sorted interval index with bisect lookups - pure Python, no external frameworks."""
+
+import heapq
+from bisect import bisect_right
+from typing import Any, Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Immutable index over items spanning closed intervals ``[start, end]``.
+
+    Built once in O(n log n); afterwards both queries are a single bisect:
+
+    - ``stab(point)``: the first item (in input order) whose interval
+      contains ``point``. The boundaries split the axis into elementary
+      segments, and a sweep records the answer for each segment up front.
+    - ``covers(lo, hi)``: whether some interval contains all of
+      ``[lo, hi]``, using a prefix maximum of ends over start order.
+
+    Key functions extract the bounds, so the index works for weather periods,
+    (period, score, reasons) tuples or anything else with comparable bounds.
+    Items whose start is after their end never match.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        start: Callable[[T], Any],
+        end: Callable[[T], Any],
+    ):
+        self._items: List[T] = list(items)
+        spans = [(start(item), end(item)) for item in self._items]
+        order = sorted((i for i, (lo, hi) in enumerate(spans) if lo <= hi), key=lambda i: spans[i][0])
+
+        # Containment: furthest end among intervals starting at or before each start
+        self._starts = [spans[i][0] for i in order]
+        self._reach = []
+        for i in order:
+            hi = spans[i][1]
+            self._reach.append(hi if not self._reach or hi > self._reach[-1] else self._reach[-1])
+
+        # Stabbing: boundary keys are (start, 0) and (end, 1); a key (x, 1)
+        # means "just after x", so closed ends stay inclusive
+        self._keys: List[Tuple[Any, int]] = sorted(
+            {(spans[i][0], 0) for i in order} | {(spans[i][1], 1) for i in order}
+        )
+        self._answers: List[int] = []
+        active: List[Tuple[int, Any]] = []  # Heap of (input position, end)
+        pending = 0
+        for key in self._keys:
+            while pending < len(order) and (spans[order[pending]][0], 0) <= key:
+                position = order[pending]
+                heapq.heappush(active, (position, spans[position][1]))
+                pending += 1
+            while active and (active[0][1], 1) <= key:
+                heapq.heappop(active)
+            self._answers.append(active[0][0] if active else -1)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def stab_position(self, point: Any) -> int:
+        """Input position of the first item containing ``point``, or -1."""
+        segment = bisect_right(self._keys, (point, 0)) - 1
+        return self._answers[segment] if segment >= 0 else -1
+
+    def stab(self, point: Any) -> Optional[T]:
+        """First item (in input order) whose interval contains ``point``."""
+        position = self.stab_position(point)
+        return self._items[position] if position >= 0 else None
+
+    def covers(self, lo: Any, hi: Any) -> bool:
+        """Whether any item's interval contains the whole of ``[lo, hi]``."""
+        count = bisect_right(self._starts, lo)
+        return count > 0 and self._reach[count - 1] >= hi
@@ -0,0 +1,82 @@
+"""Compiled multi-pattern destination matcher - pure Python, no external frameworks."""
+
+import re
+from typing import Dict, Generic, List, Mapping, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Letters and digits only; punctuation and whitespace separate tokens
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+# Trie node key that marks the end of an alias
+_TERMINAL = None
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class DestinationMatcher(Generic[T]):
+    """
+    Finds every alias mentioned in a query in a single pass over its tokens.
+
+    Aliases are compiled once into a token trie, so matching respects word
+    boundaries ("la" no longer matches inside "plan" or "Atlanta") and prefers
+    the longest alias starting at each position ("new delhi" over "delhi").
+    Cost is linear in the query length and independent of the alias count.
+    """
+
+    def __init__(self, aliases: Mapping[str, T]):
+        self._root: Dict = {}
+        self._max_depth = 0
+        for alias, value in aliases.items():
+            tokens = tokenize(alias)
+            if not tokens:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_TERMINAL] = value
+            self._max_depth = max(self._max_depth, len(tokens))
+
+    def find_all(self, query: str) -> List[T]:
+        """Return matched values in query order, leftmost-longest, without overlaps."""
+        return [value for _, value in self.find_all_with_positions(query)]
+
+    def find_all_with_positions(self, query: str) -> List[Tuple[int, T]]:
+        """Return ``(token_index, value)`` pairs for every alias found in the query."""
+        tokens = tokenize(query)
+        matches = []
+        i = 0
+        n = len(tokens)
+        while i < n:
+            node = self._root
+            match_end = -1
+            match_value = None
+            j = i
+            while j < n and j - i < self._max_depth:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _TERMINAL in node:
+                    match_end = j
+                    match_value = node[_TERMINAL]
+            if match_end > 0:
+                matches.append((i, match_value))
+                i = match_end
+            else:
+                i += 1
+        return matches
+
+    def find_unique(self, query: str, key=lambda value: value) -> List[T]:
+        """Return matched values in query order, keeping the first match per ``key``."""
+        seen = set()
+        found = []
+        for value in self.find_all(query):
+            k = key(value)
+            if k not in seen:
+                seen.add(k)
+                found.append(value)
+        return found
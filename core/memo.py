@@ -0,0 +1,92 @@
+"""Request-scoped memoization of tool calls - pure Python, no external frameworks."""
+
+import inspect
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _signature(fn: Callable) -> inspect.Signature:
+    """Cache signatures so key normalization stays cheap on hot paths."""
+    return inspect.signature(fn)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert an argument value into a hashable, order-stable form."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+class ToolMemo:
+    """
+    Memoizes tool results for the lifetime of a single request.
+
+    Calls are keyed on the tool plus its normalized arguments: positional and
+    keyword forms are bound to the tool signature and defaults are applied,
+    so ``search_flights_tool("SFO", "NRT", d, r)`` and
+    ``search_flights_tool(origin="SFO", ..., flexibility_days=3)`` share a slot.
+
+    Cached results are shared between callers and must be treated as read-only.
+    The memo is thread-safe: concurrent callers asking for the same key wait
+    on the in-flight run instead of starting a duplicate one. Waiters give up
+    after ``timeout`` seconds (``concurrent.futures.TimeoutError``), so a run
+    its owner abandoned cannot stall them; ``None`` waits indefinitely.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+        self._results: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, fn: Callable, *args, **kwargs) -> Tuple:
+        """Build the normalized cache key for a tool call."""
+        bound = _signature(fn).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return (
+            fn.__module__,
+            fn.__qualname__,
+            tuple((name, _freeze(value)) for name, value in bound.arguments.items()),
+        )
+
+    def call(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn`` once per unique argument set, returning the cached result afterwards."""
+        key = self.key(fn, *args, **kwargs)
+        with self._lock:
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._results[key] = Future()
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result(timeout=self.timeout)
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            # Let later callers retry instead of replaying the failure
+            with self._lock:
+                del self._results[key]
+            future.set_exception(exc)
+            raise
+        future.set_result(result)
+        return result
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for this request."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._results),
+        }
@@ -0,0 +1,39 @@
+"""Mock user profile store - pure Python, no external frameworks."""
+
+from core.models import UserProfile, ComfortLevel
+
+# Mock user profile storage (in production, this would query a database)
+MOCK_PROFILES = {
+    "user_123": UserProfile(
+        user_id="user_123",
+        citizenship="USA",
+        passport_country="USA",
+        preferred_temp_range=(75.0, 85.0),
+        airfare_budget_soft=600.0,
+        airfare_budget_hard=900.0,
+        hotel_budget_min=150.0,
+        hotel_budget_max=300.0,
+        preferred_brands=["Marriott", "Hilton"],
+        typical_trip_length_days=7,
+        comfort_level=ComfortLevel.COMFORT,
+        flexibility_days=5,
+        safety_conscious=True,
+        visa_required=False,
+    ),
+    "default": UserProfile(
+        user_id="default",
+        citizenship="USA",
+        passport_country="USA",
+        preferred_temp_range=(70.0, 80.0),
+        airfare_budget_soft=500.0,
+        airfare_budget_hard=800.0,
+        hotel_budget_min=100.0,
+        hotel_budget_max=250.0,
+        preferred_brands=[],
+        typical_trip_length_days=5,
+        comfort_level=ComfortLevel.STANDARD,
+        flexibility_days=3,
+        safety_conscious=False,
+        visa_required=False,
+    ),
+}
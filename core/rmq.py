@@ -0,0 +1,85 @@
+"""Range-minimum segment tree - pure Python, no external frameworks."""
+
+import math
+from typing import Iterable, List, Optional, Tuple
+
+_INF = math.inf
+
+
+class MinSegmentTree:
+    """
+    Fixed-size array supporting point updates and range-minimum queries.
+
+    Both operations are O(log n). Queries return the minimum value and its
+    position; ties resolve to the leftmost position. Unset positions hold
+    ``inf`` and never win a query.
+    """
+
+    def __init__(self, size: int, values: Optional[Iterable[float]] = None):
+        self.size = size
+        self._leaves = 1
+        while self._leaves < max(1, size):
+            self._leaves *= 2
+        self._values: List[float] = [_INF] * (2 * self._leaves)
+        self._positions: List[int] = [-1] * (2 * self._leaves)
+
+        if values is not None:
+            for i, value in enumerate(values):
+                if i >= size:
+                    raise ValueError("more values than the tree size")
+                self._values[self._leaves + i] = value
+                self._positions[self._leaves + i] = i
+            for node in range(self._leaves - 1, 0, -1):
+                self._pull(node)
+
+    def _pull(self, node: int) -> None:
+        left, right = 2 * node, 2 * node + 1
+        # Ties go left so the earliest position wins
+        if self._values[right] < self._values[left]:
+            self._values[node] = self._values[right]
+            self._positions[node] = self._positions[right]
+        else:
+            self._values[node] = self._values[left]
+            self._positions[node] = self._positions[left]
+
+    def __getitem__(self, position: int) -> float:
+        return self._values[self._leaves + position]
+
+    def __setitem__(self, position: int, value: float) -> None:
+        if not 0 <= position < self.size:
+            raise IndexError(position)
+        node = self._leaves + position
+        self._values[node] = value
+        self._positions[node] = position
+        node //= 2
+        while node:
+            self._pull(node)
+            node //= 2
+
+    def query(self, lo: int, hi: int) -> Tuple[float, int]:
+        """Minimum over positions ``lo..hi`` inclusive as (value, position); (inf, -1) if empty."""
+        lo = max(lo, 0)
+        hi = min(hi, self.size - 1)
+        best_value, best_position = _INF, -1
+        if lo > hi:
+            return best_value, best_position
+
+        # Walk both ends upward; collect right-side nodes to combine in order
+        left_nodes = []
+        right_nodes = []
+        lo += self._leaves
+        hi += self._leaves + 1
+        while lo < hi:
+            if lo & 1:
+                left_nodes.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right_nodes.append(hi)
+            lo //= 2
+            hi //= 2
+
+        for node in left_nodes + right_nodes[::-1]:
+            if self._values[node] < best_value:
+                best_value, best_position = self._values[node], self._positions[node]
+        return best_value, best_position
@@ -1,7 +1,9 @@
 """Scoring and recommendation synthesis logic - pure business logic."""
 
+import heapq
+from bisect import bisect_right
 from datetime import date, timedelta
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from .models import (
     UserProfile,
@@ -12,81 +14,142 @@ from .models import (
     RecommendationReason,
 )
 from .analysis import (
-    analyze_weather_for_user,
+    analyze_weather_coded,
     filter_flights_by_budget,
-    score_flight_option,
+    score_flight_coded,
     filter_hotels_by_budget,
-    score_hotel_option,
+    score_hotel_coded,
     find_overlapping_periods,
+    index_scored_periods,
+    render_reasons,
 )
+from .intervals import IntervalIndex
 
 
-def synthesize_recommendation(
-    profile: UserProfile,
-    forecast: WeatherForecast,
-    flights: List[FlightOption],
-    hotels: List[HotelOption],
-) -> Recommendation:
+RECOMMEND_THRESHOLD = 0.6  # Combined score a pair must exceed to be recommended
+TOP_COMBINATIONS = 3  # The recommendation plus two alternatives
+REPORTED_REJECTIONS = 3
+
+
+def _low_score_reason(combined: float, weather: float, flight: float, hotel: float) -> str:
+    return f"Low combined score ({combined:.2f}): weather={weather:.2f}, flight={flight:.2f}, hotel={hotel:.2f}"
+
+
+def _combined_score(weather_score: float, flight_score: float, hotel_score: float) -> float:
+    return (
+        weather_score * 0.4 +  # Weather is important
+        flight_score * 0.3 +   # Flight convenience
+        hotel_score * 0.3      # Hotel quality
+    )
+
+
+def stays_overlapping(
+    hotels: Sequence[HotelOption], order: Optional[Sequence[int]] = None
+) -> Callable[[date, date], List[int]]:
     """
-    Synthesize a final recommendation from all inputs.
+    Lookup of the hotels whose stay overlaps a flight's dates.
     
-    This is the core business logic that combines weather, flight, and hotel
-    analysis into a personalized recommendation.
+    Returns indexes into ``hotels`` in ``order`` (input order by default).
+    Hotels are bucketed by stay dates and the buckets sorted by check-in, so
+    the stays starting by a flight's return are a bisect prefix; a prefix
+    maximum of check-out dates rejects flights that overlap nothing without
+    looking at any bucket. Answers are cached per flight date pair.
     """
-    # Analyze weather
-    weather_scores = analyze_weather_for_user(forecast, profile)
+    if order is None:
+        order = range(len(hotels))
+    buckets: Dict[Tuple[date, date], List[int]] = {}
+    for rank, j in enumerate(order):
+        hotel = hotels[j]
+        if hotel.check_in_date <= hotel.check_out_date:
+            buckets.setdefault((hotel.check_in_date, hotel.check_out_date), []).append(rank)
+    stays = sorted(buckets)
+    check_ins = [check_in for check_in, _ in stays]
+    reach: List[date] = []
+    for _, check_out in stays:
+        reach.append(check_out if not reach or check_out > reach[-1] else reach[-1])
+    cache: Dict[Tuple[date, date], List[int]] = {}
     
-    # Filter and score flights
-    affordable_flights, rejected_flights = filter_flights_by_budget(flights, profile)
-    flight_scores = [
-        (flight, *score_flight_option(flight, profile))
-        for flight in affordable_flights
-    ]
+    def overlapping(departure: date, return_date: date) -> List[int]:
+        key = (departure, return_date)
+        if key not in cache:
+            count = bisect_right(check_ins, return_date)
+            if departure > return_date or count == 0 or reach[count - 1] < departure:
+                cache[key] = []
+            else:
+                ranks = [buckets[stay] for stay in stays[:count] if stay[1] >= departure]
+                merged = ranks[0] if len(ranks) == 1 else heapq.merge(*ranks)
+                cache[key] = [order[rank] for rank in merged]
+        return cache[key]
     
-    # Filter and score hotels
-    affordable_hotels, rejected_hotels = filter_hotels_by_budget(hotels, profile)
-    hotel_scores = [
-        (hotel, *score_hotel_option(hotel, profile))
-        for hotel in affordable_hotels
-    ]
+    return overlapping
+
+
+def search_combinations(
+    flight_scores: List[tuple],
+    hotel_scores: List[tuple],
+    weather_index: IntervalIndex,
+    k: int = TOP_COMBINATIONS,
+    rejected_limit: int = REPORTED_REJECTIONS,
+) -> Tuple[List[dict], List[tuple]]:
+    """
+    Provably optimal top-k flight x hotel combinations by combined score.
+    
+    ``flight_scores`` and ``hotel_scores`` are (option, score, reasons) tuples.
+    Both are visited in descending score order, and each flight only visits
+    hotels whose stay overlaps its dates. The best weather score bounds every
+    pair from above, so once a pair's bound falls below the current k-th best
+    (or cannot clear ``RECOMMEND_THRESHOLD`` and enough rejections are already
+    collected) the rest of that hotel list - and, at the first hotel, every
+    remaining flight - is skipped. Ties keep input order, exactly as a full
+    enumeration followed by a stable sort would.
+    
+    Returns: (best options sorted by score, up to ``rejected_limit`` evaluated
+    pairs below the threshold as (start, end, combined, weather, flight, hotel))
+    """
+    flights = sorted(range(len(flight_scores)), key=lambda i: -flight_scores[i][1])
+    hotels = sorted(range(len(hotel_scores)), key=lambda j: -hotel_scores[j][1])
+    if not flights or not hotels:
+        return [], []
+    max_weather = max((score for _, score, _ in weather_index), default=0.0)
+    best_hotel_score = hotel_scores[hotels[0]][1]
+    overlapping = stays_overlapping([hotel for hotel, _, _ in hotel_scores], hotels)
     
-    # Find best combinations
-    best_options = []
-    rejected_periods = []
+    heap: List[tuple] = []  # Min-heap of (score, -flight index, -hotel index, option)
+    rejected: List[tuple] = []
     
-    # Try combinations of flights and hotels
-    for flight, flight_score, flight_reason in flight_scores[:5]:  # Top 5 flights
-        for hotel, hotel_score, hotel_reason in hotel_scores[:5]:  # Top 5 hotels
-            # Check date overlap
+    def pruned(bound: float) -> bool:
+        if len(heap) >= k and bound < heap[0][0]:
+            return True
+        return bound <= RECOMMEND_THRESHOLD and len(rejected) >= rejected_limit
+    
+    for i in flights:
+        flight, flight_score, flight_reason = flight_scores[i]
+        if pruned(_combined_score(max_weather, flight_score, best_hotel_score)):
+            break
+        for j in overlapping(flight.departure_date, flight.return_date):
+            hotel, hotel_score, hotel_reason = hotel_scores[j]
+            if pruned(_combined_score(max_weather, flight_score, hotel_score)):
+                break
+            
             overlap = find_overlapping_periods(
-                forecast.forecast_periods,
+                weather_index,
                 (flight.departure_date, flight.return_date),
                 (hotel.check_in_date, hotel.check_out_date),
             )
-            
             if not overlap:
                 continue
-            
             start_date, end_date = overlap
             
-            # Find matching weather period
+            # Weather period the trip starts in
             weather_score = 0.0
-            weather_reason = ""
-            for period, score, reason in weather_scores:
-                if period.start_date <= start_date <= period.end_date:
-                    weather_score = score
-                    weather_reason = reason
-                    break
+            weather_reason = ()
+            match = weather_index.stab(start_date)
+            if match is not None:
+                _, weather_score, weather_reason = match
             
-            # Combined score (weighted)
-            combined_score = (
-                weather_score * 0.4 +  # Weather is important
-                flight_score * 0.3 +   # Flight convenience
-                hotel_score * 0.3      # Hotel quality
-            )
-            
-            if combined_score > 0.6:  # Threshold for recommendation
-                best_options.append({
+            combined_score = _combined_score(weather_score, flight_score, hotel_score)
+            if combined_score > RECOMMEND_THRESHOLD:
+                entry = (combined_score, -i, -j, {
                     "start": start_date,
                     "end": end_date,
                     "score": combined_score,
@@ -97,15 +160,81 @@ def synthesize_recommendation(
                     "flight_reason": flight_reason,
                     "hotel_reason": hotel_reason,
                 })
-            else:
-                rejected_periods.append({
-                    "start": start_date,
-                    "end": end_date,
-                    "reason": f"Low combined score ({combined_score:.2f}): weather={weather_score:.2f}, flight={flight_score:.2f}, hotel={hotel_score:.2f}",
-                })
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry[:3] > heap[0][:3]:
+                    heapq.heapreplace(heap, entry)
+            elif len(rejected) < rejected_limit:
+                # Keep the numbers; only the reported few are formatted
+                rejected.append((start_date, end_date, combined_score, weather_score, flight_score, hotel_score))
+    
+    best = [entry[3] for entry in sorted(heap, key=lambda entry: entry[:3], reverse=True)]
+    return best, rejected
+
+
+def score_weather(forecast: WeatherForecast, profile: UserProfile) -> IntervalIndex:
+    """
+    Weather periods scored for the user, as an interval index of
+    (period, score, reasons) entries. One index serves both the coverage
+    check and the period lookup for every flight x hotel pair.
+    """
+    return index_scored_periods(analyze_weather_coded(forecast, profile))
+
+
+def score_flights(flights: List[FlightOption], profile: UserProfile) -> List[tuple]:
+    """(flight, score, reasons) for every flight within the hard budget."""
+    affordable_flights, rejected_flights = filter_flights_by_budget(flights, profile)
+    return [
+        (flight, *score_flight_coded(flight, profile))
+        for flight in affordable_flights
+    ]
+
+
+def score_hotels(hotels: List[HotelOption], profile: UserProfile) -> List[tuple]:
+    """(hotel, score, reasons) for every hotel inside the nightly budget range."""
+    affordable_hotels, rejected_hotels = filter_hotels_by_budget(hotels, profile)
+    return [
+        (hotel, *score_hotel_coded(hotel, profile))
+        for hotel in affordable_hotels
+    ]
+
+
+def synthesize_recommendation(
+    profile: UserProfile,
+    forecast: WeatherForecast,
+    flights: List[FlightOption],
+    hotels: List[HotelOption],
+) -> Recommendation:
+    """
+    Synthesize a final recommendation from all inputs.
+    
+    This is the core business logic that combines weather, flight, and hotel
+    analysis into a personalized recommendation. Scoring keeps reason codes;
+    text is only rendered for the winner, the alternatives and the rejected
+    periods that are reported.
+    """
+    return rank_recommendation(
+        profile,
+        score_weather(forecast, profile),
+        score_flights(flights, profile),
+        score_hotels(hotels, profile),
+    )
+
+
+def rank_recommendation(
+    profile: UserProfile,
+    weather_index: IntervalIndex,
+    flight_scores: List[tuple],
+    hotel_scores: List[tuple],
+) -> Recommendation:
+    """
+    Build the recommendation from already-scored components.
     
-    # Sort by score
-    best_options.sort(key=lambda x: x["score"], reverse=True)
+    Split out of ``synthesize_recommendation`` so callers that cache component
+    scores (see ``core.session``) only redo the ranking.
+    """
+    # Exact top-k over every flight x hotel pair, best-first with bound pruning
+    best_options, rejected_periods = search_combinations(flight_scores, hotel_scores, weather_index)
     
     if not best_options:
         # No good options found - provide personalized fallback
@@ -129,14 +258,16 @@ def synthesize_recommendation(
             ],
             alternative_options=[],
             rejected_periods=[
-                (r["start"], r["end"], r["reason"])
-                for r in rejected_periods[:3]
+                (start, end, _low_score_reason(*scores))
+                for start, end, *scores in rejected_periods[:3]
             ],
             personalized_summary=fallback_summary,
         )
     
-    # Best option
+    # Best option; render its explanations now that they are shown
     best = best_options[0]
+    for key in ("weather_reason", "flight_reason", "hotel_reason"):
+        best[key] = render_reasons(best[key])
     
     # Build reasoning
     reasoning = [
@@ -163,7 +294,7 @@ def synthesize_recommendation(
         alternatives.append((
             opt["start"],
             opt["end"],
-            f"Score {opt['score']:.2f}: {opt['weather_reason'][:50]}",
+            f"Score {opt['score']:.2f}: {render_reasons(opt['weather_reason'])[:50]}",
         ))
     
     # Build personalized summary
@@ -188,8 +319,8 @@ def synthesize_recommendation(
         primary_reasoning=reasoning,
         alternative_options=alternatives,
         rejected_periods=[
-            (r["start"], r["end"], r["reason"])
-            for r in rejected_periods[:3]
+            (start, end, _low_score_reason(*scores))
+            for start, end, *scores in rejected_periods[:3]
         ],
         personalized_summary=" ".join(summary_parts),
     )
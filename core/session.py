@@ -0,0 +1,120 @@
+"""Incremental what-if re-scoring of one recommendation - pure Python, no external frameworks."""
+
+from dataclasses import replace
+from datetime import date
+from typing import Callable, Dict, FrozenSet, List, Set, Tuple
+
+from .analysis import weather_period_from_dict
+from .models import FlightOption, HotelOption, Recommendation, UserProfile, WeatherForecast
+from .scoring import rank_recommendation, score_flights, score_hotels, score_weather
+
+
+class _FieldRecorder:
+    """Read-only stand-in for a profile that notes every field read through it."""
+
+    __slots__ = ("_profile", "_fields")
+
+    def __init__(self, profile: UserProfile):
+        self._profile = profile
+        self._fields: Set[str] = set()
+
+    def __getattr__(self, name: str):
+        self._fields.add(name)
+        return getattr(self._profile, name)
+
+
+class RecommendationSession:
+    """
+    A recommendation whose tool outputs stay fixed while profile fields change.
+
+    Weather, flight and hotel scores are cached per component, together with
+    the ``UserProfile`` fields each one actually read while computing (e.g.
+    flight scores read the airfare budgets, never the temperature range).
+    ``update`` recomputes only the components that read a changed field, then
+    redoes the final ranking; tools are never called again.
+    """
+
+    COMPONENTS = ("weather", "flights", "hotels")
+
+    def __init__(
+        self,
+        profile: UserProfile,
+        forecast: WeatherForecast,
+        flights: List[FlightOption],
+        hotels: List[HotelOption],
+    ):
+        self.profile = profile
+        self.forecast = forecast
+        self.flights = list(flights)
+        self.hotels = list(hotels)
+        self._scorers: Dict[str, Callable] = {
+            "weather": lambda p: score_weather(self.forecast, p),
+            "flights": lambda p: score_flights(self.flights, p),
+            "hotels": lambda p: score_hotels(self.hotels, p),
+        }
+        self._scores: Dict[str, object] = {}
+        self._depends_on: Dict[str, FrozenSet[str]] = {}
+        self.recomputed: Tuple[str, ...] = ()
+        self._refresh(self.COMPONENTS)
+
+    @classmethod
+    def from_tool_outputs(cls, profile: UserProfile, weather: dict, flights: dict, hotels: dict) -> "RecommendationSession":
+        """Session over the dicts returned by the weather, flight and hotel search tools."""
+        periods = [weather_period_from_dict(p) for p in weather["periods"]]
+        flight_options = [
+            FlightOption(**{
+                **f,
+                "departure_date": date.fromisoformat(f["departure_date"]),
+                "return_date": date.fromisoformat(f["return_date"]),
+            })
+            for f in flights["options"]
+        ]
+        hotel_options = [
+            HotelOption(**{
+                **h,
+                "check_in_date": date.fromisoformat(h["check_in_date"]),
+                "check_out_date": date.fromisoformat(h["check_out_date"]),
+            })
+            for h in hotels["options"]
+        ]
+        forecast = WeatherForecast(weather["destination"], periods, weather["overall_summary"])
+        return cls(profile, forecast, flight_options, hotel_options)
+
+    def _refresh(self, stale) -> None:
+        recomputed = []
+        for name in self.COMPONENTS:
+            if name not in stale:
+                continue
+            recorder = _FieldRecorder(self.profile)
+            self._scores[name] = self._scorers[name](recorder)
+            self._depends_on[name] = frozenset(recorder._fields)
+            recomputed.append(name)
+        self.recomputed = tuple(recomputed)
+        self._recommendation = rank_recommendation(
+            self.profile, self._scores["weather"], self._scores["flights"], self._scores["hotels"]
+        )
+
+    def depends_on(self, component: str) -> FrozenSet[str]:
+        """Profile fields the component read the last time it was scored."""
+        return self._depends_on[component]
+
+    @property
+    def recommendation(self) -> Recommendation:
+        """The recommendation for the current profile."""
+        return self._recommendation
+
+    def update(self, **changes) -> Recommendation:
+        """
+        Change profile fields and return the new recommendation.
+
+        Unknown fields raise ``TypeError`` (from ``dataclasses.replace``).
+        Setting fields to their current values is free.
+        """
+        profile = replace(self.profile, **changes)
+        changed = {field for field, value in changes.items() if getattr(self.profile, field) != value}
+        if not changed:
+            self.recomputed = ()
+            return self._recommendation
+        self.profile = profile
+        self._refresh({name for name, fields in self._depends_on.items() if fields & changed})
+        return self._recommendation
@@ -0,0 +1,93 @@
+"""Pareto frontier (skyline) of multi-criteria candidates.
+
+A candidate is on the frontier when no other candidate is at least as good on
+every criterion and strictly better on one. Points are sorted
+lexicographically once with ``np.lexsort``; in that order a point can only be
+dominated by points before it. Two criteria are then a single vectorized
+prefix-minimum sweep. With three or more, the leading points are settled a
+few dozen at a time and everything they dominate is removed in one
+broadcast comparison; cost grows with the frontier size, which stays small
+when candidates are first reduced to their per-component frontiers.
+"""
+
+from typing import Callable, List, Sequence, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+_PIVOTS = 32  # Leading candidates settled per sweep step
+
+
+def skyline_indices(points: np.ndarray) -> np.ndarray:
+    """
+    Row indices of the non-dominated rows of an (n x d) array, every column minimized.
+
+    Indices come back in lexicographic order of their rows. Exact duplicates
+    collapse to one representative.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2:
+        raise ValueError("points must be a 2-D array")
+    n, dims = points.shape
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    if dims == 0:
+        return np.zeros(1, dtype=np.intp)
+
+    # lexsort sorts by its last key first, so feed the columns reversed
+    order = np.lexsort(points.T[::-1])
+    ordered = points[order]
+    if dims == 1:
+        return order[:1]
+
+    if dims == 2:
+        # Everything earlier has x <= this x, so the point survives only if its y
+        # beats every earlier y
+        ys = ordered[:, 1]
+        earlier_min = np.minimum.accumulate(ys)
+        keep = np.empty(n, dtype=bool)
+        keep[0] = True
+        keep[1:] = ys[1:] < earlier_min[:-1]
+        return order[keep]
+
+    # The first few surviving points are settled among themselves (in sorted
+    # order only earlier points can dominate), then everything they dominate
+    # is dropped in one broadcast comparison
+    kept = []
+    remaining = np.arange(n)
+    while remaining.size:
+        head = remaining[:_PIVOTS]
+        head_points = ordered[head]
+        dominates = (head_points[:, None, :] <= head_points[None, :, :]).all(axis=2)
+        dominates &= np.triu(np.ones(dominates.shape, dtype=bool), k=1)
+        survivors = head[~dominates.any(axis=0)]
+        kept.append(survivors)
+
+        rest = remaining[_PIVOTS:]
+        if rest.size:
+            covered = (ordered[rest][:, None, :] >= ordered[survivors][None, :, :]).all(axis=2).any(axis=1)
+            rest = rest[~covered]
+        remaining = rest
+    return order[np.concatenate(kept)]
+
+
+def pareto_frontier(
+    items: Sequence[T],
+    criteria: Sequence[Callable[[T], float]],
+    maximize: Sequence[bool] = (),
+) -> List[T]:
+    """
+    Items not dominated on ``criteria``.
+
+    Criteria are minimized unless the matching ``maximize`` flag is set.
+    Results come back ordered by the first criterion (best first).
+    """
+    if not items:
+        return []
+    flags = list(maximize) + [False] * (len(criteria) - len(maximize))
+    points = np.array(
+        [[-c(item) if flag else c(item) for c, flag in zip(criteria, flags)] for item in items],
+        dtype=np.float64,
+    ).reshape(len(items), len(criteria))
+    return [items[i] for i in skyline_indices(points).tolist()]
@@ -0,0 +1,111 @@
+"""Indexed visa requirements matrix - pure Python, no external frameworks."""
+
+import heapq
+import json
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+DEFAULT_DATA_FILE = Path(__file__).parent / "data" / "visa_requirements.json"
+
+# Entry types that need no visa application before travel
+VISA_FREE_TYPES = ("visa_free", "visa_waiver", "esta")
+
+# Entry types that need a visa, but one that is quick to obtain
+EASY_VISA_TYPES = ("e-visa", "visa_on_arrival")
+
+# Matrix cell value for pairs that are not in the data file
+_UNKNOWN = -1
+
+
+class VisaMatrix:
+    """
+    Visa requirements stored as a dense (citizenship x destination) code matrix.
+
+    Countries are mapped to integer codes and each distinct requirement record
+    is stored once, so a pair lookup is two dict hits plus one array index.
+    An inverted index from (citizenship, visa type) to destinations answers
+    "where can I go visa-free?" without scanning the matrix.
+    """
+
+    def __init__(self, entries: Iterable[Mapping]):
+        entries = list(entries)
+
+        self.countries: Tuple[str, ...] = tuple(dict.fromkeys(
+            country
+            for entry in entries
+            for country in (entry["citizenship"], entry["destination"])
+        ))
+        self._codes: Dict[str, int] = {name: i for i, name in enumerate(self.countries)}
+
+        n = len(self.countries)
+        self._cells = array("h", [_UNKNOWN]) * (n * n)
+        self._requirements: List[Mapping] = []
+        requirement_ids: Dict[Tuple, int] = {}
+        inverted: Dict[Tuple[int, str], List[Tuple[int, str]]] = {}
+
+        for position, entry in enumerate(entries):
+            requirement = {k: v for k, v in entry.items() if k not in ("citizenship", "destination")}
+            fingerprint = tuple(sorted(requirement.items()))
+            req_id = requirement_ids.get(fingerprint)
+            if req_id is None:
+                req_id = requirement_ids[fingerprint] = len(self._requirements)
+                self._requirements.append(MappingProxyType(requirement))
+
+            cit = self._codes[entry["citizenship"]]
+            dest = self._codes[entry["destination"]]
+            self._cells[cit * n + dest] = req_id
+            # Keep the data-file position so multi-type queries preserve file order
+            inverted.setdefault((cit, requirement.get("type", "visa")), []).append(
+                (position, entry["destination"])
+            )
+
+        self._by_type: Dict[Tuple[int, str], Tuple[Tuple[int, str], ...]] = {
+            key: tuple(dests) for key, dests in inverted.items()
+        }
+
+    def country_code(self, country: str) -> Optional[int]:
+        """Integer code for a country, or None if it is not in the matrix."""
+        return self._codes.get(country)
+
+    def lookup(self, citizenship: str, destination: str) -> Optional[Mapping]:
+        """Requirement record for a passport/destination pair, or None if unknown."""
+        cit = self._codes.get(citizenship)
+        dest = self._codes.get(destination)
+        if cit is None or dest is None:
+            return None
+        req_id = self._cells[cit * len(self.countries) + dest]
+        if req_id == _UNKNOWN:
+            return None
+        return self._requirements[req_id]
+
+    def destinations_by_type(self, citizenship: str, visa_types: Sequence[str]) -> Tuple[str, ...]:
+        """Every destination reachable with one of ``visa_types`` on this passport."""
+        cit = self._codes.get(citizenship)
+        if cit is None:
+            return ()
+        postings = [self._by_type.get((cit, visa_type), ()) for visa_type in visa_types]
+        return tuple(dest for _, dest in heapq.merge(*postings))
+
+    def visa_free_destinations(self, citizenship: str) -> Tuple[str, ...]:
+        """Destinations that need no visa application before travel."""
+        return self.destinations_by_type(citizenship, VISA_FREE_TYPES)
+
+    def easy_visa_destinations(self, citizenship: str) -> Tuple[str, ...]:
+        """Destinations offering an e-visa or visa on arrival."""
+        return self.destinations_by_type(citizenship, EASY_VISA_TYPES)
+
+
+def load_visa_matrix(path: Optional[Path] = None) -> VisaMatrix:
+    """Load a visa matrix from a JSON data file."""
+    with open(path or DEFAULT_DATA_FILE, encoding="utf-8") as f:
+        data = json.load(f)
+    return VisaMatrix(data["requirements"])
+
+
+@lru_cache(maxsize=None)
+def get_visa_matrix() -> VisaMatrix:
+    """Return the process-wide visa matrix, loading the bundled data file on first use."""
+    return load_visa_matrix()
@@ -3,22 +3,41 @@ import axios from 'axios';
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:5000';
 
 class TravelAgentService {
+  constructor() {
+    // Last response per (userId, query), revalidated with If-None-Match
+    this.recommendationCache = new Map();
+  }
+
   async getRecommendation(query, userId = 'default') {
+    const cacheKey = `${userId}\u0000${query}`;
+    const cached = this.recommendationCache.get(cacheKey);
+
     try {
       const response = await axios.post(`${API_BASE_URL}/api/recommend`, {
         query,
         userId,
       }, {
         timeout: 60000, // 60 second timeout for AI processing
+        headers: cached ? { 'If-None-Match': cached.etag } : {},
+        validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
       });
 
+      if (response.status === 304 && cached) {
+        return cached.result;
+      }
+
       if (response.data.success) {
-        return {
+        const result = {
           query: response.data.query,
           userId: response.data.userId,
           recommendation: response.data.recommendation,
           timestamp: response.data.timestamp || new Date().toISOString(),
         };
+        const etag = response.headers && response.headers.etag;
+        if (etag) {
+          this.recommendationCache.set(cacheKey, { etag, result });
+        }
+        return result;
       } else {
         throw new Error(response.data.error || 'Failed to get recommendation');
       }
@@ -161,3 +161,11 @@ def sample_hotel_options():
             booking_code="HTL-003",
         ),
     ]
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached API responses from leaking between tests."""
+    from api_server import RESPONSE_CACHE
+    RESPONSE_CACHE.clear()
+    yield
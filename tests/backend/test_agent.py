@@ -103,3 +103,30 @@ class TestAgentStructure:
         assert isinstance(result, dict)
         assert "destination" in result
         assert "options" in result
+
+
+class TestLazyAgent:
+    """Tests that the API path never imports google.adk."""
+
+    def test_api_server_does_not_import_adk(self):
+        """Test that serving a request leaves google.adk unimported."""
+        import subprocess
+        import sys
+
+        script = (
+            "import sys, api_server\n"
+            "api_server.get_travel_recommendation('Should I go to Maui?', 'default')\n"
+            "print(any(m.startswith(('google.adk', 'fastmcp')) for m in sys.modules))\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", script], cwd=root,
+                                capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+    def test_coordinator_reexports_engine_tools(self):
+        """Test that agent.coordinator exposes the same tool functions."""
+        from agent import coordinator
+        from tools import engine
+
+        assert coordinator.search_flights_tool is engine.search_flights_tool
+        assert coordinator.get_user_profile_tool is engine.get_user_profile_tool
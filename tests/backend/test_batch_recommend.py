@@ -0,0 +1,131 @@
+"""Tests for the /api/recommend/batch endpoint."""
+
+import pytest
+import json
+
+from api_server import (
+    app,
+    RESPONSE_CACHE,
+    get_travel_recommendation,
+    iter_batch_recommendations,
+)
+from core.memo import ToolMemo
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app."""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+BATCH = [
+    {"query": "Should I go to Maui?", "userId": "user_123"},
+    {"query": "When should I visit Tokyo?", "userId": "default"},
+    {"query": "Is Maui nice right now?", "userId": "default"},
+    {"query": "Should I go to Maui?", "userId": "user_123"},
+    {"query": "Tokyo trip", "userId": "user_123"},
+]
+
+
+class TestBatchOrdering:
+    """Tests for batch ordering and deduplication."""
+
+    def test_first_result_streams_before_later_requests(self, monkeypatch):
+        """Test that each result is yielded before the next request is rendered."""
+        import api_server
+
+        rendered = []
+        real = api_server.get_travel_recommendation
+        monkeypatch.setattr(
+            api_server, "get_travel_recommendation",
+            lambda query, user_id, memo=None, endpoint="/api/recommend": (
+                rendered.append(query) or real(query, user_id, memo, endpoint)
+            ),
+        )
+        results = iter_batch_recommendations(BATCH)
+        assert next(results)["index"] == 0
+        assert rendered == [BATCH[0]["query"]]
+
+    def test_results_in_input_order(self):
+        """Test that results come back in input order."""
+        results = list(iter_batch_recommendations(BATCH))
+        assert [r["index"] for r in results] == list(range(len(BATCH)))
+        assert all(r["success"] for r in results)
+
+    def test_results_match_single_requests(self):
+        """Test that batch output equals the per-request recommendation."""
+        results = list(iter_batch_recommendations(BATCH))
+        for item, result in zip(BATCH, results):
+            assert result["recommendation"] == get_travel_recommendation(item["query"], item["userId"])
+
+    def test_tools_shared_across_queries(self, monkeypatch):
+        """Test that each unique tool call runs once for the whole batch."""
+        memo = ToolMemo()
+        list(iter_batch_recommendations(BATCH, memo))
+        # The repeated request is served from the response cache: 4 renders x
+        # 5 tool calls, and weather/flights for each city are fetched only once
+        assert memo.hits + memo.misses == 4 * 5
+        assert memo.hits >= 4
+        assert RESPONSE_CACHE.stats()["hits"] == 1
+        assert RESPONSE_CACHE.stats()["misses"] == 4
+
+    def test_abandoned_tool_call_does_not_stall_batch(self, monkeypatch):
+        """Test that a tool run left pending by a timed-out request fails later waiters instead of blocking."""
+        from concurrent.futures import Future
+        from api_server import get_user_profile_tool
+
+        monkeypatch.setattr(RESPONSE_CACHE, "max_entries", 0)
+        memo = ToolMemo(timeout=0.01)
+        # What a timed-out comparison leaves behind: an owner that never resolves
+        memo._results[memo.key(get_user_profile_tool, "user_123")] = Future()
+        results = list(iter_batch_recommendations(BATCH[:2], memo))
+        assert [r["success"] for r in results] == [False, True]
+
+    def test_invalid_entries_reported_in_place(self):
+        """Test that malformed entries yield an error at their index."""
+        results = list(iter_batch_recommendations([{"query": "Maui"}, {}, "Paris"]))
+        assert [r["success"] for r in results] == [True, False, False]
+        assert results[1]["error"] == "Query is required"
+
+
+class TestBatchEndpoint:
+    """Tests for the /api/recommend/batch endpoint."""
+
+    def test_streams_ndjson(self, client):
+        """Test that the endpoint streams one JSON line per request."""
+        response = client.post('/api/recommend/batch',
+                               data=json.dumps({"requests": BATCH}),
+                               content_type='application/json')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+
+        lines = response.get_data(as_text=True).splitlines()
+        results = [json.loads(line) for line in lines]
+        assert [r["index"] for r in results] == list(range(len(BATCH)))
+        assert results[0]["recommendation"] == results[3]["recommendation"]
+
+    def test_accepts_bare_array(self, client):
+        """Test that a top-level JSON array is accepted."""
+        response = client.post('/api/recommend/batch',
+                               data=json.dumps(BATCH[:1]),
+                               content_type='application/json')
+        assert len(response.get_data(as_text=True).splitlines()) == 1
+
+    def test_rejects_non_array(self, client):
+        """Test that a non-array body is rejected."""
+        response = client.post('/api/recommend/batch',
+                               data=json.dumps({"query": "Maui"}),
+                               content_type='application/json')
+        assert response.status_code == 400
+
+    def test_rejects_oversized_batch(self, client, monkeypatch):
+        """Test that batches above BATCH_MAX_REQUESTS are rejected."""
+        import api_server
+
+        monkeypatch.setattr(api_server, "BATCH_MAX_REQUESTS", 2)
+        response = client.post('/api/recommend/batch',
+                               data=json.dumps(BATCH),
+                               content_type='application/json')
+        assert response.status_code == 413
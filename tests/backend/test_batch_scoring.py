@@ -0,0 +1,219 @@
+"""Tests for columnar batches and vectorized scoring."""
+
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from core.analysis import score_flight_option, score_hotel_option, score_weather_period
+from core.batch import (
+    ANOMALY_DISCOUNT,
+    ANOMALY_NONE,
+    ANOMALY_OTHER,
+    CandidateBatch,
+    FlightBatch,
+    HotelBatch,
+    ProfileBatch,
+    WeatherBatch,
+    iter_score_chunks,
+    score_flights_batch,
+    score_hotels_batch,
+    score_profiles,
+)
+from core.destinations import get_registry
+from core.models import ComfortLevel, FlightOption, HotelOption, UserProfile, WeatherPeriod
+from tools.fare_grid import paired_fare_grid
+
+BRANDS = ["Marriott", "Hilton", "Hyatt", "Westin", "Four Seasons", "Budget Inn"]
+
+
+def random_flights(count, seed=7):
+    rng = random.Random(seed)
+    start = date.today()
+    return [
+        FlightOption(
+            departure_date=start,
+            return_date=start + timedelta(days=7),
+            price_usd=rng.uniform(200, 1500),
+            airline="United",
+            departure_time="08:30",
+            return_time="14:20",
+            is_red_eye=rng.random() < 0.5,
+            is_weekday=rng.random() < 0.7,
+            layovers=rng.randrange(3),
+            total_duration_hours=8.0,
+            booking_code=f"FLT-{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def random_hotels(count, seed=11):
+    rng = random.Random(seed)
+    start = date.today()
+    hotels = []
+    for i in range(count):
+        anomalous = rng.random() < 0.3
+        hotels.append(HotelOption(
+            check_in_date=start,
+            check_out_date=start + timedelta(days=5),
+            nightly_rate_usd=rng.uniform(60, 600),
+            total_price_usd=0.0,
+            brand=rng.choice(BRANDS),
+            name=f"Hotel {i}",
+            rating=round(rng.uniform(2.5, 5.0), 1),
+            is_anomalous_pricing=anomalous,
+            anomalous_reason=(rng.choice(["Storm Discount", "Event surge pricing"]) if anomalous else None),
+            booking_code=f"HTL-{i}",
+        ))
+    return hotels
+
+
+PROFILES = [
+    UserProfile(user_id="standard"),
+    UserProfile(user_id="budget", comfort_level=ComfortLevel.BUDGET, preferred_brands=["Budget Inn"],
+                airfare_budget_soft=400.0, airfare_budget_hard=650.0),
+    UserProfile(user_id="luxury", comfort_level=ComfortLevel.LUXURY, preferred_brands=["Four Seasons", "Hyatt"],
+                hotel_budget_min=250.0, hotel_budget_max=700.0, airfare_budget_soft=1200.0,
+                airfare_budget_hard=2500.0),
+]
+
+
+class TestFlightBatch:
+    """Tests for FlightBatch and score_flights_batch."""
+
+    @pytest.mark.parametrize("profile", PROFILES, ids=lambda p: p.user_id)
+    def test_matches_scalar_scores(self, profile):
+        """Test that batch scores are identical to the scalar reference."""
+        flights = random_flights(2000)
+        scores = score_flights_batch(FlightBatch.from_options(flights), profile)
+        assert scores.tolist() == [score_flight_option(f, profile)[0] for f in flights]
+
+    def test_fare_grid_batch_matches_options(self):
+        """Test that a fare grid's batch scores like its option dicts."""
+        grid = paired_fare_grid(get_registry().flight_profile("OGG"), date.today() + timedelta(days=20),
+                                date.today() + timedelta(days=27), 5)
+        profile = PROFILES[0]
+        options = grid.options_for(np.arange(grid.size))
+        expected = [
+            score_flight_option(FlightOption(
+                departure_date=date.fromisoformat(o["departure_date"]),
+                return_date=date.fromisoformat(o["return_date"]),
+                **{k: v for k, v in o.items() if k not in ("departure_date", "return_date")},
+            ), profile)[0]
+            for o in options
+        ]
+        assert score_flights_batch(grid.flight_batch(), profile).tolist() == expected
+
+    def test_mismatched_columns_rejected(self):
+        """Test that columns of different lengths raise ValueError."""
+        with pytest.raises(ValueError):
+            FlightBatch(price_usd=[1.0, 2.0], layovers=[0], is_weekday=[True], is_red_eye=[False])
+
+
+class TestHotelBatch:
+    """Tests for HotelBatch and score_hotels_batch."""
+
+    @pytest.mark.parametrize("profile", PROFILES, ids=lambda p: p.user_id)
+    def test_matches_scalar_scores(self, profile):
+        """Test that batch scores are identical to the scalar reference."""
+        hotels = random_hotels(2000)
+        scores = score_hotels_batch(HotelBatch.from_options(hotels), profile)
+        assert scores.tolist() == [score_hotel_option(h, profile)[0] for h in hotels]
+
+    def test_codes(self):
+        """Test brand and anomaly encoding."""
+        hotels = random_hotels(50)
+        batch = HotelBatch.from_options(hotels)
+        assert [batch.brands[c] for c in batch.brand_codes] == [h.brand for h in hotels]
+        assert set(batch.anomaly.tolist()) <= {ANOMALY_NONE, ANOMALY_DISCOUNT, ANOMALY_OTHER}
+        assert batch.brand_mask(["Hilton"]).tolist() == [h.brand == "Hilton" for h in hotels]
+
+    def test_empty_batch(self):
+        """Test that an empty batch scores to an empty array."""
+        assert len(score_hotels_batch(HotelBatch.from_options([]), PROFILES[0])) == 0
+
+
+def random_periods(count, seed=13):
+    rng = random.Random(seed)
+    start = date.today()
+    return [
+        WeatherPeriod(
+            start_date=start,
+            end_date=start + timedelta(days=7),
+            avg_temp_f=rng.uniform(40, 100),
+            min_temp_f=0.0,
+            max_temp_f=0.0,
+            precipitation_inches=rng.uniform(0, 4),
+            storm_risk=rng.random() < 0.3,
+            storm_severity=None,
+            conditions_summary="",
+        )
+        for _ in range(count)
+    ]
+
+
+def random_profiles(count, seed=17):
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(count):
+        low = rng.uniform(50, 80)
+        soft = rng.uniform(200, 1000)
+        hotel_min = rng.uniform(50, 300)
+        profiles.append(UserProfile(
+            user_id=f"user-{i}",
+            preferred_temp_range=(low, low + rng.uniform(0, 20)),
+            airfare_budget_soft=soft,
+            airfare_budget_hard=soft + rng.uniform(50, 800),
+            hotel_budget_min=hotel_min,
+            hotel_budget_max=hotel_min + rng.uniform(20, 400),
+            preferred_brands=rng.sample(BRANDS, rng.randrange(3)),
+            comfort_level=rng.choice(list(ComfortLevel)),
+            safety_conscious=rng.random() < 0.5,
+        ))
+    return profiles
+
+
+def scalar_combined(period, flight, hotel, profile):
+    return (
+        score_weather_period(period, profile)[0] * 0.4
+        + score_flight_option(flight, profile)[0] * 0.3
+        + score_hotel_option(hotel, profile)[0] * 0.3
+    )
+
+
+class TestProfileMatrix:
+    """Tests for ProfileBatch and profiles x candidates scoring."""
+
+    def test_matches_scalar_scores(self):
+        """Test every matrix cell equals the per-user, per-candidate scalar score."""
+        candidates = list(zip(random_periods(60), random_flights(60), random_hotels(60)))
+        profiles = random_profiles(40)
+        scores = score_profiles(CandidateBatch.from_candidates(candidates), ProfileBatch.from_profiles(profiles))
+        assert scores.shape == (40, 60)
+        assert scores.tolist() == [[scalar_combined(*c, p) for c in candidates] for p in profiles]
+
+    def test_chunks_cover_every_profile(self):
+        """Test chunking bounds block size without changing the result."""
+        batch = CandidateBatch.from_candidates(list(zip(random_periods(50), random_flights(50), random_hotels(50))))
+        profiles = ProfileBatch.from_profiles(random_profiles(33))
+        chunks = list(iter_score_chunks(batch, profiles, chunk_cells=500))
+        assert [block.shape for _, block in chunks] == [(10, 50)] * 3 + [(3, 50)]
+        assert np.array_equal(np.vstack([block for _, block in chunks]), score_profiles(batch, profiles))
+
+    def test_brand_matrix(self):
+        """Test preferred brands are matched per profile."""
+        profiles = ProfileBatch.from_profiles(PROFILES)
+        assert profiles.brand_matrix(["Hyatt", "Budget Inn"]).tolist() == [
+            [False, False], [False, True], [True, False]
+        ]
+
+    def test_mismatched_lengths_rejected(self):
+        """Test that candidate components of different lengths raise ValueError."""
+        with pytest.raises(ValueError):
+            CandidateBatch(
+                weather=WeatherBatch.from_periods(random_periods(1)),
+                flights=FlightBatch.from_options(random_flights(2)),
+                hotels=HotelBatch.from_options(random_hotels(2)),
+            )
@@ -9,8 +9,15 @@ from core.analysis import (
     filter_flights_by_budget,
     score_flight_option,
     filter_hotels_by_budget,
+    index_hotels,
     score_hotel_option,
     find_overlapping_periods,
+    analyze_weather_coded,
+    score_flight_coded,
+    score_hotel_coded,
+    render_reasons,
+    REASON_TEMPLATES,
+    weather_period_from_dict,
 )
 
 
@@ -75,6 +82,36 @@ class TestWeatherAnalysis:
         assert score < 1.0
         assert "above preference" in reason.lower()
 
+    def test_weather_period_from_tool_dict(self):
+        """Test tool period dicts convert with the average filling in missing fields."""
+        period = weather_period_from_dict({
+            "start_date": "2026-11-01",
+            "end_date": "2026-11-07",
+            "avg_temp_f": 72.0,
+            "storm_risk": True,
+            "storm_severity": "moderate",
+        })
+        assert period.start_date == date(2026, 11, 1)
+        assert period.end_date == date(2026, 11, 7)
+        assert period.min_temp_f == period.max_temp_f == 72.0
+        assert period.precipitation_inches == 0.0
+        assert period.storm_severity == "moderate"
+        assert period.conditions_summary == ""
+
+        full = weather_period_from_dict({
+            "start_date": "2026-11-01",
+            "end_date": "2026-11-07",
+            "avg_temp_f": 72.0,
+            "min_temp_f": 60.0,
+            "max_temp_f": 80.0,
+            "precipitation_inches": 1.5,
+            "storm_risk": False,
+            "conditions_summary": "Mild",
+        })
+        assert (full.min_temp_f, full.max_temp_f, full.precipitation_inches) == (60.0, 80.0, 1.5)
+        assert full.storm_severity is None
+        assert full.conditions_summary == "Mild"
+
 
 class TestFlightAnalysis:
     """Tests for flight analysis functions."""
@@ -131,6 +168,14 @@ class TestHotelAnalysis:
         assert len(rejected) == 1
         assert rejected[0].nightly_rate_usd == 350.0
 
+    def test_filter_hotels_by_budget_index(self, sample_user_profile, sample_hotel_options):
+        """Test that a prebuilt hotel index splits the same hotels, cheapest first."""
+        affordable, rejected = filter_hotels_by_budget(index_hotels(sample_hotel_options), sample_user_profile)
+        expected_affordable, expected_rejected = filter_hotels_by_budget(sample_hotel_options, sample_user_profile)
+        by_rate = lambda hotels: sorted(hotels, key=lambda h: h.nightly_rate_usd)
+        assert affordable == by_rate(expected_affordable)
+        assert rejected == by_rate(expected_rejected)
+
     def test_score_hotel_brand_loyalty(self, sample_user_profile, sample_hotel_options):
         """Test that preferred brands get a bonus."""
         marriott_hotel = sample_hotel_options[0]  # Marriott (preferred)
@@ -175,6 +220,36 @@ class TestHotelAnalysis:
         assert "anomalous" in reason.lower() or "discount" in reason.lower()
 
 
+class TestReasonCodes:
+    """Tests for reason codes and on-demand rendering."""
+
+    def test_codes_render_to_scalar_text(self, sample_user_profile, sample_weather_forecast,
+                                         sample_flight_options, sample_hotel_options):
+        """Test that rendering codes gives exactly the scalar functions' text."""
+        coded = analyze_weather_coded(sample_weather_forecast, sample_user_profile)
+        text = analyze_weather_for_user(sample_weather_forecast, sample_user_profile)
+        assert [(p, s, render_reasons(r)) for p, s, r in coded] == text
+
+        for flight in sample_flight_options:
+            score, reasons = score_flight_coded(flight, sample_user_profile)
+            assert (score, render_reasons(reasons)) == score_flight_option(flight, sample_user_profile)
+        for hotel in sample_hotel_options:
+            score, reasons = score_hotel_coded(hotel, sample_user_profile)
+            assert (score, render_reasons(reasons)) == score_hotel_option(hotel, sample_user_profile)
+
+    def test_codes_are_known_and_string_free(self, sample_user_profile, sample_flight_options):
+        """Test that codes are registered and carry raw values, not formatted text."""
+        for flight in sample_flight_options:
+            _, reasons = score_flight_coded(flight, sample_user_profile)
+            for code, *values in reasons:
+                assert code in REASON_TEMPLATES
+                assert not any(isinstance(value, str) for value in values)
+
+    def test_render_empty(self):
+        """Test that no reasons render to an empty string."""
+        assert render_reasons(()) == ""
+
+
 class TestDateOverlap:
     """Tests for date overlap functions."""
 
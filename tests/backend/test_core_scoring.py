@@ -1,10 +1,14 @@
 """Tests for core scoring and recommendation synthesis."""
 
 import pytest
+import random
+import time
 from datetime import date, timedelta
 
-from core.models import UserProfile, ComfortLevel
-from core.scoring import synthesize_recommendation
+from core.analysis import find_overlapping_periods
+from core.intervals import IntervalIndex
+from core.models import UserProfile, ComfortLevel, FlightOption, HotelOption, WeatherPeriod
+from core.scoring import search_combinations, synthesize_recommendation
 
 
 class TestRecommendationSynthesis:
@@ -117,3 +121,88 @@ class TestRecommendationSynthesis:
         # Should mention user preferences
         assert "75" in summary or "85" in summary or "temperature" in summary
         assert "600" in summary or "900" in summary or "budget" in summary
+
+
+def _random_scored_options(rng, count, today):
+    """(flight, score, reasons) and (hotel, score, reasons) tuples with quantized scores for ties."""
+    flights, hotels = [], []
+    for i in range(count):
+        start = today + timedelta(days=rng.randrange(0, 35))
+        flights.append((FlightOption(start, start + timedelta(days=rng.randrange(2, 9)), 400.0, "UA", "08:30",
+                                     "14:20", False, True, 0, 6.0, f"F{i}"), rng.randrange(0, 11) / 10, ()))
+        check_in = start + timedelta(days=rng.randrange(-2, 3))
+        hotels.append((HotelOption(check_in, check_in + timedelta(days=rng.randrange(2, 9)), 150.0, 900.0, "Hilton",
+                                   "H", 4.0, False), rng.randrange(0, 11) / 10, ()))
+    return flights, hotels
+
+
+def _brute_force_combinations(flight_scores, hotel_scores, weather_index):
+    """Score every pair in input order and stable-sort, as the old nested loop did."""
+    best = []
+    for i, (flight, f_score, _) in enumerate(flight_scores):
+        for j, (hotel, h_score, _) in enumerate(hotel_scores):
+            overlap = find_overlapping_periods(weather_index, (flight.departure_date, flight.return_date),
+                                               (hotel.check_in_date, hotel.check_out_date))
+            if not overlap:
+                continue
+            match = weather_index.stab(overlap[0])
+            w_score = match[1] if match else 0.0
+            combined = w_score * 0.4 + f_score * 0.3 + h_score * 0.3
+            if combined > 0.6:
+                best.append((combined, i, j))
+    best.sort(key=lambda entry: entry[0], reverse=True)
+    return best
+
+
+class TestCombinationSearch:
+    """Tests for the exact branch-and-bound combination search."""
+
+    def _weather_index(self, rng, today):
+        periods = [
+            WeatherPeriod(today + timedelta(days=7 * w), today + timedelta(days=7 * w + 6),
+                          70.0, 65.0, 75.0, 0.5, False)
+            for w in range(6)
+        ]
+        return IntervalIndex([(p, rng.randrange(0, 11) / 10, ()) for p in periods],
+                             start=lambda e: e[0].start_date, end=lambda e: e[0].end_date)
+
+    def test_matches_exhaustive_enumeration(self):
+        """Test that the pruned top-k equals scoring every pair."""
+        rng = random.Random(9)
+        today = date.today()
+        for _ in range(60):
+            index = self._weather_index(rng, today)
+            flights, hotels = _random_scored_options(rng, rng.randrange(1, 40), today)
+            flight_pos = {id(entry[0]): i for i, entry in enumerate(flights)}
+            hotel_pos = {id(entry[0]): j for j, entry in enumerate(hotels)}
+            best, _ = search_combinations(flights, hotels, index)
+            got = [(o["score"], flight_pos[id(o["flight"])], hotel_pos[id(o["hotel"])]) for o in best]
+            assert got == _brute_force_combinations(flights, hotels, index)[:3]
+
+    def test_large_search_is_fast(self):
+        """Test that 1,000 x 1,000 candidates are searched without full enumeration."""
+        rng = random.Random(2)
+        today = date.today()
+        index = self._weather_index(rng, today)
+        flights, hotels = _random_scored_options(rng, 1000, today)
+        start = time.perf_counter()
+        best, _ = search_combinations(flights, hotels, index)
+        assert time.perf_counter() - start < 1.0
+        assert len(best) == 3
+        assert best == sorted(best, key=lambda o: o["score"], reverse=True)
+
+    def test_disjoint_dates_are_fast(self):
+        """Test that 1,000 x 1,000 candidates whose dates never overlap are skipped, not scored."""
+        rng = random.Random(2)
+        today = date.today()
+        index = self._weather_index(rng, today)
+        flights, _ = _random_scored_options(rng, 1000, today)
+        _, hotels = _random_scored_options(rng, 1000, today + timedelta(days=400))
+        start = time.perf_counter()
+        assert search_combinations(flights, hotels, index) == ([], [])
+        assert time.perf_counter() - start < 0.1
+
+    def test_empty_inputs(self):
+        """Test that missing flights or hotels give no combinations."""
+        index = self._weather_index(random.Random(1), date.today())
+        assert search_combinations([], [], index) == ([], [])
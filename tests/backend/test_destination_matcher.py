@@ -0,0 +1,66 @@
+"""Tests for the compiled destination matcher."""
+
+import pytest
+
+from core.matcher import DestinationMatcher, tokenize
+from api_server import extract_all_destinations
+
+
+class TestDestinationMatcher:
+    """Tests for DestinationMatcher."""
+
+    @pytest.fixture
+    def matcher(self):
+        return DestinationMatcher({
+            "delhi": "Delhi",
+            "new delhi": "Delhi",
+            "new york": "New York",
+            "la": "Los Angeles",
+            "rio": "Rio",
+            "rio de janeiro": "Rio",
+        })
+
+    def test_tokenize_strips_punctuation(self):
+        """Test that punctuation separates tokens."""
+        assert tokenize("Paris, or Tokyo?!") == ["paris", "or", "tokyo"]
+
+    def test_longest_match_preferred(self, matcher):
+        """Test that the longest alias at a position wins."""
+        assert matcher.find_all_with_positions("Trip to New Delhi") == [(2, "Delhi")]
+
+    def test_falls_back_to_shorter_alias(self, matcher):
+        """Test that a partial multi-word alias still allows shorter matches."""
+        assert matcher.find_all("new flights to rio de") == ["Rio"]
+
+    def test_word_boundaries_respected(self, matcher):
+        """Test that aliases do not match inside other words."""
+        assert matcher.find_all("I plan to visit Atlanta") == []
+        assert matcher.find_all("Flying to LA next week") == ["Los Angeles"]
+
+    def test_results_in_query_order(self, matcher):
+        """Test that matches are returned in the order they appear."""
+        assert matcher.find_all("New York or Delhi") == ["New York", "Delhi"]
+        assert matcher.find_all("Delhi or New York") == ["Delhi", "New York"]
+
+    def test_find_unique_deduplicates(self, matcher):
+        """Test that repeated destinations are reported once."""
+        assert matcher.find_unique("Delhi, I mean New Delhi") == ["Delhi"]
+
+
+class TestExtractAllDestinations:
+    """Tests for extract_all_destinations in the API server."""
+
+    def test_no_false_positive_for_plan(self):
+        """Test that 'plan' no longer matches Los Angeles."""
+        found = extract_all_destinations("Help me plan a trip to Paris")
+        assert found == [("Paris", "France", "CDG")]
+
+    def test_alias_collapses_to_city(self):
+        """Test that several aliases for one city yield a single destination."""
+        found = extract_all_destinations("Bombay or Mumbai or Delhi?")
+        assert found == [("Mumbai", "India", "BOM"), ("Delhi", "India", "DEL")]
+
+    def test_custom_destination_map(self):
+        """Test that callers can still pass their own alias map."""
+        found = extract_all_destinations("Off to Gotham", {"gotham": ("Gotham", "USA", "GTM")})
+        assert found == [("Gotham", "USA", "GTM")]
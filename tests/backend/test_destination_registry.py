@@ -0,0 +1,91 @@
+"""Tests for the shared destination registry."""
+
+import json
+import pytest
+
+from core.destinations import (
+    Destination,
+    FlightProfile,
+    WeatherProfile,
+    get_registry,
+    load_registry,
+)
+
+
+class TestDestinationRegistry:
+    """Tests for the bundled destination registry."""
+
+    def test_registry_is_loaded_once(self):
+        """Test that the process-wide registry is a singleton."""
+        assert get_registry() is get_registry()
+
+    def test_alias_index(self):
+        """Test lookups by alias."""
+        registry = get_registry()
+        assert registry.by_alias("hawaii").city == "Maui"
+        assert registry.by_alias("Bengaluru").city == "Bangalore"
+        assert registry.by_alias("switzerland").airport_code == "ZRH"
+        assert registry.by_alias("atlantis") is None
+
+    def test_city_and_airport_indexes(self):
+        """Test lookups by canonical city and IATA code."""
+        registry = get_registry()
+        assert registry.by_city("new york").airport_code == "JFK"
+        assert registry.by_city(" Paris ").city == "Paris"
+        assert registry.by_airport("nrt").city == "Tokyo"
+        assert registry.by_airport("XXX") is None
+
+    def test_country_index(self):
+        """Test that every destination in a country is listed."""
+        indian_cities = {d.city for d in get_registry().in_country("India")}
+        assert {"Mumbai", "Delhi", "Bangalore", "Goa"} <= indian_cities
+        assert get_registry().in_country("Atlantis") == ()
+
+    def test_indexes_are_read_only(self):
+        """Test that indexes cannot be mutated by callers."""
+        with pytest.raises(TypeError):
+            get_registry().aliases["gotham"] = None
+
+    def test_weather_profile_fallback(self):
+        """Test weather profiles and the default climate."""
+        registry = get_registry()
+        maui = registry.weather_profile("Maui")
+        assert maui == WeatherProfile(82.0, 3.0, 7, "tropical")
+        assert registry.weather_profile("Atlantis") is registry.default_weather
+        # Known city without a dedicated climate profile
+        assert registry.weather_profile("Pune") is registry.default_weather
+
+    def test_flight_profile_fallback(self):
+        """Test flight profiles and the medium-haul default."""
+        registry = get_registry()
+        assert registry.flight_profile("CDG").airlines == ("Air France", "United")
+        assert registry.flight_profile("XXX").base_price_usd == 700
+
+    def test_alias_locations(self):
+        """Test the alias -> (city, country, airport) view used by the API."""
+        assert get_registry().alias_locations["nyc"] == ("New York", "USA", "JFK")
+
+
+class TestLoadRegistry:
+    """Tests for loading registries from custom data files."""
+
+    def test_load_custom_file(self, tmp_path):
+        """Test loading a registry from a JSON file."""
+        data = {
+            "default_weather": {"base_temp_f": 60, "temp_variation_f": 5, "storm_week": None, "climate": "temperate"},
+            "default_flight": {"duration_hours": 5, "duration_with_layover_hours": 7,
+                               "airlines": ["United"], "base_price_usd": 300},
+            "destinations": [
+                {"city": "Gotham", "country": "USA", "airport": "GTM", "aliases": ["gotham", "the city"]},
+            ],
+        }
+        path = tmp_path / "destinations.json"
+        path.write_text(json.dumps(data))
+
+        registry = load_registry(path)
+
+        assert len(registry) == 1
+        assert registry.by_alias("the city") == Destination(
+            "Gotham", "USA", "GTM", ("gotham", "the city")
+        )
+        assert registry.flight_profile("GTM") == FlightProfile(5.0, 7.0, ("United",), 300)
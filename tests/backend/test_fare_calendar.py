@@ -0,0 +1,124 @@
+"""Tests for the year-ahead fare calendar and its segment tree."""
+
+import pytest
+import random
+from datetime import date, timedelta
+
+from core.destinations import get_registry
+from core.rmq import MinSegmentTree
+from tools.engine import find_cheapest_dates_tool
+from tools.fare_calendar import ADVANCE_PURCHASE_DAYS, FareCalendar, leg_fare
+
+
+@pytest.fixture
+def profile():
+    """Flight profile for Tokyo."""
+    return get_registry().flight_profile("NRT")
+
+
+class TestMinSegmentTree:
+    """Tests for MinSegmentTree."""
+
+    def test_matches_naive_min_with_updates(self):
+        """Test queries against a plain list after random point updates."""
+        rng = random.Random(11)
+        values = [rng.randint(0, 9) for _ in range(37)]
+        tree = MinSegmentTree(len(values), values)
+        for _ in range(300):
+            i = rng.randrange(len(values))
+            values[i] = tree[i] = rng.randint(0, 9)
+            lo, hi = sorted((rng.randrange(len(values)), rng.randrange(len(values))))
+            expected = min(values[lo:hi + 1])
+            assert tree.query(lo, hi) == (expected, values.index(expected, lo))
+
+    def test_empty_range(self):
+        """Test that an empty range returns inf."""
+        tree = MinSegmentTree(4, [1, 2, 3, 4])
+        assert tree.query(3, 1) == (float("inf"), -1)
+
+
+class TestFareCalendar:
+    """Tests for FareCalendar queries and rollover."""
+
+    def test_cheapest_departure(self, profile):
+        """Test range-minimum departure lookup against a scan."""
+        today = date(2026, 3, 2)
+        calendar = FareCalendar(profile, today)
+        start, end = today + timedelta(days=20), today + timedelta(days=50)
+        fares = [leg_fare(profile, start + timedelta(days=i), today) for i in range(31)]
+        day, fare = calendar.cheapest_departure(start, end)
+        assert fare == min(fares)
+        assert day == start + timedelta(days=fares.index(min(fares)))
+
+    def test_cheapest_trip(self, profile):
+        """Test N-night trip lookup against a scan."""
+        today = date(2026, 3, 2)
+        calendar = FareCalendar(profile, today)
+        nights = 9
+        prices = [
+            (calendar.fare(today + timedelta(days=i)) + calendar.fare(today + timedelta(days=i + nights)), i)
+            for i in range(0, 61)
+        ]
+        departure, return_day, price = calendar.cheapest_trip(nights, today, today + timedelta(days=60))
+        assert (price, (departure - today).days) == min(prices)
+        assert (return_day - departure).days == nights
+
+    def test_window_outside_calendar(self, profile):
+        """Test that windows beyond the horizon return None."""
+        today = date(2026, 3, 2)
+        calendar = FareCalendar(profile, today)
+        assert calendar.cheapest_departure(today + timedelta(days=400), today + timedelta(days=500)) is None
+        assert calendar.cheapest_trip(7, today + timedelta(days=360)) is None
+
+    def test_rollover_is_incremental(self, profile):
+        """Test that advancing one day only re-prices the changed days."""
+        today = date(2026, 3, 2)
+        calendar = FareCalendar(profile, today)
+        calendar.cheapest_trip(7)
+
+        tomorrow = today + timedelta(days=1)
+        assert calendar.advance_to(tomorrow) == 1 + ADVANCE_PURCHASE_DAYS
+        assert calendar.start == tomorrow
+
+        rebuilt = FareCalendar(profile, tomorrow)
+        assert calendar.fares() == rebuilt.fares()
+        assert calendar.cheapest_trip(7) == rebuilt.cheapest_trip(7)
+
+    @pytest.mark.parametrize("days", [1, 30, 364, 365, 900, -2])
+    def test_rollover_matches_rebuild(self, profile, days):
+        """Test that any jump leaves the calendar equal to a fresh build."""
+        today = date(2026, 3, 2)
+        calendar = FareCalendar(profile, today)
+        calendar.cheapest_trip(5)
+        later = today + timedelta(days=days)
+        calendar.advance_to(later)
+
+        rebuilt = FareCalendar(profile, later)
+        assert calendar.fares() == rebuilt.fares()
+        window = (later + timedelta(days=100), later + timedelta(days=200))
+        assert calendar.cheapest_departure(*window) == rebuilt.cheapest_departure(*window)
+        assert calendar.cheapest_trip(5, *window) == rebuilt.cheapest_trip(5, *window)
+
+
+class TestFindCheapestDatesTool:
+    """Tests for find_cheapest_dates_tool."""
+
+    def test_departure_and_trip(self):
+        """Test the tool's response shape."""
+        today = date.today()
+        result = find_cheapest_dates_tool(
+            "SFO", "NRT",
+            window_start=(today + timedelta(days=30)).isoformat(),
+            window_end=(today + timedelta(days=120)).isoformat(),
+            nights=7,
+        )
+        assert result["cheapest_departure"]["date"] >= (today + timedelta(days=30)).isoformat()
+        trip = result["cheapest_trip"]
+        assert (date.fromisoformat(trip["return_date"]) - date.fromisoformat(trip["departure_date"])).days == 7
+        assert "Cheapest 7-night trip" in result["summary"]
+
+    def test_window_beyond_year(self):
+        """Test a window past the calendar horizon."""
+        start = (date.today() + timedelta(days=500)).isoformat()
+        result = find_cheapest_dates_tool("SFO", "NRT", window_start=start)
+        assert result["cheapest_departure"] is None
@@ -0,0 +1,235 @@
+"""Tests for the vectorized flight fare grid."""
+
+import pytest
+import numpy as np
+from datetime import date, timedelta
+
+from core.destinations import get_registry
+from tools.engine import search_flights_tool
+from tools.fare_grid import flexible_search, paired_fare_grid, smallest_k
+
+
+def legacy_search(profile, dep_date, ret_date, flexibility_days):
+    """The previous nested-loop search, kept as a reference."""
+    options = []
+    base_prices = [profile.base_price_usd + i * 30 for i in range(7)]
+    for day_offset in range(-flexibility_days, flexibility_days + 1):
+        candidate_dep = dep_date + timedelta(days=day_offset)
+        candidate_ret = ret_date + timedelta(days=day_offset)
+        if candidate_dep >= date.today() and candidate_ret > candidate_dep:
+            day_of_week = candidate_dep.weekday()
+            price = base_prices[day_of_week] + (day_offset * 20) + (50 if day_of_week >= 5 else 0)
+            for variant in range(2):
+                if variant == 1:
+                    price *= 0.85
+                options.append((price, candidate_dep.isoformat(), variant))
+    options.sort(key=lambda x: x[0])
+    return options
+
+
+def brute_force_grid(profile, dep_date, ret_date, dep_flex, ret_flex, min_trip=1, max_trip=None):
+    """Price every cell of the departure x return grid and sort them."""
+    cells = []
+    for dep_offset in range(-dep_flex, dep_flex + 1):
+        dep = dep_date + timedelta(days=dep_offset)
+        if dep < date.today():
+            continue
+        weekday = dep.weekday()
+        base = float(profile.base_price_usd) + 30 * weekday + 20 * dep_offset + (50 if weekday >= 5 else 0)
+        for ret_offset in range(-ret_flex, ret_flex + 1):
+            length = (ret_date + timedelta(days=ret_offset) - dep).days
+            if length < max(1, min_trip) or (max_trip is not None and length > max_trip):
+                continue
+            fare = base + 15 * abs(ret_offset - dep_offset)
+            cells.append((fare, dep_offset, ret_offset, 0))
+            cells.append((fare * 0.85, dep_offset, ret_offset, 1))
+    cells.sort()
+    return cells
+
+
+class TestSmallestK:
+    """Tests for smallest_k top-k selection."""
+
+    def test_matches_stable_sort(self):
+        """Test that selection equals a stable full sort, ties included."""
+        rng = np.random.default_rng(7)
+        values = rng.integers(0, 20, size=500).astype(float)
+        for k in (0, 1, 10, 37, 499, 500, 800):
+            expected = np.argsort(values, kind="stable")[:k]
+            assert smallest_k(values, k).tolist() == expected.tolist()
+
+    def test_empty(self):
+        """Test selection from an empty array."""
+        assert smallest_k(np.array([]), 5).size == 0
+
+
+class TestFareGrid:
+    """Tests for the paired fare grid."""
+
+    @pytest.mark.parametrize("airport", ["OGG", "NRT", "CDG", "XXX"])
+    @pytest.mark.parametrize("flex", [0, 3, 30])
+    def test_matches_legacy_loop(self, airport, flex):
+        """Test that prices and ordering match the nested-loop search."""
+        profile = get_registry().flight_profile(airport)
+        dep = date.today() + timedelta(days=5)
+        ret = dep + timedelta(days=7)
+
+        expected = legacy_search(profile, dep, ret, flex)
+        grid = paired_fare_grid(profile, dep, ret, flex)
+        got = [(o["price_usd"], o["departure_date"], int(o["booking_code"][-1])) for o in grid.options(len(expected))]
+
+        assert grid.size == len(expected)
+        assert got == expected
+
+    def test_past_departures_dropped(self):
+        """Test that candidate departures before today are excluded."""
+        profile = get_registry().flight_profile("OGG")
+        grid = paired_fare_grid(profile, date.today(), date.today() + timedelta(days=7), 5)
+        assert grid.pairs == 6
+        assert all(o["departure_date"] >= date.today().isoformat() for o in grid.options(20))
+
+    def test_tool_returns_top_ten(self):
+        """Test that the tool returns the 10 cheapest of the full grid."""
+        dep = date.today() + timedelta(days=40)
+        result = search_flights_tool("SFO", "NRT", dep.isoformat(), (dep + timedelta(days=7)).isoformat(), 30)
+        prices = [o["price_usd"] for o in result["options"]]
+        assert len(prices) == 10
+        assert prices == sorted(prices)
+        assert result["summary"].startswith("Found 122 flight options")
+
+
+class TestFlexibleSearch:
+    """Tests for the independent departure/return grid search."""
+
+    @pytest.mark.parametrize("dep_flex,ret_flex,min_trip,max_trip", [
+        (14, 14, 1, None),
+        (5, 2, 4, 9),
+        (0, 7, 1, None),
+        (10, 10, 12, 12),
+    ])
+    def test_matches_brute_force(self, dep_flex, ret_flex, min_trip, max_trip):
+        """Test that pruned top-k equals sorting the full grid."""
+        profile = get_registry().flight_profile("NRT")
+        dep = date.today() + timedelta(days=10)
+        ret = dep + timedelta(days=7)
+
+        expected = brute_force_grid(profile, dep, ret, dep_flex, ret_flex, min_trip, max_trip)
+        result = flexible_search(profile, dep, ret, dep_flex, ret_flex, k=10,
+                                 min_trip_days=min_trip, max_trip_days=max_trip)
+        got = [
+            (o["price_usd"],
+             (date.fromisoformat(o["departure_date"]) - dep).days,
+             (date.fromisoformat(o["return_date"]) - ret).days,
+             1 if o["is_red_eye"] else 0)
+            for o in result.options
+        ]
+        assert got == expected[:10]
+        assert result.candidates == len(expected)
+        assert result.evaluated + result.pruned == result.candidates
+
+    def test_diagonal_matches_paired_grid(self):
+        """Test that equal shifts price exactly like the paired search."""
+        profile = get_registry().flight_profile("OGG")
+        dep = date.today() + timedelta(days=20)
+        ret = dep + timedelta(days=7)
+        paired = {(o["departure_date"], o["return_date"], o["is_red_eye"]): o["price_usd"]
+                  for o in paired_fare_grid(profile, dep, ret, 3).options(100)}
+        flexible = {(o["departure_date"], o["return_date"], o["is_red_eye"]): o["price_usd"]
+                    for o in flexible_search(profile, dep, ret, 3, 3, k=1000).options}
+        assert all(flexible[key] == price for key, price in paired.items())
+
+    def test_rows_are_pruned(self):
+        """Test that a wide search prices only a fraction of the grid."""
+        profile = get_registry().flight_profile("NRT")
+        dep = date.today() + timedelta(days=60)
+        result = flexible_search(profile, dep, dep + timedelta(days=7), 14, 14, k=10)
+        assert result.pruned > result.evaluated
+
+    def test_tool_independent_mode(self):
+        """Test the tool's independent flexibility mode and stats."""
+        dep = date.today() + timedelta(days=30)
+        result = search_flights_tool(
+            "SFO", "CDG", dep.isoformat(), (dep + timedelta(days=7)).isoformat(),
+            flexibility_days=14, independent_flexibility=True, min_trip_days=5, max_trip_days=10,
+        )
+        assert len(result["options"]) == 10
+        assert set(result["search_stats"]) == {"candidates", "evaluated", "pruned"}
+        for option in result["options"]:
+            length = (date.fromisoformat(option["return_date"]) - date.fromisoformat(option["departure_date"])).days
+            assert 5 <= length <= 10
+
+    def test_tool_paired_mode_respects_trip_bounds(self):
+        """Test that trip-length bounds also filter the paired search."""
+        dep = date.today() + timedelta(days=30)
+        result = search_flights_tool("SFO", "CDG", dep.isoformat(), (dep + timedelta(days=7)).isoformat(),
+                                     max_trip_days=5)
+        assert result["options"] == []
+
+
+class TestFilterPushdown:
+    """Tests for the price, layover, airline and limit filters on flight search."""
+
+    @pytest.mark.parametrize("max_price,max_layovers", [
+        (1200.0, None),
+        (1000.0, 0),
+        (None, 0),
+        (900.0, 1),
+        (100.0, None),
+    ])
+    def test_flexible_search_matches_filtered_brute_force(self, max_price, max_layovers):
+        """Test that filtered top-k equals filtering then sorting the full grid."""
+        profile = get_registry().flight_profile("NRT")
+        dep = date.today() + timedelta(days=10)
+        ret = dep + timedelta(days=7)
+
+        expected = [
+            cell for cell in brute_force_grid(profile, dep, ret, 10, 10)
+            if (max_price is None or cell[0] <= max_price)
+            and (max_layovers is None or (0 if cell[3] == 1 else 1) <= max_layovers)
+        ]
+        result = flexible_search(profile, dep, ret, 10, 10, k=10,
+                                 max_price=max_price, max_layovers=max_layovers)
+        got = [
+            (o["price_usd"],
+             (date.fromisoformat(o["departure_date"]) - dep).days,
+             (date.fromisoformat(o["return_date"]) - ret).days,
+             1 if o["is_red_eye"] else 0)
+            for o in result.options
+        ]
+        assert got == expected[:10]
+        assert result.candidates == len(expected)
+        assert result.red_eye_options == sum(1 for cell in expected if cell[3] == 1)
+
+    def test_paired_filters_match_post_filtering(self):
+        """Test that paired-mode pushdown equals filtering the unfiltered result."""
+        dep = (date.today() + timedelta(days=20)).isoformat()
+        ret = (date.today() + timedelta(days=27)).isoformat()
+        everything = search_flights_tool("SFO", "OGG", dep, ret, flexibility_days=5, limit=100)
+        cap = sorted(o["price_usd"] for o in everything["options"])[8]
+
+        filtered = search_flights_tool("SFO", "OGG", dep, ret, flexibility_days=5, max_price=cap, limit=3)
+        expected = [o for o in everything["options"] if o["price_usd"] <= cap]
+        assert filtered["options"] == expected[:3]
+        assert filtered["summary"].startswith(f"Found {len(expected)} flight options.")
+
+    def test_layover_and_airline_filters(self):
+        """Test that layover and airline filters select whole itinerary variants."""
+        dep = (date.today() + timedelta(days=20)).isoformat()
+        ret = (date.today() + timedelta(days=27)).isoformat()
+        airline = get_registry().flight_profile("OGG").airlines[0]
+
+        nonstop = search_flights_tool("SFO", "OGG", dep, ret, max_layovers=0)
+        assert nonstop["options"] and all(o["layovers"] == 0 for o in nonstop["options"])
+        carrier = search_flights_tool("SFO", "OGG", dep, ret, brands_only=[airline],
+                                      independent_flexibility=True)
+        assert carrier["options"] and all(o["airline"] == airline for o in carrier["options"])
+
+    def test_no_matches(self):
+        """Test that an impossible price cap returns no options in either mode."""
+        dep = (date.today() + timedelta(days=20)).isoformat()
+        ret = (date.today() + timedelta(days=27)).isoformat()
+        for independent in (False, True):
+            result = search_flights_tool("SFO", "OGG", dep, ret, max_price=1.0,
+                                         independent_flexibility=independent)
+            assert result["options"] == []
+            assert result["summary"].startswith("No flight options")
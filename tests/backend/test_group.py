@@ -0,0 +1,226 @@
+"""Tests for group-trip planning."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from core.analysis import score_flight_option, score_hotel_option, score_weather_period
+from core.group import (
+    DestinationOptions,
+    GroupMember,
+    common_windows,
+    intersect_windows,
+    merge_windows,
+    plan_group_trip,
+)
+from core.models import ComfortLevel, FlightOption, HotelOption, UserProfile, WeatherForecast, WeatherPeriod
+
+TODAY = date(2026, 3, 2)
+BRANDS = ["Marriott", "Hilton", "Hyatt", "Budget Inn"]
+
+
+def day(n):
+    return TODAY + timedelta(days=n)
+
+
+def random_destination(name, rng):
+    periods = [
+        WeatherPeriod(
+            start_date=day(start),
+            end_date=day(start + 9),
+            avg_temp_f=rng.uniform(55, 95),
+            min_temp_f=0.0,
+            max_temp_f=0.0,
+            precipitation_inches=rng.uniform(0, 3),
+            storm_risk=rng.random() < 0.3,
+            conditions_summary="",
+        )
+        for start in range(0, 40, 10)
+    ]
+    flights, hotels = [], []
+    for i in range(25):
+        depart = rng.randrange(0, 34)
+        nights = rng.randrange(2, 5)
+        flights.append(FlightOption(
+            day(depart), day(depart + nights), rng.uniform(200, 900), "United", "08:30", "14:20",
+            rng.random() < 0.3, rng.random() < 0.7, rng.randrange(3), 8.0, f"{name}-FLT-{i}",
+        ))
+        hotels.append(HotelOption(
+            day(depart), day(depart + nights), rng.uniform(80, 400), 0.0, rng.choice(BRANDS),
+            f"{name} Hotel {i}", round(rng.uniform(3.0, 5.0), 1), False, None, f"{name}-HTL-{i}",
+        ))
+    return DestinationOptions(name, WeatherForecast(name, periods, ""), flights, hotels)
+
+
+def random_members(rng, count=3):
+    members = []
+    for i in range(count):
+        soft = rng.uniform(300, 600)
+        profile = UserProfile(
+            user_id=f"member-{i}",
+            preferred_temp_range=(rng.uniform(60, 75), rng.uniform(78, 90)),
+            airfare_budget_soft=soft,
+            airfare_budget_hard=soft + rng.uniform(100, 400),
+            hotel_budget_min=rng.uniform(50, 150),
+            hotel_budget_max=rng.uniform(200, 400),
+            preferred_brands=rng.sample(BRANDS, 1),
+            comfort_level=rng.choice(list(ComfortLevel)),
+            flexibility_days=rng.randrange(5, 12),
+            safety_conscious=rng.random() < 0.5,
+        )
+        members.append(GroupMember.flexible(profile, day(rng.randrange(10, 24))))
+    return members
+
+
+def brute_force(members, destinations, objective):
+    """Every flight x hotel pair, every member scored one at a time."""
+    plans = []
+    for options in destinations:
+        for flight in options.flights:
+            for hotel in options.hotels:
+                if any(
+                    flight.price_usd > m.profile.airfare_budget_hard
+                    or not m.profile.hotel_budget_min <= hotel.nightly_rate_usd <= m.profile.hotel_budget_max
+                    or not any(lo <= flight.departure_date <= hi for lo, hi in m.available)
+                    for m in members
+                ):
+                    continue
+                start = max(flight.departure_date, hotel.check_in_date)
+                end = min(flight.return_date, hotel.check_out_date)
+                covering = [p for p in options.forecast.forecast_periods if p.start_date <= start and end <= p.end_date]
+                if start > end or not covering:
+                    continue
+                weather = next(p for p in options.forecast.forecast_periods if p.start_date <= start <= p.end_date)
+                scores = [
+                    score_weather_period(weather, m.profile)[0] * 0.4
+                    + score_flight_option(flight, m.profile)[0] * 0.3
+                    + score_hotel_option(hotel, m.profile)[0] * 0.3
+                    for m in members
+                ]
+                plans.append((min(scores) if objective == "min" else sum(scores), flight, hotel))
+    plans.sort(key=lambda plan: -plan[0])
+    return plans
+
+
+class TestDateWindows:
+    """Test sorted interval intersection of availability windows."""
+
+    def test_matches_day_sets(self):
+        """Test intersection equals intersecting the sets of days."""
+        rng = random.Random(5)
+
+        def days(windows):
+            return {lo + timedelta(days=d) for lo, hi in windows for d in range((hi - lo).days + 1)}
+
+        for _ in range(200):
+            a, b = (
+                merge_windows([(day(s), day(s + rng.randrange(6))) for s in rng.sample(range(60), 6)])
+                for _ in range(2)
+            )
+            assert days(intersect_windows(a, b)) == days(a) & days(b)
+
+    def test_merge_windows(self):
+        """Test overlapping and adjacent windows merge, empty ones drop."""
+        assert merge_windows([(day(5), day(8)), (day(0), day(2)), (day(3), day(4)), (day(9), day(7))]) == [
+            (day(0), day(8))
+        ]
+
+    def test_common_windows(self):
+        """Test the group can only leave when everyone can."""
+        members = [
+            GroupMember(UserProfile(user_id="a"), ((day(0), day(5)), (day(10), day(20)))),
+            GroupMember(UserProfile(user_id="b"), ((day(3), day(12)),)),
+            GroupMember.flexible(UserProfile(user_id="c", flexibility_days=4), day(8)),
+        ]
+        assert common_windows(members) == [(day(4), day(5)), (day(10), day(12))]
+        assert common_windows([]) == []
+
+
+class TestGroupPlanning:
+    """Test the group-trip optimizer against brute force."""
+
+    @pytest.mark.parametrize("objective", ["min", "sum"])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_brute_force(self, objective, seed):
+        """Test plans match scoring every member one pair at a time."""
+        rng = random.Random(seed)
+        destinations = [random_destination(name, rng) for name in ("Maui", "Bali", "Cancun")]
+        members = random_members(rng)
+        expected = brute_force(members, destinations, objective)
+        plans = plan_group_trip(members, destinations, objective=objective, k=5)
+
+        assert [(p.flight, p.hotel) for p in plans] == [(f, h) for _, f, h in expected[:5]]
+        for plan, (value, _, _) in zip(plans, expected):
+            assert plan.score == pytest.approx(value)
+            scores = plan.member_scores.values()
+            assert plan.score == pytest.approx(min(scores) if objective == "min" else sum(scores))
+
+    def test_respects_hard_budgets_and_windows(self):
+        """Test every plan fits every member's budget and availability."""
+        rng = random.Random(11)
+        destinations = [random_destination(name, rng) for name in ("Maui", "Bali")]
+        members = random_members(rng, count=4)
+        plans = plan_group_trip(members, destinations, k=20)
+        assert plans
+        for plan in plans:
+            for member in members:
+                assert plan.flight.price_usd <= member.profile.airfare_budget_hard
+                assert member.profile.hotel_budget_min <= plan.hotel.nightly_rate_usd <= member.profile.hotel_budget_max
+                assert any(lo <= plan.flight.departure_date <= hi for lo, hi in member.available)
+
+    def test_hotels_below_any_members_minimum_are_rejected(self):
+        """Test hotels are held to the strictest member's budget range, minimum included."""
+        rng = random.Random(9)
+        options = random_destination("Maui", rng)
+        window = ((day(0), day(40)),)
+        members = [
+            GroupMember(UserProfile(user_id="a", hotel_budget_min=50, hotel_budget_max=400), window),
+            GroupMember(UserProfile(user_id="b", hotel_budget_min=150, hotel_budget_max=300), window),
+        ]
+        plans = plan_group_trip(members, [options], k=50)
+        assert plans
+        assert all(150 <= plan.hotel.nightly_rate_usd <= 300 for plan in plans)
+        cheap = [h for h in options.hotels if h.nightly_rate_usd < 150]
+        assert cheap and not any(plan.hotel in cheap for plan in plans)
+
+    def test_only_overlapping_stays_are_paired(self, monkeypatch):
+        """Test flights are never checked against hotels whose stay misses their dates."""
+        import core.group
+
+        calls = []
+        real = core.group.find_overlapping_periods
+        monkeypatch.setattr(
+            core.group, "find_overlapping_periods",
+            lambda *args: calls.append(args) or real(*args),
+        )
+        rng = random.Random(7)
+        options = random_destination("Maui", rng)
+        members = [GroupMember(UserProfile(user_id="a", hotel_budget_max=1000), ((day(0), day(40)),))]
+        late = [
+            HotelOption(day(60 + i), day(63 + i), 100.0, 0.0, "Hilton", f"Late {i}", 4.0, False, None)
+            for i in range(200)
+        ]
+        disjoint = DestinationOptions("Maui", options.forecast, options.flights, late)
+        assert plan_group_trip(members, [disjoint]) == []
+        assert calls == []
+
+        plan_group_trip(members, [options])
+        assert calls
+        assert all(
+            hotel[0] <= flight[1] and flight[0] <= hotel[1] for _, flight, hotel in calls
+        )
+
+    def test_no_shared_dates(self):
+        """Test disjoint availability yields no plan."""
+        rng = random.Random(3)
+        members = [
+            GroupMember(UserProfile(user_id="a"), ((day(0), day(3)),)),
+            GroupMember(UserProfile(user_id="b"), ((day(10), day(13)),)),
+        ]
+        assert plan_group_trip(members, [random_destination("Maui", rng)]) == []
+
+    def test_unknown_objective(self):
+        """Test unknown objectives raise ValueError."""
+        with pytest.raises(ValueError):
+            plan_group_trip([], [], objective="median")
@@ -0,0 +1,98 @@
+"""Tests for the budget/brand/rating hotel index."""
+
+import pytest
+import random
+from operator import itemgetter
+
+from core.hotel_index import HotelIndex
+from tools.hotel_rates import get_catalog_index
+
+
+BRANDS = ["Marriott", "Hilton", "Hyatt", "Westin", "Four Seasons", "Budget Inn"]
+
+
+def make_hotels(n, seed=5):
+    """Random hotel dicts with repeated rates and ratings."""
+    rng = random.Random(seed)
+    return [
+        {
+            "name": f"Hotel {i}",
+            "brand": rng.choice(BRANDS),
+            "nightly_rate_usd": float(rng.randrange(80, 600, 10)),
+            "rating": rng.choice([3.0, 3.5, 4.0, 4.2, 4.5, 5.0]),
+        }
+        for i in range(n)
+    ]
+
+
+def build(hotels):
+    return HotelIndex(
+        hotels,
+        rate=itemgetter("nightly_rate_usd"),
+        brand=itemgetter("brand"),
+        rating=itemgetter("rating"),
+    )
+
+
+def naive(hotels, min_rate=None, max_rate=None, brands=None, min_rating=None):
+    """Linear-scan reference, cheapest first with input order on ties."""
+    matches = [
+        h for h in hotels
+        if (min_rate is None or h["nightly_rate_usd"] >= min_rate)
+        and (max_rate is None or h["nightly_rate_usd"] <= max_rate)
+        and (brands is None or h["brand"] in brands)
+        and (min_rating is None or h["rating"] >= min_rating)
+    ]
+    return sorted(matches, key=itemgetter("nightly_rate_usd"))
+
+
+class TestHotelIndex:
+    """Tests for HotelIndex queries."""
+
+    def test_budget_range(self):
+        """Test bisect range queries against a linear scan."""
+        hotels = make_hotels(500)
+        index = build(hotels)
+        for lo, hi in [(100, 250), (150, 150), (0, 1000), (700, 900), (300, 200)]:
+            assert index.in_budget(lo, hi) == naive(hotels, lo, hi)
+            assert index.count_in_budget(lo, hi) == len(naive(hotels, lo, hi))
+            outside = [h for h in naive(hotels) if h not in naive(hotels, lo, hi)]
+            assert index.outside_budget(lo, hi) == outside
+
+    @pytest.mark.parametrize("brands,min_rating", [
+        (["Hilton"], None),
+        (["Marriott", "Hyatt"], 4.0),
+        (None, 4.5),
+        (["Nonexistent"], None),
+        ([], None),
+        (None, 5.5),
+    ])
+    def test_combined_filters(self, brands, min_rating):
+        """Test budget, brand and rating filters together."""
+        hotels = make_hotels(800)
+        index = build(hotels)
+        expected = naive(hotels, 120, 400, brands, min_rating)
+        assert index.query(120, 400, brands=brands, min_rating=min_rating) == expected
+        assert index.count(120, 400, brands=brands, min_rating=min_rating) == len(expected)
+
+    def test_limit(self):
+        """Test that limit returns the cheapest matches."""
+        hotels = make_hotels(300)
+        index = build(hotels)
+        assert index.query(brands=["Westin"], limit=5) == naive(hotels, brands=["Westin"])[:5]
+        assert index.query(limit=0) == []
+
+    def test_top_rated(self):
+        """Test the rating-sorted secondary index."""
+        hotels = make_hotels(300)
+        index = build(hotels)
+        in_range = naive(hotels, 100, 300)
+        expected = sorted(in_range, key=lambda h: -h["rating"])[:10]
+        assert index.top_rated(10, 100, 300) == expected
+
+    def test_catalog_index(self):
+        """Test the per-destination property catalog index."""
+        index = get_catalog_index("Maui")
+        assert len(index) == 6
+        assert [p.brand for p in index.query(max_rate=200)] == ["Marriott", "Hilton", "Hyatt"]
+        assert index.query(brands=["Four Seasons"])[0].base_rate_usd == 280.0
@@ -0,0 +1,100 @@
+"""Tests for the per-night hotel rate calendar."""
+
+import pytest
+import numpy as np
+from datetime import date, timedelta
+
+from tools.engine import search_hotels_tool
+from tools.hotel_rates import WEEKEND_NIGHT_PREMIUM, HotelRateCalendar, get_rate_calendar
+
+
+class TestHotelRateCalendar:
+    """Tests for HotelRateCalendar."""
+
+    def test_stay_total_is_sum_of_nights(self):
+        """Test that prefix-sum totals equal summing each night."""
+        start = date(2026, 5, 4)  # Monday
+        calendar = HotelRateCalendar("Maui", start)
+        for offset, nights in [(0, 1), (3, 4), (10, 14), (360, 5)]:
+            expected = calendar.rates[:, offset:offset + nights].sum(axis=1)
+            totals = calendar.stay_totals(start + timedelta(days=offset), nights)
+            np.testing.assert_allclose(totals, expected)
+
+    def test_weekend_nights_cost_more(self):
+        """Test that Friday and Saturday nights carry the premium."""
+        calendar = HotelRateCalendar("Maui", date(2026, 5, 4))  # Monday
+        marriott = calendar.rates[0]
+        assert marriott[4] == pytest.approx(marriott[0] * WEEKEND_NIGHT_PREMIUM)  # Friday
+        assert marriott[5] == pytest.approx(marriott[0] * WEEKEND_NIGHT_PREMIUM)  # Saturday
+        assert marriott[6] == marriott[0]  # Sunday
+
+    def test_price_stays_matches_single_stays(self):
+        """Test that the batch grid equals pricing each stay separately."""
+        start = date(2026, 5, 4)
+        calendar = HotelRateCalendar("Paris", start)
+        first = start + timedelta(days=20)
+        lengths = [1, 3, 7, 14]
+        grid = calendar.price_stays(first, 30, lengths)
+        assert grid.shape == (len(calendar.properties), 30, len(lengths))
+        for c in (0, 11, 29):
+            for l, nights in enumerate(lengths):
+                np.testing.assert_allclose(grid[:, c, l], calendar.stay_totals(first + timedelta(days=c), nights))
+
+    def test_price_stays_outside_calendar_is_nan(self):
+        """Test that stays running past the horizon are nan."""
+        start = date(2026, 5, 4)
+        calendar = HotelRateCalendar("Paris", start, days=30)
+        grid = calendar.price_stays(start + timedelta(days=25), 3, [2, 7])
+        assert not np.isnan(grid[:, 0, 0]).any()
+        assert np.isnan(grid[:, 0, 1]).all()
+
+    def test_quote_stays_matches_tool(self):
+        """Test that discounted batch quotes equal the hotel tool's totals."""
+        today = date.today()
+        calendar = get_rate_calendar("Bali")
+        first = today + timedelta(days=10)
+        brands = ["Hilton"]
+        quotes = calendar.quote_stays(first, 14, [5], preferred_brands=brands)
+        for c in range(14):
+            check_in = first + timedelta(days=c)
+            result = search_hotels_tool("Bali", check_in.isoformat(), (check_in + timedelta(days=5)).isoformat(), brands)
+            by_brand = {o["brand"]: o["total_price_usd"] for o in result["options"]}
+            for prop in calendar.properties:
+                assert quotes[prop.index, c, 0] == pytest.approx(by_brand[prop.brand])
+
+    def test_tool_nightly_rate_is_average(self):
+        """Test that the tool reports the average nightly rate of the stay."""
+        check_in = date.today() + timedelta(days=30)
+        result = search_hotels_tool("Rome", check_in.isoformat(), (check_in + timedelta(days=7)).isoformat())
+        for option in result["options"]:
+            assert option["nightly_rate_usd"] * 7 == pytest.approx(option["total_price_usd"])
+
+
+class TestHotelFilterPushdown:
+    """Tests for the price, rating, brand and limit filters on hotel search."""
+
+    def _dates(self):
+        check_in = date.today() + timedelta(days=12)
+        return check_in.isoformat(), (check_in + timedelta(days=4)).isoformat()
+
+    def test_filters_match_post_filtering(self):
+        """Test that pushed-down filters equal filtering the full result."""
+        check_in, check_out = self._dates()
+        everything = search_hotels_tool("Maui", check_in, check_out, ["Hilton"])["options"]
+        filtered = search_hotels_tool("Maui", check_in, check_out, ["Hilton"],
+                                      max_price=260.0, min_rating=3.4)["options"]
+        assert filtered == [o for o in everything if o["nightly_rate_usd"] <= 260.0 and o["rating"] >= 3.4]
+
+    def test_brands_only_and_limit(self):
+        """Test brand restriction and the result limit."""
+        check_in, check_out = self._dates()
+        result = search_hotels_tool("Maui", check_in, check_out, brands_only=["Hyatt", "Westin", "Hilton"], limit=2)
+        assert [o["brand"] for o in result["options"]] == ["Hilton", "Hyatt"]
+        assert result["summary"].startswith("Found 3 hotel options.")
+
+    def test_no_matches(self):
+        """Test that filters excluding every hotel give an empty result."""
+        check_in, check_out = self._dates()
+        result = search_hotels_tool("Maui", check_in, check_out, max_price=10.0)
+        assert result["options"] == []
+        assert result["summary"] == "No hotel options match the requested filters."
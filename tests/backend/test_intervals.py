@@ -0,0 +1,68 @@
+"""Tests for the sorted interval index."""
+
+import random
+from datetime import date, timedelta
+
+from core.analysis import find_overlapping_periods, index_weather_periods
+from core.intervals import IntervalIndex
+
+
+def brute_stab(spans, point):
+    for position, (lo, hi) in enumerate(spans):
+        if lo <= point <= hi:
+            return position
+    return -1
+
+
+def brute_covers(spans, lo, hi):
+    return any(s <= lo and hi <= e for s, e in spans)
+
+
+class TestIntervalIndex:
+    """Tests for IntervalIndex stabbing and containment queries."""
+
+    def test_matches_brute_force_with_overlaps(self):
+        """Test random overlapping, nested and inverted intervals against a scan."""
+        rng = random.Random(5)
+        for _ in range(200):
+            spans = []
+            for _ in range(rng.randrange(0, 12)):
+                lo = rng.randrange(0, 40)
+                spans.append((lo, lo + rng.randrange(-3, 15)))
+            index = IntervalIndex(spans, start=lambda s: s[0], end=lambda s: s[1])
+            for point in range(-2, 60):
+                assert index.stab_position(point) == brute_stab(spans, point)
+            for _ in range(30):
+                lo = rng.randrange(-2, 50)
+                hi = lo + rng.randrange(0, 10)
+                assert index.covers(lo, hi) == brute_covers(spans, lo, hi)
+
+    def test_continuous_bounds_are_inclusive(self):
+        """Test that closed ends hold for non-integer bounds."""
+        index = IntervalIndex([(1.0, 2.5), (2.5, 4.0)], start=lambda s: s[0], end=lambda s: s[1])
+        assert index.stab_position(2.5) == 0
+        assert index.stab_position(2.50001) == 1
+        assert index.stab(4.5) is None
+
+    def test_empty(self):
+        """Test that an empty index matches nothing."""
+        index = IntervalIndex([], start=lambda s: s[0], end=lambda s: s[1])
+        assert index.stab(3) is None
+        assert not index.covers(1, 2)
+
+
+class TestWeatherPeriodIndex:
+    """Tests for find_overlapping_periods with an interval index."""
+
+    def test_index_matches_list(self, sample_weather_forecast):
+        """Test that indexed and list-based overlap checks agree."""
+        periods = sample_weather_forecast.forecast_periods
+        index = index_weather_periods(periods)
+        today = date.today()
+        for start in range(-3, 30):
+            for length in range(0, 10):
+                for shift in (0, 2):
+                    flight = (today + timedelta(days=start), today + timedelta(days=start + length))
+                    hotel = (flight[0] + timedelta(days=shift), flight[1])
+                    assert find_overlapping_periods(index, flight, hotel) == \
+                        find_overlapping_periods(periods, flight, hotel)
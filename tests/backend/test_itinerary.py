@@ -0,0 +1,186 @@
+"""Tests for multi-city itinerary planning."""
+
+import itertools
+import random
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from core.models import WeatherPeriod
+from core.profiles import MOCK_PROFILES
+from tools.engine import get_weather_forecast_tool, plan_itinerary_tool
+from tools.itinerary import MAX_CITIES, plan_itinerary, solve_route
+
+CITIES = ["Paris", "Tokyo", "Bali", "Maui", "London", "Dubai", "Singapore", "Sydney"]
+
+
+def compositions(total, parts, smallest):
+    """Every way to split ``total`` nights into ``parts`` stays of at least ``smallest``."""
+    if parts == 1:
+        if total >= smallest:
+            yield (total,)
+        return
+    for first in range(smallest, total - smallest * (parts - 1) + 1):
+        for rest in compositions(total - first, parts - 1, smallest):
+            yield (first,) + rest
+
+
+def brute_force(legs, home, stays, min_nights):
+    k, days = stays.shape[0], stays.shape[1]
+    best = np.inf
+    for order in itertools.permutations(range(k)):
+        for nights in compositions(days, k, min_nights):
+            cost, day, previous = 0.0, 0, k
+            for city, n in zip(order, nights):
+                cost += legs[previous, city, day] + stays[city, day, n]
+                day, previous = day + n, city
+            best = min(best, cost + home[previous, days])
+    return best
+
+
+def random_instance(rng, k, days):
+    legs = np.array([[[rng.uniform(50, 400) for _ in range(days + 1)] for _ in range(k)] for _ in range(k + 1)])
+    home = np.array([[rng.uniform(50, 400) for _ in range(days + 1)] for _ in range(k)])
+    stays = np.array([
+        [[rng.uniform(40, 200) * n if rng.random() < 0.8 else np.inf for n in range(days + 1)] for _ in range(days)]
+        for _ in range(k)
+    ])
+    for c in range(k):
+        legs[c, c] = np.inf
+    return legs, home, stays
+
+
+def forecasts_for(cities, start, days):
+    return [
+        [
+            WeatherPeriod(date.fromisoformat(p["start_date"]), date.fromisoformat(p["end_date"]), p["avg_temp_f"],
+                          p["avg_temp_f"], p["avg_temp_f"], 0.0, p["storm_risk"], p["storm_severity"], "")
+            for p in get_weather_forecast_tool(city, start.isoformat(), days)["periods"]
+        ]
+        for city in cities
+    ]
+
+
+class TestSolveRoute:
+    """Test the (visited set, city, day) DP against exhaustive search."""
+
+    @pytest.mark.parametrize("seed", range(12))
+    def test_matches_brute_force(self, seed):
+        """Test the optimal cost and that the returned route achieves it."""
+        rng = random.Random(seed)
+        k, days, min_nights = rng.randint(1, 4), rng.randint(4, 10), rng.randint(1, 2)
+        legs, home, stays = random_instance(rng, k, days)
+        expected = brute_force(legs, home, stays, min_nights)
+        solved = solve_route(legs, home, stays, min_nights)
+        if not np.isfinite(expected):
+            assert solved is None
+            return
+        total, route = solved
+        assert total == pytest.approx(expected)
+
+        cost, day, previous = 0.0, 0, k
+        for city, arrival, nights in route:
+            assert arrival == day and nights >= min_nights
+            cost += legs[previous, city, day] + stays[city, day, nights]
+            day, previous = day + nights, city
+        assert day == days
+        assert sorted(city for city, _, _ in route) == list(range(k))
+        assert cost + home[previous, days] == pytest.approx(total)
+
+    def test_too_few_days(self):
+        """Test no route when the cities cannot all get their minimum nights."""
+        legs, home, stays = random_instance(random.Random(1), 3, 5)
+        assert solve_route(legs, home, stays, min_nights=2) is None
+
+
+class TestPlanItinerary:
+    """Test itinerary planning over the mock fare and hotel data."""
+
+    def test_eight_cities_three_weeks_is_fast(self):
+        """Test the largest supported trip plans in well under a second."""
+        profile = MOCK_PROFILES["user_123"]
+        start = date.today() + timedelta(days=14)
+        forecasts = forecasts_for(CITIES, start, 21)
+        began = time.perf_counter()
+        itinerary = plan_itinerary(profile, "SFO", CITIES, start, 21, forecasts)
+        elapsed = time.perf_counter() - began
+
+        assert elapsed < 1.0
+        assert sorted(stop.city for stop in itinerary.stops) == sorted(CITIES)
+        assert sum(stop.nights for stop in itinerary.stops) == 21
+        assert itinerary.return_date == start + timedelta(days=21)
+        arrival = start
+        for stop in itinerary.stops:
+            assert stop.arrival_date == arrival and stop.nights >= 2
+            assert stop.hotel_usd / stop.nights <= profile.hotel_budget_max
+            arrival += timedelta(days=stop.nights)
+        assert itinerary.total_usd == pytest.approx(
+            sum(s.flight_usd + s.hotel_usd for s in itinerary.stops) + itinerary.return_flight_usd
+        )
+
+    def test_weather_floor(self):
+        """Test a minimum weather score keeps every night above it, or finds no route."""
+        profile = MOCK_PROFILES["user_123"]
+        start = date.today() + timedelta(days=14)
+        cities = ["Bali", "Maui", "Singapore"]
+        itinerary = plan_itinerary(profile, "SFO", cities, start, 10, forecasts_for(cities, start, 10),
+                                   min_weather_score=0.8)
+        assert itinerary is not None
+        assert all(stop.weather_score >= 0.8 for stop in itinerary.stops)
+        cold = ["Paris", "London"]
+        assert plan_itinerary(profile, "SFO", cold, start, 10, forecasts_for(cold, start, 10),
+                              min_weather_score=0.8) is None
+
+    def test_validation(self):
+        """Test unsupported requests raise ValueError."""
+        profile = MOCK_PROFILES["default"]
+        start = date.today()
+        with pytest.raises(ValueError):
+            plan_itinerary(profile, "SFO", CITIES + ["Goa"], start, 21, [[]] * (MAX_CITIES + 1))
+        with pytest.raises(ValueError):
+            plan_itinerary(profile, "SFO", ["Paris", "paris"], start, 10, [[], []])
+        with pytest.raises(ValueError):
+            plan_itinerary(profile, "SFO", ["Paris"], start, 45, [[]])
+
+
+class TestPlanItineraryTool:
+    """Test the itinerary tool's dictionary output."""
+
+    def test_plans_route(self):
+        """Test stops, totals and summary for a three-city trip."""
+        result = plan_itinerary_tool("user_123", "SFO", ["Paris", "Rome", "Barcelona"], days=14)
+        assert sorted(stop["city"] for stop in result["stops"]) == ["Barcelona", "Paris", "Rome"]
+        assert sum(stop["nights"] for stop in result["stops"]) == 14
+        assert "Cheapest route: SFO ->" in result["summary"]
+
+    def test_reports_problems(self):
+        """Test infeasible and invalid requests come back as summaries."""
+        assert plan_itinerary_tool("user_123", "SFO", ["Paris", "Rome"], days=3)["stops"] == []
+        assert "Cannot plan" in plan_itinerary_tool("user_123", "SFO", ["Paris", "Paris"])["summary"]
+
+    @pytest.mark.parametrize("days", [0, -3])
+    def test_rejects_non_positive_days(self, days):
+        """Test a trip of no days is reported before any forecast is fetched."""
+        result = plan_itinerary_tool("user_123", "SFO", ["Paris", "Rome"], "2026-11-20", days)
+        assert result["stops"] == []
+        assert result["summary"] == f"Cannot plan this itinerary: Itineraries span 1 to 30 days, got {days}."
+
+    def test_rejects_same_city_spelled_differently(self):
+        """Test duplicates are caught after trimming and lower-casing, as the registry does."""
+        result = plan_itinerary_tool("default", "SFO", ["Paris", "paris "], "2026-11-20", 14)
+        assert result["stops"] == []
+        assert result["summary"] == "Cannot plan this itinerary: Each city can only be visited once."
+
+    @pytest.mark.parametrize("min_nights", [0, -3])
+    def test_rejects_non_positive_min_nights(self, min_nights):
+        """Test a stay of no nights is rejected instead of treated as one night."""
+        result = plan_itinerary_tool("user_123", "SFO", ["Paris", "Rome"], "2026-11-20", 14, min_nights)
+        assert result["stops"] == []
+        assert result["summary"] == f"Cannot plan this itinerary: Each city needs at least 1 night, got {min_nights}."
+
+    def test_rejects_too_many_cities(self):
+        """Test the city limit is enforced through the tool."""
+        cities = ["Paris", "Rome", "Barcelona", "London", "Tokyo", "Miami", "Denver", "Boston", "Seattle"]
+        assert "Cannot plan" in plan_itinerary_tool("user_123", "SFO", cities, "2026-11-20", 14)["summary"]
@@ -0,0 +1,137 @@
+"""Tests for core.metrics and the /api/metrics endpoint."""
+
+import pytest
+import json
+
+from core.metrics import MetricsRegistry
+from api_server import app, STAGE_LATENCY, REQUEST_LATENCY, REQUEST_ERRORS
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app."""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+class TestMetricsRegistry:
+    """Tests for counters, gauges and histograms."""
+
+    def test_counter(self):
+        """Test that counters accumulate per label set."""
+        registry = MetricsRegistry()
+        errors = registry.counter("errors_total", "Errors.", ("stage",))
+        errors.inc(stage="flights")
+        errors.inc(2, stage="flights")
+        errors.inc(stage="hotels")
+        assert errors.value(stage="flights") == 3
+        assert 'errors_total{stage="hotels"} 1' in registry.render()
+
+    def test_wrong_labels_rejected(self):
+        """Test that label names must match the declaration."""
+        registry = MetricsRegistry()
+        errors = registry.counter("errors_total", "Errors.", ("stage",))
+        with pytest.raises(ValueError):
+            errors.inc(endpoint="/api/recommend")
+
+    def test_duplicate_name_rejected(self):
+        """Test that a metric name can only be registered once."""
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests.")
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests.")
+
+    def test_callback_gauge(self):
+        """Test that callback gauges are read at render time."""
+        registry = MetricsRegistry()
+        state = {"ratio": 0.25}
+        registry.gauge("hit_ratio", "Hit ratio.", function=lambda: state["ratio"])
+        assert "hit_ratio 0.25" in registry.render()
+        state["ratio"] = 0.5
+        assert "hit_ratio 0.5" in registry.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram bucket, sum and count rendering."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            latency.observe(value, stage="flights")
+
+        text = registry.render()
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{stage="flights",le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{stage="flights",le="1"} 3' in text
+        assert 'latency_seconds_bucket{stage="flights",le="+Inf"} 4' in text
+        assert 'latency_seconds_sum{stage="flights"} 2.65' in text
+        assert 'latency_seconds_count{stage="flights"} 4' in text
+
+    def test_histogram_time_records_on_error(self):
+        """Test that the timer observes even when the block raises."""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency.", ("stage",))
+        with pytest.raises(RuntimeError):
+            with latency.time(stage="hotels"):
+                raise RuntimeError("provider down")
+        assert latency.count(stage="hotels") == 1
+
+    def test_label_values_escaped(self):
+        """Test that quotes and backslashes in label values are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("c_total", "C.", ("endpoint",)).inc(endpoint='a"b\\c')
+        assert 'c_total{endpoint="a\\"b\\\\c"} 1' in registry.render()
+
+    def test_metric_base_is_abstract(self):
+        """Test that the shared metric base cannot be instantiated without a render."""
+        from core.metrics import _Metric
+        with pytest.raises(TypeError):
+            _Metric("base", "Base.")
+
+
+class TestMetricsEndpoint:
+    """Tests for the /api/metrics endpoint."""
+
+    def test_stages_and_endpoints_recorded(self, client):
+        """Test that a recommendation records stage and request latency."""
+        before = STAGE_LATENCY.count(endpoint="/api/recommend", stage="flights")
+        client.post('/api/recommend',
+                    data=json.dumps({"query": "Should I go to Maui?", "userId": "default"}),
+                    content_type='application/json')
+        assert STAGE_LATENCY.count(endpoint="/api/recommend", stage="flights") == before + 1
+        assert REQUEST_LATENCY.count(endpoint="/api/recommend", method="POST", status="200") >= 1
+
+        response = client.get('/api/metrics')
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain")
+        text = response.get_data(as_text=True)
+        for stage in ("profile", "visa", "weather", "flights", "hotels", "synthesis"):
+            assert f'travel_genie_stage_duration_seconds_count{{endpoint="/api/recommend",stage="{stage}"}}' in text
+        assert "travel_genie_response_cache_hit_ratio " in text
+
+    def test_stages_recorded_per_endpoint(self, client):
+        """Test that streamed and batched recommendations keep their own stage series."""
+        endpoints = ("/api/recommend", "/api/recommend/stream", "/api/recommend/batch")
+        before = {e: STAGE_LATENCY.count(endpoint=e, stage="flights") for e in endpoints}
+        client.get('/api/recommend/stream', query_string={"query": "Should I go to Maui?"}).get_data()
+        assert STAGE_LATENCY.count(endpoint="/api/recommend/stream", stage="flights") == before["/api/recommend/stream"] + 1
+
+        client.post('/api/recommend/batch',
+                    data=json.dumps([{"query": "When should I visit Tokyo?"}]),
+                    content_type='application/json').get_data()
+        assert STAGE_LATENCY.count(endpoint="/api/recommend/batch", stage="flights") == before["/api/recommend/batch"] + 1
+        assert STAGE_LATENCY.count(endpoint="/api/recommend", stage="flights") == before["/api/recommend"]
+
+    def test_errors_counted(self, client, monkeypatch):
+        """Test that endpoint failures increment the error counter."""
+        import api_server
+
+        def boom(query, user_id):
+            raise RuntimeError("tool failure")
+
+        monkeypatch.setattr(api_server, "get_travel_recommendation", boom)
+        before = REQUEST_ERRORS.value(endpoint="/api/recommend")
+        client.post('/api/recommend',
+                    data=json.dumps({"query": "Maui"}),
+                    content_type='application/json')
+        assert REQUEST_ERRORS.value(endpoint="/api/recommend") == before + 1
+        assert 'status="500"' in client.get('/api/metrics').get_data(as_text=True)
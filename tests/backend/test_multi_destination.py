@@ -334,3 +334,76 @@ class TestNoDestinationHandling:
         
         # Should NOT have the "couldn't identify" message
         assert "couldn't identify" not in recommendation.lower()
+
+
+class TestConcurrentDestinationFetch:
+    """Tests for the bounded-concurrency destination fan-out."""
+
+    DESTINATIONS = [
+        ("Paris", "France", "CDG"),
+        ("Tokyo", "Japan", "NRT"),
+        ("London", "UK", "LHR"),
+        ("Dubai", "UAE", "DXB"),
+    ]
+
+    def _profile(self):
+        from agent.coordinator import get_user_profile_tool
+        return get_user_profile_tool("default")
+
+    def test_bundles_keep_input_order(self):
+        """Test that bundles are returned in destination order."""
+        from api_server import fetch_destination_bundles
+        from core.memo import ToolMemo
+
+        bundles = fetch_destination_bundles(
+            ToolMemo(), self.DESTINATIONS, self._profile(),
+            "2030-01-15", "2030-01-22", max_workers=2,
+        )
+
+        assert [b["weather"]["destination"] for b in bundles] == ["Paris", "Tokyo", "London", "Dubai"]
+        assert [b["flights"]["destination"] for b in bundles] == ["CDG", "NRT", "LHR", "DXB"]
+
+    def test_fetches_run_in_parallel(self, monkeypatch):
+        """Test that comparison latency tracks the slowest destination, not the sum."""
+        import time
+        import api_server
+        from core.memo import ToolMemo
+
+        original = api_server._fetch_destination_bundle
+
+        def slow_bundle(*args, **kwargs):
+            time.sleep(0.2)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(api_server, "_fetch_destination_bundle", slow_bundle)
+
+        started = time.monotonic()
+        bundles = api_server.fetch_destination_bundles(
+            ToolMemo(), self.DESTINATIONS, self._profile(),
+            "2030-01-15", "2030-01-22", max_workers=4,
+        )
+        elapsed = time.monotonic() - started
+
+        assert all(b is not None for b in bundles)
+        assert elapsed < 0.6
+
+    def test_timed_out_destination_is_reported_unavailable(self, monkeypatch):
+        """Test that a slow destination does not block the comparison."""
+        import time
+        import api_server
+
+        original = api_server._fetch_destination_bundle
+
+        def stalled_tokyo(memo, destination, *args, **kwargs):
+            if destination[0] == "Tokyo":
+                time.sleep(1.0)
+            return original(memo, destination, *args, **kwargs)
+
+        monkeypatch.setattr(api_server, "_fetch_destination_bundle", stalled_tokyo)
+        monkeypatch.setattr(api_server, "COMPARISON_TIMEOUT_SECONDS", 0.2)
+
+        result = api_server.get_travel_recommendation("Paris or Tokyo?", "default")
+
+        assert "1. Paris" in result
+        assert "unavailable" in result
+        assert "QUICK COMPARISON SUMMARY" in result
@@ -0,0 +1,146 @@
+"""Tests for the /api/recommend response cache."""
+
+import pytest
+import json
+
+from core.cache import TTLCache
+from api_server import app, RESPONSE_CACHE
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app."""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_put(self):
+        """Test storing and reading a value."""
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_entries_expire(self):
+        """Test that entries are dropped after their TTL."""
+        clock = FakeClock()
+        cache = TTLCache(max_entries=2, ttl_seconds=60, clock=clock)
+        cache.put("a", 1)
+
+        clock.now += 59
+        assert cache.get("a") == 1
+        assert cache.ttl_remaining("a") == pytest.approx(1.0)
+
+        clock.now += 1
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a zero TTL stores nothing."""
+        cache = TTLCache(max_entries=2, ttl_seconds=0)
+        cache.put("a", 1)
+        assert len(cache) == 0
+
+
+class TestRecommendResponseCache:
+    """Tests for caching and conditional requests on /api/recommend."""
+
+    def _post(self, client, query="Is it a good time to go to Paris?", user_id="default", headers=None):
+        return client.post(
+            '/api/recommend',
+            data=json.dumps({"query": query, "userId": user_id}),
+            content_type='application/json',
+            headers=headers or {},
+        )
+
+    def test_second_request_is_a_hit(self, client, monkeypatch):
+        """Test that identical queries are served from the cache."""
+        import api_server
+
+        calls = []
+        original = api_server.get_travel_recommendation
+        monkeypatch.setattr(
+            api_server, "get_travel_recommendation",
+            lambda q, u: calls.append(q) or original(q, u),
+        )
+
+        first = self._post(client)
+        second = self._post(client, query="  is it a good time to go to PARIS?")
+
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert len(calls) == 1
+        assert first.json["recommendation"] == second.json["recommendation"]
+        assert "max-age=" in second.headers["Cache-Control"]
+
+    def test_different_user_misses(self, client):
+        """Test that the user is part of the key."""
+        self._post(client, user_id="default")
+        response = self._post(client, user_id="user_123")
+        assert response.headers["X-Cache"] == "MISS"
+
+    def test_profile_change_misses(self, client, monkeypatch):
+        """Test that editing a profile invalidates its cached responses."""
+        from tools.user_profile import _MOCK_PROFILES
+
+        self._post(client)
+        monkeypatch.setattr(_MOCK_PROFILES["default"], "airfare_budget_soft", 650.0)
+        response = self._post(client)
+
+        assert response.headers["X-Cache"] == "MISS"
+        assert "$650 (soft)" in response.json["recommendation"]
+
+    def test_if_none_match_returns_304(self, client):
+        """Test that a matching ETag yields 304 Not Modified with no body."""
+        first = self._post(client)
+        etag = first.headers["ETag"]
+
+        second = self._post(client, headers={"If-None-Match": etag})
+
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers["ETag"] == etag
+
+    def test_stale_etag_returns_body(self, client):
+        """Test that a non-matching ETag gets the full response."""
+        response = self._post(client, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.json["success"] is True
+
+    def test_errors_are_not_cached(self, client, monkeypatch):
+        """Test that failures are not stored."""
+        import api_server
+
+        def boom(query, user_id):
+            raise RuntimeError("upstream down")
+
+        monkeypatch.setattr(api_server, "get_travel_recommendation", boom)
+        assert self._post(client).status_code == 500
+        assert len(RESPONSE_CACHE) == 0
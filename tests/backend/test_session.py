@@ -0,0 +1,92 @@
+"""Tests for incremental what-if re-scoring sessions."""
+
+import time
+
+import pytest
+
+from api_server import travel_window
+from core.models import ComfortLevel
+from core.profiles import MOCK_PROFILES
+from core.scoring import synthesize_recommendation
+from core.session import RecommendationSession
+from tools.engine import get_weather_forecast_tool, search_flights_tool, search_hotels_tool
+
+
+@pytest.fixture
+def session(sample_user_profile, sample_weather_forecast, sample_flight_options, sample_hotel_options):
+    return RecommendationSession(
+        sample_user_profile, sample_weather_forecast, sample_flight_options, sample_hotel_options
+    )
+
+
+def full_recompute(session):
+    return synthesize_recommendation(session.profile, session.forecast, session.flights, session.hotels)
+
+
+class TestRecommendationSession:
+    """Test incremental re-scoring against full recomputation."""
+
+    def test_initial_recommendation_matches_full(self, session):
+        """Test the first recommendation equals synthesize_recommendation."""
+        assert session.recommendation == full_recompute(session)
+        assert session.recomputed == ("weather", "flights", "hotels")
+
+    def test_records_profile_dependencies(self, session):
+        """Test each component records the profile fields it read."""
+        assert session.depends_on("weather") == {"preferred_temp_range", "safety_conscious"}
+        assert session.depends_on("flights") == {"airfare_budget_soft", "airfare_budget_hard"}
+        assert session.depends_on("hotels") == {
+            "hotel_budget_min", "hotel_budget_max", "preferred_brands", "comfort_level"
+        }
+
+    @pytest.mark.parametrize("changes, expected", [
+        ({"airfare_budget_soft": 450.0}, ("flights",)),
+        ({"airfare_budget_hard": 500.0}, ("flights",)),
+        ({"preferred_temp_range": (60.0, 90.0)}, ("weather",)),
+        ({"safety_conscious": False}, ("weather",)),
+        ({"hotel_budget_max": 150.0, "comfort_level": ComfortLevel.LUXURY}, ("hotels",)),
+        ({"preferred_brands": []}, ("hotels",)),
+        ({"airfare_budget_soft": 200.0, "safety_conscious": False}, ("weather", "flights")),
+    ])
+    def test_update_recomputes_only_dependents(self, session, changes, expected):
+        """Test only components reading a changed field are recomputed."""
+        recommendation = session.update(**changes)
+        assert session.recomputed == expected
+        assert recommendation == full_recompute(session)
+
+    def test_unchanged_values_are_free(self, session):
+        """Test setting a field to its current value recomputes nothing."""
+        before = session.recommendation
+        assert session.update(airfare_budget_soft=session.profile.airfare_budget_soft) is before
+        assert session.recomputed == ()
+
+    def test_unrelated_field_only_reranks(self, session):
+        """Test fields no scorer reads leave every component cached."""
+        session.update(notes="Prefers aisle seats")
+        assert session.recomputed == ()
+        assert session.recommendation == full_recompute(session)
+
+    def test_unknown_field_raises(self, session):
+        """Test unknown profile fields are rejected."""
+        with pytest.raises(TypeError):
+            session.update(not_a_field=1)
+
+    def test_slider_updates_are_fast(self):
+        """Test what-if updates over real tool outputs take milliseconds."""
+        profile = MOCK_PROFILES["user_123"]
+        depart, ret = travel_window()
+        session = RecommendationSession.from_tool_outputs(
+            profile,
+            get_weather_forecast_tool("Maui"),
+            search_flights_tool("SFO", "OGG", depart, ret, 3, limit=200, independent_flexibility=True),
+            search_hotels_tool("Maui", depart, ret, profile.preferred_brands),
+        )
+        assert session.recommendation == full_recompute(session)
+
+        start = time.perf_counter()
+        for soft in range(300, 500, 10):
+            session.update(airfare_budget_soft=float(soft))
+        per_update = (time.perf_counter() - start) / 20
+        assert session.recomputed == ("flights",)
+        assert session.recommendation == full_recompute(session)
+        assert per_update < 0.02
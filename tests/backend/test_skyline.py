@@ -0,0 +1,105 @@
+"""Tests for the Pareto frontier (skyline) operator and the trade-offs section."""
+
+import time
+
+import numpy as np
+import pytest
+
+from api_server import get_travel_recommendation, render_frontier_section, trip_frontier
+from core.skyline import pareto_frontier, skyline_indices
+from tools.engine import get_user_profile_tool, get_weather_forecast_tool, search_flights_tool, search_hotels_tool
+
+
+def brute_force_skyline(points):
+    """Rows no other row dominates; of exact duplicates only the first is kept."""
+    keep = []
+    for i, p in enumerate(points):
+        dominated = any(
+            np.all(q <= p) and (np.any(q < p) or j < i)
+            for j, q in enumerate(points) if j != i
+        )
+        if not dominated:
+            keep.append(i)
+    return keep
+
+
+class TestSkyline:
+    """Tests for skyline_indices and pareto_frontier."""
+
+    @pytest.mark.parametrize("dims", [1, 2, 3, 4])
+    def test_matches_brute_force(self, dims):
+        """Test random points with many ties against pairwise comparison."""
+        rng = np.random.default_rng(dims)
+        for _ in range(40):
+            points = rng.integers(0, 6, (rng.integers(0, 120), dims)).astype(float)
+            assert sorted(skyline_indices(points).tolist()) == brute_force_skyline(points)
+
+    def test_maximize_flags(self):
+        """Test that maximized criteria are flipped and results come cheapest first."""
+        trips = [
+            {"price": 100, "rating": 3.0},
+            {"price": 150, "rating": 4.5},
+            {"price": 120, "rating": 2.5},
+            {"price": 200, "rating": 4.5},
+        ]
+        frontier = pareto_frontier(trips, (lambda t: t["price"], lambda t: t["rating"]), maximize=(False, True))
+        assert frontier == [trips[0], trips[1]]
+
+    def test_empty(self):
+        """Test that no items give an empty frontier."""
+        assert pareto_frontier([], (len,)) == []
+        assert skyline_indices(np.empty((0, 3))).size == 0
+
+    def test_tens_of_thousands_of_candidates(self):
+        """Test that a 4-criteria skyline over 20,000 candidates stays fast."""
+        points = np.random.default_rng(0).random((20000, 4))
+        start = time.perf_counter()
+        frontier = skyline_indices(points)
+        assert time.perf_counter() - start < 1.0
+        assert 0 < frontier.size < points.shape[0]
+
+
+class TestTripFrontier:
+    """Tests for the trade-offs section of the recommendation."""
+
+    def _inputs(self, user_id="user_123", destination="Maui", airport="OGG"):
+        from api_server import travel_window
+        profile = get_user_profile_tool(user_id)
+        dep, ret = travel_window()
+        return (
+            profile,
+            get_weather_forecast_tool(destination),
+            search_flights_tool("SFO", airport, dep, ret, profile["flexibility_days"]),
+            search_hotels_tool(destination, dep, ret, profile["preferred_brands"]),
+        )
+
+    def test_component_prefilter_matches_full_pairing(self):
+        """Test that pairing only component frontiers loses no frontier trip."""
+        profile, weather, flights, hotels = self._inputs()
+        frontier = trip_frontier(profile, weather, flights, hotels)
+
+        # Reference: every flight x hotel pair, skyline computed directly
+        from api_server import index_weather_scores
+        from datetime import date
+        index = index_weather_scores(profile, weather)
+        points = []
+        for f in flights["options"]:
+            match = index.stab(date.fromisoformat(f["departure_date"]))
+            for h in hotels["options"]:
+                points.append((f["price_usd"] + h["total_price_usd"], f["total_duration_hours"],
+                               -h["rating"], -(match[1] if match else 0.0)))
+        points = np.array(points)
+        expected = sorted(map(tuple, points[skyline_indices(points)].tolist()))
+        got = sorted((t["total_price_usd"], t["duration_hours"], -t["rating"], -t["weather_score"]) for t in frontier)
+        assert got == expected
+
+    def test_section_labels_extremes(self):
+        """Test that the section lists the cheapest and best-rated trips."""
+        text = render_frontier_section(*self._inputs())
+        assert "TRADE-OFFS" in text
+        assert "Cheapest" in text and "Best-rated hotel" in text
+
+    def test_section_in_full_recommendation(self):
+        """Test that the trade-offs sit between the window and the alternatives."""
+        text = get_travel_recommendation("Should I go to Maui?", "user_123")
+        assert text.index("RECOMMENDED TRAVEL WINDOW") < text.index("TRADE-OFFS") < text.index("Feel free to ask")
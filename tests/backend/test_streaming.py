@@ -0,0 +1,124 @@
+"""Tests for the /api/recommend/stream Server-Sent Events endpoint."""
+
+import pytest
+import json
+
+from api_server import app, get_travel_recommendation, iter_recommendation_sections
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the Flask app."""
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+def parse_events(body):
+    """Split an SSE body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestRecommendationSections:
+    """Tests for iter_recommendation_sections."""
+
+    def test_full_recommendation_section_order(self):
+        """Test that a single-destination query yields every section in order."""
+        sections = [name for name, _ in iter_recommendation_sections("Should I go to Maui?", "user_123")]
+        assert sections == [
+            "profile", "visa", "weather", "flights", "hotels",
+            "recommended_window", "frontier", "alternatives",
+        ]
+
+    def test_sections_join_to_full_recommendation(self):
+        """Test that joined sections equal the non-streaming recommendation."""
+        query = "When should I visit Tokyo?"
+        joined = "".join(text for _, text in iter_recommendation_sections(query, "default"))
+        assert joined == get_travel_recommendation(query, "default")
+
+    def test_comparison_is_single_section(self):
+        """Test that comparison queries stream as one section."""
+        sections = list(iter_recommendation_sections("Mumbai or Delhi?", "default"))
+        assert [name for name, _ in sections] == ["comparison"]
+
+    def test_unknown_destination_is_message(self):
+        """Test that the fallback message is a single section."""
+        sections = list(iter_recommendation_sections("hello", "default"))
+        assert [name for name, _ in sections] == ["message"]
+
+    def test_sections_are_lazy(self):
+        """Test that the profile arrives before flights are searched."""
+        from core.memo import ToolMemo
+
+        memo = ToolMemo()
+        sections = iter_recommendation_sections("Should I go to Maui?", "default", memo)
+        assert next(sections)[0] == "profile"
+        # Only the profile and visa lookups have run so far
+        assert memo.misses == 2
+
+
+class TestStreamEndpoint:
+    """Tests for the /api/recommend/stream endpoint."""
+
+    def test_post_streams_sections_then_done(self, client):
+        """Test that POST streams section events followed by done."""
+        response = client.post('/api/recommend/stream',
+                               data=json.dumps({"query": "Should I go to Maui?", "userId": "user_123"}),
+                               content_type='application/json')
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        assert response.headers['Cache-Control'] == 'no-cache'
+
+        events = parse_events(response.get_data(as_text=True))
+        assert [name for name, _ in events][-1] == "done"
+        sections = [data["section"] for name, data in events if name == "section"]
+        assert sections[0] == "profile"
+        assert sections[-1] == "alternatives"
+
+    def test_get_matches_json_endpoint(self, client):
+        """Test that the streamed text equals the /api/recommend response."""
+        query = "Is it a good time to go to Paris?"
+        stream = client.get('/api/recommend/stream', query_string={"query": query, "userId": "default"})
+        events = parse_events(stream.get_data(as_text=True))
+        streamed = "".join(data["text"] for name, data in events if name == "section")
+
+        response = client.post('/api/recommend',
+                               data=json.dumps({"query": query, "userId": "default"}),
+                               content_type='application/json')
+        assert streamed == json.loads(response.data)["recommendation"]
+        # The stream populated the response cache
+        assert response.headers['X-Cache'] == 'HIT'
+
+    def test_cache_hit_streams_single_section(self, client):
+        """Test that a cached recommendation is sent as one section."""
+        body = {"query": "Bali trip?", "userId": "default"}
+        client.post('/api/recommend', data=json.dumps(body), content_type='application/json')
+
+        response = client.post('/api/recommend/stream', data=json.dumps(body), content_type='application/json')
+        assert response.headers['X-Cache'] == 'HIT'
+        events = parse_events(response.get_data(as_text=True))
+        assert [name for name, _ in events] == ["section", "done"]
+        assert events[0][1]["section"] == "recommendation"
+
+    def test_missing_query(self, client):
+        """Test that a missing query is rejected before streaming."""
+        response = client.get('/api/recommend/stream')
+        assert response.status_code == 400
+
+    def test_error_event(self, client, monkeypatch):
+        """Test that failures mid-stream are reported as an error event."""
+        import api_server
+
+        def failing_sections(query, user_id, memo=None, endpoint="/api/recommend"):
+            yield "profile", "partial"
+            raise RuntimeError("tool failure")
+
+        monkeypatch.setattr(api_server, "iter_recommendation_sections", failing_sections)
+        response = client.get('/api/recommend/stream', query_string={"query": "Maui"})
+        events = parse_events(response.get_data(as_text=True))
+        assert [name for name, _ in events] == ["section", "error"]
+        assert events[-1][1]["error"] == "tool failure"
@@ -0,0 +1,150 @@
+"""Tests for request-scoped tool memoization."""
+
+import pytest
+
+from core.memo import ToolMemo
+from api_server import get_travel_recommendation
+
+
+def _echo(a, b=2, tags=None):
+    _echo.calls += 1
+    return {"a": a, "b": b, "tags": tags}
+
+
+class TestToolMemo:
+    """Tests for ToolMemo."""
+
+    def setup_method(self):
+        _echo.calls = 0
+
+    def test_repeated_call_runs_once(self):
+        """Test that identical calls hit the memo after the first run."""
+        memo = ToolMemo()
+        first = memo.call(_echo, 1)
+        second = memo.call(_echo, 1)
+
+        assert first is second
+        assert _echo.calls == 1
+        assert memo.hits == 1
+        assert memo.misses == 1
+
+    def test_positional_and_keyword_forms_share_key(self):
+        """Test that arguments are normalized against the signature and defaults."""
+        memo = ToolMemo()
+        memo.call(_echo, 1)
+        memo.call(_echo, a=1)
+        memo.call(_echo, 1, 2)
+        memo.call(_echo, 1, b=2, tags=None)
+
+        assert _echo.calls == 1
+        assert memo.stats() == {"hits": 3, "misses": 1, "entries": 1}
+
+    def test_list_arguments_are_hashable(self):
+        """Test that list arguments are frozen into the key."""
+        memo = ToolMemo()
+        memo.call(_echo, 1, tags=["Marriott", "Hilton"])
+        memo.call(_echo, 1, tags=("Marriott", "Hilton"))
+        memo.call(_echo, 1, tags=["Hilton", "Marriott"])
+
+        assert _echo.calls == 2
+
+    def test_different_arguments_miss(self):
+        """Test that distinct argument sets run separately."""
+        memo = ToolMemo()
+        memo.call(_echo, 1)
+        memo.call(_echo, 2)
+
+        assert _echo.calls == 2
+        assert memo.misses == 2
+        assert memo.hits == 0
+
+    def test_concurrent_callers_share_in_flight_run(self):
+        """Test that threads asking for the same key wait on a single run."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+        lock = threading.Lock()
+
+        def slow_tool(x):
+            with lock:
+                calls.append(x)
+            time.sleep(0.05)
+            return x * 2
+
+        memo = ToolMemo()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: memo.call(slow_tool, 21), range(8)))
+
+        assert results == [42] * 8
+        assert calls == [21]
+        assert memo.misses == 1
+        assert memo.hits == 7
+
+    def test_failed_call_is_not_cached(self):
+        """Test that exceptions propagate and later calls retry."""
+        attempts = []
+
+        def flaky(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise RuntimeError("upstream unavailable")
+            return x
+
+        memo = ToolMemo()
+        with pytest.raises(RuntimeError):
+            memo.call(flaky, 1)
+
+        assert memo.call(flaky, 1) == 1
+        assert len(attempts) == 2
+
+    def test_waiters_time_out_on_abandoned_run(self):
+        """Test that callers waiting on a stuck in-flight run give up after the timeout."""
+        import threading
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+
+        release = threading.Event()
+        started = threading.Event()
+
+        def stuck(x):
+            started.set()
+            release.wait()
+            return x
+
+        memo = ToolMemo(timeout=0.05)
+        owner = threading.Thread(target=memo.call, args=(stuck, 1))
+        owner.start()
+        started.wait()
+        try:
+            with pytest.raises(FutureTimeoutError):
+                memo.call(stuck, 1)
+        finally:
+            release.set()
+            owner.join()
+        assert memo.call(stuck, 1) == 1
+
+
+class TestRecommendationMemoization:
+    """Tests that recommendation paths collapse redundant tool calls."""
+
+    def test_comparison_runs_each_tool_once_per_destination(self):
+        """Test that a 4-city comparison performs one run per (tool, args) pair."""
+        memo = ToolMemo()
+        result = get_travel_recommendation(
+            "Paris or Tokyo or London or Dubai?", "default", memo=memo
+        )
+
+        assert "QUICK COMPARISON SUMMARY" in result
+        # 1 profile + 4 destinations x (weather, flights, hotels, visa)
+        assert memo.misses == 17
+        # The summary reuses the fetched bundles instead of calling tools again
+        assert memo.hits == 0
+
+    def test_single_destination_has_no_redundant_calls(self):
+        """Test that the single-destination path runs every tool exactly once."""
+        memo = ToolMemo()
+        get_travel_recommendation("Should I go to Maui?", "default", memo=memo)
+
+        assert memo.hits == 0
+        assert memo.misses == 5
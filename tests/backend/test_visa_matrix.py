@@ -0,0 +1,96 @@
+"""Tests for the indexed visa matrix."""
+
+import json
+import pytest
+
+from core.visa import VisaMatrix, get_visa_matrix, load_visa_matrix
+from api_server import get_travel_recommendation, suggest_visa_friendly_destinations
+
+
+@pytest.fixture
+def matrix():
+    return VisaMatrix([
+        {"citizenship": "USA", "destination": "France", "required": False, "type": "visa_waiver", "max_stay": "90 days"},
+        {"citizenship": "USA", "destination": "India", "required": True, "type": "e-visa", "cost": "$25"},
+        {"citizenship": "USA", "destination": "UAE", "required": False, "type": "visa_free", "max_stay": "90 days"},
+        {"citizenship": "USA", "destination": "Japan", "required": False, "type": "visa_waiver", "max_stay": "90 days"},
+        {"citizenship": "India", "destination": "USA", "required": True, "type": "visa", "cost": "$160"},
+    ])
+
+
+class TestVisaMatrix:
+    """Tests for VisaMatrix lookups and inverted queries."""
+
+    def test_pair_lookup(self, matrix):
+        """Test O(1) lookup of a known pair."""
+        req = matrix.lookup("USA", "India")
+        assert req["type"] == "e-visa"
+        assert req["cost"] == "$25"
+
+    def test_unknown_pairs(self, matrix):
+        """Test that missing pairs and countries return None."""
+        assert matrix.lookup("India", "France") is None
+        assert matrix.lookup("Mars", "France") is None
+        assert matrix.lookup("USA", "Mars") is None
+
+    def test_identical_requirements_are_shared(self, matrix):
+        """Test that duplicate requirement records are stored once."""
+        assert matrix.lookup("USA", "France") is matrix.lookup("USA", "Japan")
+
+    def test_requirements_are_read_only(self, matrix):
+        """Test that callers cannot mutate shared records."""
+        with pytest.raises(TypeError):
+            matrix.lookup("USA", "France")["type"] = "visa"
+
+    def test_visa_free_destinations_keep_file_order(self, matrix):
+        """Test the inverted index across several visa types."""
+        assert matrix.visa_free_destinations("USA") == ("France", "UAE", "Japan")
+        assert matrix.easy_visa_destinations("USA") == ("India",)
+        assert matrix.visa_free_destinations("India") == ()
+        assert matrix.visa_free_destinations("Mars") == ()
+
+    def test_country_codes(self, matrix):
+        """Test that countries map to dense integer codes."""
+        codes = {matrix.country_code(c) for c in matrix.countries}
+        assert codes == set(range(len(matrix.countries)))
+
+    def test_load_from_file(self, tmp_path):
+        """Test loading the matrix from a JSON data file."""
+        path = tmp_path / "visa.json"
+        path.write_text(json.dumps({"requirements": [
+            {"citizenship": "UK", "destination": "Japan", "required": False, "type": "visa_waiver"},
+        ]}))
+        assert load_visa_matrix(path).lookup("UK", "Japan")["type"] == "visa_waiver"
+
+    def test_bundled_matrix(self):
+        """Test the process-wide matrix loaded from the bundled data."""
+        assert get_visa_matrix() is get_visa_matrix()
+        assert "France" in get_visa_matrix().visa_free_destinations("USA")
+        assert "India" in get_visa_matrix().easy_visa_destinations("UK")
+
+
+class TestVisaSuggestions:
+    """Tests for visa-friendly destination suggestions in the API server."""
+
+    def test_suggestions_list_cities(self):
+        """Test that suggestions name countries with their cities."""
+        text = suggest_visa_friendly_destinations("India")
+        assert "Indonesia (Bali)" in text
+        assert "E-visa or visa on arrival" in text
+
+    def test_unknown_passport(self):
+        """Test the fallback for passports without data."""
+        assert "don't have visa data" in suggest_visa_friendly_destinations("Mars")
+
+    def test_full_visa_response_offers_alternatives(self):
+        """Test that a full-visa response suggests easier destinations."""
+        result = get_travel_recommendation("Should I go to Beijing?", "default")
+        assert "Visa Required" in result
+        assert "EASIER DESTINATIONS FOR USA PASSPORTS" in result
+        assert "France (Paris)" in result
+
+    def test_visa_free_query(self):
+        """Test answering 'where can I travel without a visa?'."""
+        result = get_travel_recommendation("Where can I travel without a visa?", "default")
+        assert "No visa needed" in result
+        assert "Japan (Tokyo)" in result
@@ -0,0 +1,496 @@
+"""Plain-Python travel tool functions shared by the ADK agent and the API server.
+
+This module deliberately avoids importing ``google.adk`` (and FastMCP), so the
+Flask API can call the tools without paying the agent framework's import cost.
+The ADK agent in ``agent.coordinator`` wraps these same functions.
+"""
+
+from datetime import date, timedelta
+from typing import Optional
+
+from core.destinations import get_registry
+from core.analysis import weather_period_from_dict
+from core.profiles import MOCK_PROFILES
+from tools.fare_calendar import get_fare_calendar
+from tools.fare_grid import flexible_search, paired_fare_grid
+from tools.hotel_rates import (
+    PREFERRED_BRAND_DISCOUNT,
+    STORM_DISCOUNT,
+    get_catalog_index,
+    get_rate_calendar,
+    has_storm_discount,
+)
+from tools.itinerary import MIN_NIGHTS, plan_itinerary, validate_request
+
+
+def get_user_profile_tool(user_id: str) -> dict:
+    """
+    Retrieve user profile with travel preferences and constraints.
+    
+    This tool MUST be called before consulting external data sources.
+    The agent must recognize that questions are underspecified without
+    user profile information.
+    
+    Args:
+        user_id: Unique identifier for the user
+        
+    Returns:
+        Dictionary with user profile fields
+    """
+    # In production, this would call the MCP server
+    # For now, we'll use the mock data directly
+    profile = MOCK_PROFILES.get(user_id, MOCK_PROFILES["default"])
+    
+    return {
+        "user_id": profile.user_id,
+        "citizenship": profile.citizenship,
+        "passport_country": profile.passport_country,
+        "preferred_temp_range": profile.preferred_temp_range,
+        "airfare_budget_soft": profile.airfare_budget_soft,
+        "airfare_budget_hard": profile.airfare_budget_hard,
+        "hotel_budget_min": profile.hotel_budget_min,
+        "hotel_budget_max": profile.hotel_budget_max,
+        "preferred_brands": profile.preferred_brands,
+        "typical_trip_length_days": profile.typical_trip_length_days,
+        "comfort_level": profile.comfort_level.value,
+        "flexibility_days": profile.flexibility_days,
+        "safety_conscious": profile.safety_conscious,
+        "visa_required": profile.visa_required,
+    }
+
+
+def get_weather_forecast_tool(destination: str, start_date: Optional[str] = None, days_ahead: int = 30) -> dict:
+    """
+    Retrieve forward-looking weather forecast for a destination.
+    
+    Provides summarized weather data, not raw dumps:
+    - 30-day forward-looking forecast
+    - Storm periods explicitly flagged with severity
+    - Temperature ranges and precipitation summaries
+    - Brief condition summaries per period
+    
+    Args:
+        destination: Destination city or location
+        start_date: Start date in YYYY-MM-DD format (defaults to today)
+        days_ahead: Number of days to forecast (max 30)
+        
+    Returns:
+        Dictionary with weather forecast summary and periods
+    """
+    # Destination-specific weather profile from the shared registry,
+    # defaulting to a moderate climate for unknown destinations
+    profile = get_registry().weather_profile(destination)
+    base_temp = profile.base_temp_f
+    temp_variation = profile.temp_variation_f
+    storm_week = profile.storm_week
+    climate_type = profile.climate
+    
+    if start_date is None:
+        start_date = date.today().isoformat()
+    
+    start = date.fromisoformat(start_date)
+    periods = []
+    
+    for week in range(0, min(days_ahead, 30), 7):
+        period_start = start + timedelta(days=week)
+        period_end = min(period_start + timedelta(days=6), start + timedelta(days=days_ahead - 1))
+        
+        # Calculate temperature with variation
+        temp_offset = (week % 3) * (temp_variation / 3.0)
+        avg_temp = base_temp + temp_offset
+        
+        # Determine if this week has storm risk
+        has_storm = (storm_week is not None and week == storm_week)
+        storm_severity = "moderate" if has_storm else None
+        
+        # Generate conditions based on climate type and temperature
+        if has_storm:
+            if climate_type == "tropical":
+                conditions = "Tropical storm expected with heavy rainfall"
+            elif climate_type == "temperate":
+                conditions = "Rainy period with possible thunderstorms"
+            else:
+                conditions = "Moderate storm expected with increased precipitation"
+        elif climate_type == "tropical":
+            conditions = "Warm and humid with occasional showers"
+        elif climate_type == "desert":
+            conditions = "Hot and dry with clear skies"
+        elif climate_type == "alpine":
+            conditions = "Cool mountain weather, possible snow at higher elevations"
+        elif climate_type == "mediterranean":
+            conditions = "Mild and pleasant with sunny skies"
+        elif climate_type == "continental":
+            if avg_temp < 40:
+                conditions = "Cold with possible snow"
+            elif avg_temp < 55:
+                conditions = "Cool and crisp"
+            else:
+                conditions = "Mild and comfortable"
+        else:  # temperate
+            if avg_temp > 75:
+                conditions = "Warm and pleasant"
+            elif avg_temp > 60:
+                conditions = "Mild and comfortable"
+            else:
+                conditions = "Cool with variable conditions"
+        
+        periods.append({
+            "start_date": period_start.isoformat(),
+            "end_date": period_end.isoformat(),
+            "avg_temp_f": avg_temp,
+            "storm_risk": has_storm,
+            "storm_severity": storm_severity,
+            "conditions_summary": conditions,
+        })
+    
+    storm_periods = [p for p in periods if p["storm_risk"]]
+    if storm_periods:
+        overall_summary = (
+            f"Forecast for {destination}: Generally {climate_type} weather ({periods[0]['avg_temp_f']:.0f}-{periods[-1]['avg_temp_f']:.0f}°F). "
+            f"Storm risk identified: {storm_periods[0]['start_date']} to {storm_periods[0]['end_date']} ({storm_periods[0]['storm_severity']} severity). "
+            f"Other periods are clear."
+        )
+    else:
+        overall_summary = (
+            f"Forecast for {destination}: Stable {climate_type} weather expected "
+            f"({periods[0]['avg_temp_f']:.0f}-{periods[-1]['avg_temp_f']:.0f}°F) with minimal precipitation."
+        )
+    
+    return {
+        "destination": destination,
+        "overall_summary": overall_summary,
+        "periods": periods,
+    }
+
+
+def search_flights_tool(
+    origin: str,
+    destination: str,
+    departure_date: str,
+    return_date: str,
+    flexibility_days: int = 3,
+    independent_flexibility: bool = False,
+    return_flexibility_days: Optional[int] = None,
+    min_trip_days: int = 1,
+    max_trip_days: Optional[int] = None,
+    max_price: Optional[float] = None,
+    max_layovers: Optional[int] = None,
+    brands_only: Optional[list[str]] = None,
+    limit: int = 10,
+) -> dict:
+    """
+    Search for flight options between origin and destination.
+    
+    Considers schedule flexibility (weekday vs weekend, red-eye options)
+    and returns multiple candidate itineraries. Prices must be compared
+    against user affordability thresholds.
+    
+    Args:
+        origin: Origin airport code (e.g., SFO)
+        destination: Destination airport code (e.g., OGG for Maui)
+        departure_date: Preferred departure date YYYY-MM-DD
+        return_date: Preferred return date YYYY-MM-DD
+        flexibility_days: Days +/- to consider for flexibility
+        independent_flexibility: Shift departure and return independently
+            (full date grid) instead of together (fixed trip length)
+        return_flexibility_days: Days +/- for the return date in independent
+            mode (defaults to flexibility_days)
+        min_trip_days: Shortest acceptable trip in days
+        max_trip_days: Longest acceptable trip in days (no limit if omitted)
+        max_price: Drop itineraries priced above this (e.g. the hard airfare budget)
+        max_layovers: Drop itineraries with more layovers than this
+        brands_only: Only return itineraries flown by these airlines
+        limit: Maximum number of options to return
+        
+    Returns:
+        Dictionary with flight options and summary (both restricted to the
+        filters); independent searches also report how many candidates
+        were evaluated and pruned
+    """
+    # Flight duration and airlines from the shared registry,
+    # defaulting to medium-haul for unknown airports
+    profile = get_registry().flight_profile(destination)
+    dep_date = date.fromisoformat(departure_date)
+    ret_date = date.fromisoformat(return_date)
+    
+    if independent_flexibility:
+        # Heap top-k over the departure x return grid, pruning whole rows
+        result = flexible_search(
+            profile,
+            dep_date,
+            ret_date,
+            flexibility_days,
+            flexibility_days if return_flexibility_days is None else return_flexibility_days,
+            k=limit,
+            min_trip_days=min_trip_days,
+            max_trip_days=max_trip_days,
+            max_price=max_price,
+            max_layovers=max_layovers,
+            airlines=brands_only,
+        )
+        return {
+            "origin": origin,
+            "destination": destination,
+            "options": result.options,
+            "summary": result.summary(),
+            "search_stats": result.stats(),
+        }
+    
+    # Price every candidate date pair and variant in one vectorized pass;
+    # filters are array masks, and option dicts are only built for the returned rows
+    grid = paired_fare_grid(
+        profile,
+        dep_date,
+        ret_date,
+        flexibility_days,
+        min_trip_days=min_trip_days,
+        max_trip_days=max_trip_days,
+    )
+    cells = grid.select(max_price=max_price, max_layovers=max_layovers, airlines=brands_only)
+    
+    return {
+        "origin": origin,
+        "destination": destination,
+        "options": grid.options(limit, cells),
+        "summary": grid.summary(cells),
+    }
+
+
+def find_cheapest_dates_tool(
+    origin: str,
+    destination: str,
+    window_start: Optional[str] = None,
+    window_end: Optional[str] = None,
+    nights: Optional[int] = None,
+) -> dict:
+    """
+    Find the cheapest time to fly within the next year.
+    
+    Answers "when is cheapest to fly to X in the next few months?" from a
+    precomputed per-route fare calendar instead of searching date by date.
+    
+    Args:
+        origin: Origin airport code (e.g., SFO)
+        destination: Destination airport code (e.g., NRT for Tokyo)
+        window_start: Earliest departure YYYY-MM-DD (defaults to today)
+        window_end: Latest departure YYYY-MM-DD (defaults to one year out)
+        nights: Trip length; when given, also finds the cheapest round trip
+        
+    Returns:
+        Dictionary with the cheapest departure, optional cheapest trip and summary
+    """
+    calendar = get_fare_calendar(origin, destination)
+    start = date.fromisoformat(window_start) if window_start else None
+    end = date.fromisoformat(window_end) if window_end else None
+    
+    result = {"origin": origin, "destination": destination, "cheapest_departure": None}
+    cheapest = calendar.cheapest_departure(start, end)
+    if cheapest is None:
+        result["summary"] = "No departure dates in the requested window are within the next year."
+        return result
+    
+    day, fare = cheapest
+    result["cheapest_departure"] = {"date": day.isoformat(), "one_way_fare_usd": round(fare, 2)}
+    summary = f"Cheapest departure: {day.isoformat()} (${fare:.0f} one way)."
+    
+    if nights:
+        trip = calendar.cheapest_trip(nights, start, end)
+        if trip is None:
+            result["cheapest_trip"] = None
+            summary += f" No {nights}-night trip fits in the window."
+        else:
+            departure, return_day, price = trip
+            result["cheapest_trip"] = {
+                "departure_date": departure.isoformat(),
+                "return_date": return_day.isoformat(),
+                "nights": nights,
+                "price_usd": round(price, 2),
+            }
+            summary += (
+                f" Cheapest {nights}-night trip: {departure.isoformat()} to "
+                f"{return_day.isoformat()} (${price:.0f} round trip)."
+            )
+    
+    result["summary"] = summary
+    return result
+
+
+def search_hotels_tool(
+    destination: str,
+    check_in_date: str,
+    check_out_date: str,
+    preferred_brands: Optional[list[str]] = None,
+    max_price: Optional[float] = None,
+    min_rating: Optional[float] = None,
+    brands_only: Optional[list[str]] = None,
+    limit: Optional[int] = None,
+) -> dict:
+    """
+    Search for hotel options at a destination.
+    
+    Evaluates lodging options considering:
+    - Nightly rates against user budget preferences
+    - Brand loyalty (preferred brands highlighted)
+    - Anomalous pricing (e.g., storm discounts) explicitly flagged
+    
+    Args:
+        destination: Destination city or location
+        check_in_date: Check-in date YYYY-MM-DD
+        check_out_date: Check-out date YYYY-MM-DD
+        preferred_brands: List of preferred hotel brands
+        max_price: Drop hotels whose nightly rate is above this
+        min_rating: Drop hotels rated below this
+        brands_only: Only return hotels of these brands
+        limit: Maximum number of options to return (all by default)
+        
+    Returns:
+        Dictionary with hotel options and summary (both restricted to the filters)
+    """
+    if preferred_brands is None:
+        preferred_brands = []
+    
+    check_in = date.fromisoformat(check_in_date)
+    check_out = date.fromisoformat(check_out_date)
+    nights = (check_out - check_in).days
+    
+    if nights <= 0:
+        return {
+            "destination": destination,
+            "options": [],
+            "summary": "Invalid date range.",
+        }
+    
+    # Per-night rates from the destination's rate calendar; each stay total
+    # is one prefix-sum subtraction per property
+    calendar = get_rate_calendar(destination)
+    totals = calendar.stay_totals(check_in, nights).tolist()
+    properties = calendar.properties
+    if brands_only is not None or min_rating is not None:
+        # Brand and rating filters go through the catalog's bitmaps, so
+        # excluded properties are never priced
+        matches = get_catalog_index(destination).query(brands=brands_only, min_rating=min_rating)
+        properties = sorted(matches, key=lambda prop: prop.index)
+    
+    # Price and filter first; dicts are only built for the returned options
+    quotes = []
+    for prop in properties:
+        stay_total = totals[prop.index]
+        if prop.brand in preferred_brands:
+            stay_total *= PREFERRED_BRAND_DISCOUNT
+        is_anomalous = has_storm_discount(prop, check_in)
+        if is_anomalous:
+            stay_total *= STORM_DISCOUNT
+        if max_price is not None and stay_total / nights > max_price:
+            continue
+        quotes.append((stay_total / nights, stay_total, prop, is_anomalous))
+    
+    quotes.sort(key=lambda quote: quote[0])
+    
+    if quotes:
+        min_rate = quotes[0][0]
+        max_rate = quotes[-1][0]
+        preferred_matches = sum(1 for quote in quotes if quote[2].brand in preferred_brands)
+        anomalous = sum(1 for quote in quotes if quote[3])
+        
+        summary = f"Found {len(quotes)} hotel options. Nightly rate range: ${min_rate:.0f}-${max_rate:.0f}. "
+        if preferred_matches:
+            summary += f"{preferred_matches} options match preferred brands. "
+        if anomalous:
+            summary += f"{anomalous} option(s) with anomalous pricing detected."
+    elif max_price is None and min_rating is None and brands_only is None:
+        summary = "No hotel options found for specified dates."
+    else:
+        summary = "No hotel options match the requested filters."
+    
+    options = []
+    for nightly_rate, stay_total, prop, is_anomalous in quotes[:limit]:
+        options.append({
+            "check_in_date": check_in.isoformat(),
+            "check_out_date": check_out.isoformat(),
+            "nightly_rate_usd": nightly_rate,
+            "total_price_usd": stay_total,
+            "brand": prop.brand,
+            "name": prop.name,
+            "rating": prop.rating,
+            "is_anomalous_pricing": is_anomalous,
+            "anomalous_reason": (
+                "Storm discount - reduced rates due to weather forecast" if is_anomalous else None
+            ),
+            "booking_code": f"HTL-{check_in.isoformat()}-{prop.brand}-{prop.index}",
+        })
+    
+    return {
+        "destination": destination,
+        "options": options,
+        "summary": summary,
+    }
+
+
+def plan_itinerary_tool(
+    user_id: str,
+    origin: str,
+    destinations: list[str],
+    start_date: Optional[str] = None,
+    days: int = 14,
+    min_nights: int = MIN_NIGHTS,
+) -> dict:
+    """
+    Plan a multi-city trip: the city order and nights per city.
+    
+    Answers "Paris, Rome and Barcelona in two weeks" by choosing the route
+    that minimizes flights plus hotels (within the user's hotel budget),
+    with nights of poor weather for the user counted as an extra cost.
+    
+    Args:
+        user_id: User whose preferences and budgets apply
+        origin: Origin airport code (e.g., SFO)
+        destinations: Cities to visit, each exactly once (up to 8)
+        start_date: Departure date YYYY-MM-DD (defaults to two weeks from today)
+        days: Trip length in days, up to 30; the return flight is on the last day
+        min_nights: Fewest nights to spend in each city
+        
+    Returns:
+        Dictionary with the ordered stops, costs and summary
+    """
+    profile = MOCK_PROFILES.get(user_id, MOCK_PROFILES["default"])
+    start = date.fromisoformat(start_date) if start_date else date.today() + timedelta(days=14)
+    result = {"origin": origin, "destinations": list(destinations), "stops": []}
+    try:
+        # Reject bad requests before asking for any forecasts
+        validate_request(destinations, days, min_nights)
+        forecasts = []
+        for city in destinations:
+            periods = get_weather_forecast_tool(city, start.isoformat(), days)["periods"]
+            forecasts.append([weather_period_from_dict(p) for p in periods])
+        itinerary = plan_itinerary(profile, origin, destinations, start, days, forecasts, min_nights)
+    except ValueError as error:
+        result["summary"] = f"Cannot plan this itinerary: {error}."
+        return result
+    if itinerary is None:
+        result["summary"] = (
+            f"No {days}-day route visits all {len(destinations)} cities with at least {min_nights} "
+            f"nights each within the hotel budget (${profile.hotel_budget_max:.0f}/night)."
+        )
+        return result
+    
+    result["stops"] = [
+        {
+            "city": stop.city,
+            "arrival_date": stop.arrival_date.isoformat(),
+            "nights": stop.nights,
+            "flight_usd": round(stop.flight_usd, 2),
+            "hotel": stop.hotel,
+            "hotel_usd": round(stop.hotel_usd, 2),
+            "weather_score": round(stop.weather_score, 2),
+        }
+        for stop in itinerary.stops
+    ]
+    result["return_date"] = itinerary.return_date.isoformat()
+    result["return_flight_usd"] = round(itinerary.return_flight_usd, 2)
+    result["total_usd"] = round(itinerary.total_usd, 2)
+    route = " -> ".join(f"{stop.city} ({stop.nights}n)" for stop in itinerary.stops)
+    result["summary"] = (
+        f"Cheapest route: {origin} -> {route} -> {origin}, returning {itinerary.return_date.isoformat()} "
+        f"for ${itinerary.total_usd:.0f} in flights and hotels."
+    )
+    return result
@@ -0,0 +1,181 @@
+"""Year-ahead fare calendar with range-minimum queries.
+
+Each route keeps one-way fares for the next ``CALENDAR_DAYS`` departure
+dates in a ring buffer indexed by segment trees, so "cheapest departure
+between d1 and d2" and "cheapest N-night trip starting between d1 and d2"
+are O(log n). When the date rolls over only the expired days, the newly
+visible days and the advance-purchase window are re-priced.
+"""
+
+import threading
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from core.destinations import FlightProfile, get_registry
+from core.rmq import MinSegmentTree
+from tools.fare_grid import RED_EYE_DISCOUNT, WEEKDAY_SURCHARGE_USD, WEEKEND_SURCHARGE_USD
+
+CALENDAR_DAYS = 365
+ADVANCE_PURCHASE_DAYS = 14  # Fares rise for departures closer than this
+ADVANCE_PURCHASE_USD = 8.0  # Per day inside the advance-purchase window
+
+
+def leg_fare(profile: FlightProfile, day: date, today: date) -> float:
+    """Cheapest one-way fare on ``day``: half the round-trip model plus late-booking surcharge."""
+    weekday = day.weekday()
+    fare = (
+        profile.base_price_usd / 2
+        + WEEKDAY_SURCHARGE_USD / 2 * weekday
+        + (WEEKEND_SURCHARGE_USD / 2 if weekday >= 5 else 0.0)
+    ) * RED_EYE_DISCOUNT
+    days_ahead = (day - today).days
+    if days_ahead < ADVANCE_PURCHASE_DAYS:
+        fare += (ADVANCE_PURCHASE_DAYS - days_ahead) * ADVANCE_PURCHASE_USD
+    return fare
+
+
+class FareCalendar:
+    """
+    One-way fares for ``days`` consecutive departure dates starting today.
+
+    Day ``i`` (0 = today) lives in ring slot ``(head + i) % days``. One
+    segment tree holds the daily fares; one more per requested trip length
+    ``N`` holds ``fare[i] + fare[i + N]`` and is built on first use.
+    """
+
+    def __init__(self, profile: FlightProfile, today: Optional[date] = None, days: int = CALENDAR_DAYS):
+        self.profile = profile
+        self.days = days
+        self._lock = threading.Lock()
+        self._rebuild(today or date.today())
+
+    def _rebuild(self, today: date) -> None:
+        self.start = today
+        self._head = 0
+        self._fares = MinSegmentTree(
+            self.days, (leg_fare(self.profile, today + timedelta(days=i), today) for i in range(self.days))
+        )
+        self._trips: Dict[int, MinSegmentTree] = {}
+        self.repriced_days = self.days
+
+    def _slot(self, index: int) -> int:
+        return (self._head + index) % self.days
+
+    def _index(self, slot: int) -> int:
+        return (slot - self._head) % self.days
+
+    def _fare_at(self, index: int) -> float:
+        return self._fares[self._slot(index)]
+
+    def _trip_value(self, index: int, nights: int) -> float:
+        if index + nights >= self.days:
+            return float("inf")
+        return self._fare_at(index) + self._fare_at(index + nights)
+
+    def _trip_tree(self, nights: int) -> MinSegmentTree:
+        tree = self._trips.get(nights)
+        if tree is None:
+            values = [float("inf")] * self.days
+            for index in range(self.days):
+                values[self._slot(index)] = self._trip_value(index, nights)
+            tree = self._trips[nights] = MinSegmentTree(self.days, values)
+        return tree
+
+    def _query(self, tree: MinSegmentTree, first: int, last: int) -> Tuple[float, int]:
+        """Range minimum over day indices, splitting ranges that wrap the ring."""
+        lo, hi = self._slot(first), self._slot(last)
+        if lo <= hi:
+            value, slot = tree.query(lo, hi)
+        else:
+            # Earlier days first so ties still resolve to the earliest date
+            value, slot = tree.query(lo, self.days - 1)
+            tail_value, tail_slot = tree.query(0, hi)
+            if tail_value < value:
+                value, slot = tail_value, tail_slot
+        return value, (self._index(slot) if slot >= 0 else -1)
+
+    def _clip(self, window_start: Optional[date], window_end: Optional[date], reserve: int = 0) -> Optional[Tuple[int, int]]:
+        first = 0 if window_start is None else (window_start - self.start).days
+        last = self.days - 1 - reserve if window_end is None else (window_end - self.start).days
+        first = max(first, 0)
+        last = min(last, self.days - 1 - reserve)
+        return (first, last) if first <= last else None
+
+    def advance_to(self, today: date) -> int:
+        """
+        Roll the calendar forward to ``today``; returns how many days were re-priced.
+
+        Only the days that scrolled into view and the advance-purchase window
+        change, so each is a point update. Going backwards or jumping past the
+        whole horizon rebuilds from scratch.
+        """
+        with self._lock:
+            shift = (today - self.start).days
+            if shift == 0:
+                self.repriced_days = 0
+                return 0
+            if shift < 0 or shift >= self.days:
+                self._rebuild(today)
+                return self.repriced_days
+
+            self._head = (self._head + shift) % self.days
+            self.start = today
+            changed = set(range(self.days - shift, self.days))
+            changed.update(range(min(ADVANCE_PURCHASE_DAYS, self.days)))
+            for index in changed:
+                self._fares[self._slot(index)] = leg_fare(self.profile, today + timedelta(days=index), today)
+            for nights, tree in self._trips.items():
+                for index in changed | {i - nights for i in changed if i >= nights}:
+                    tree[self._slot(index)] = self._trip_value(index, nights)
+            self.repriced_days = len(changed)
+            return self.repriced_days
+
+    def fare(self, day: date) -> Optional[float]:
+        """One-way fare for a departure date, or None outside the calendar."""
+        index = (day - self.start).days
+        if not 0 <= index < self.days:
+            return None
+        return self._fare_at(index)
+
+    def cheapest_departure(
+        self, window_start: Optional[date] = None, window_end: Optional[date] = None
+    ) -> Optional[Tuple[date, float]]:
+        """Cheapest departure date (earliest on ties) in the window, with its fare."""
+        with self._lock:
+            window = self._clip(window_start, window_end)
+            if window is None:
+                return None
+            fare, index = self._query(self._fares, *window)
+            return self.start + timedelta(days=index), fare
+
+    def cheapest_trip(
+        self, nights: int, window_start: Optional[date] = None, window_end: Optional[date] = None
+    ) -> Optional[Tuple[date, date, float]]:
+        """Cheapest ``nights``-night round trip departing in the window: (departure, return, price)."""
+        if nights < 1:
+            raise ValueError("nights must be at least 1")
+        with self._lock:
+            window = self._clip(window_start, window_end, reserve=nights)
+            if window is None:
+                return None
+            price, index = self._query(self._trip_tree(nights), *window)
+            departure = self.start + timedelta(days=index)
+            return departure, departure + timedelta(days=nights), price
+
+    def fares(self) -> List[Tuple[date, float]]:
+        """Every (date, fare) in calendar order."""
+        with self._lock:
+            return [(self.start + timedelta(days=i), self._fare_at(i)) for i in range(self.days)]
+
+
+@lru_cache(maxsize=256)
+def _route_calendar(origin: str, destination: str) -> FareCalendar:
+    return FareCalendar(get_registry().flight_profile(destination))
+
+
+def get_fare_calendar(origin: str, destination: str, today: Optional[date] = None) -> FareCalendar:
+    """Shared calendar for a route, rolled forward to ``today`` on access."""
+    calendar = _route_calendar(origin.upper(), destination.upper())
+    calendar.advance_to(today or date.today())
+    return calendar
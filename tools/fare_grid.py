@@ -0,0 +1,425 @@
+"""Vectorized fare grid behind the mock flight search.
+
+Every candidate (departure, return) date pair is a row and every itinerary
+variant a column of one float64 price matrix, so pricing, summary statistics
+and top-k selection are whole-array NumPy operations. Option dicts are only
+built for the rows actually returned.
+"""
+
+import heapq
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.batch import FlightBatch
+from core.destinations import FlightProfile
+
+# Itinerary variants (matrix columns): 0 = daytime with one layover, 1 = nonstop red-eye
+VARIANT_COUNT = 2
+RED_EYE_DISCOUNT = 0.85
+WEEKDAY_SURCHARGE_USD = 30.0  # Added per weekday index (Mon=0 ... Sun=6)
+OFFSET_SURCHARGE_USD = 20.0  # Per day shifted from the preferred departure date
+WEEKEND_SURCHARGE_USD = 50.0
+TRIP_LENGTH_CHANGE_USD = 15.0  # Per day the trip is longer or shorter than requested
+VARIANT_LAYOVERS = (1, 0)
+VARIANT_MULTIPLIERS = (1.0, RED_EYE_DISCOUNT)
+
+
+def allowed_variants(
+    profile: FlightProfile,
+    max_layovers: Optional[int] = None,
+    airlines: Optional[Sequence[str]] = None,
+) -> List[int]:
+    """Variant columns that pass the layover and airline filters."""
+    return [
+        variant
+        for variant in range(VARIANT_COUNT)
+        if (max_layovers is None or VARIANT_LAYOVERS[variant] <= max_layovers)
+        and (airlines is None or profile.airlines[variant % len(profile.airlines)] in airlines)
+    ]
+
+
+def _option_dict(profile: FlightProfile, dep: date, ret: date, price: float, variant: int, weekday: int) -> dict:
+    """Flight search option dict for one (date pair, variant) cell."""
+    is_red_eye = variant == 1
+    departure = dep.isoformat()
+    return {
+        "departure_date": departure,
+        "return_date": ret.isoformat(),
+        "price_usd": price,
+        "airline": profile.airlines[variant % len(profile.airlines)],
+        "departure_time": "08:30" if not is_red_eye else "23:45",
+        "return_time": "14:20",
+        "is_red_eye": is_red_eye,
+        "is_weekday": weekday < 5,
+        "layovers": VARIANT_LAYOVERS[variant],
+        "total_duration_hours": (
+            profile.duration_hours if is_red_eye else profile.duration_with_layover_hours
+        ),
+        "booking_code": f"FLT-{departure}-{variant}",
+    }
+
+
+def smallest_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the ``k`` smallest values, ordered by value then index.
+
+    Uses ``argpartition`` so only the selected values are sorted. Ties at the
+    cut-off are resolved by position, matching a stable sort of the full array.
+    """
+    n = values.size
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= n:
+        return np.argsort(values, kind="stable")
+
+    threshold = values[np.argpartition(values, k - 1)[k - 1]]
+    below = np.flatnonzero(values < threshold)
+    ties = np.flatnonzero(values == threshold)[: k - below.size]
+    chosen = np.concatenate((below, ties))
+    chosen.sort()
+    return chosen[np.argsort(values[chosen], kind="stable")]
+
+
+class FareGrid:
+    """
+    Prices for every (departure, return, variant) cell of one flight search.
+
+    ``dep_ordinals`` and ``ret_ordinals`` are ``date.toordinal()`` values for
+    each candidate date pair, and ``dep_offsets`` the departure shift in days
+    from the preferred date, which drives the flexibility surcharge.
+    """
+
+    def __init__(
+        self,
+        profile: FlightProfile,
+        dep_ordinals: np.ndarray,
+        ret_ordinals: np.ndarray,
+        dep_offsets: np.ndarray,
+    ):
+        self.profile = profile
+        self.dep_ordinals = np.asarray(dep_ordinals, dtype=np.int64)
+        self.ret_ordinals = np.asarray(ret_ordinals, dtype=np.int64)
+        self.dep_offsets = np.asarray(dep_offsets, dtype=np.int64)
+
+        # date(1, 1, 1) has ordinal 1 and is a Monday
+        self.weekdays = (self.dep_ordinals - 1) % 7
+        base = (
+            float(profile.base_price_usd)
+            + WEEKDAY_SURCHARGE_USD * self.weekdays
+            + OFFSET_SURCHARGE_USD * self.dep_offsets
+            + np.where(self.weekdays >= 5, WEEKEND_SURCHARGE_USD, 0.0)
+        )
+        self.prices = np.empty((base.size, VARIANT_COUNT), dtype=np.float64)
+        self.prices[:, 0] = base
+        self.prices[:, 1] = base * RED_EYE_DISCOUNT
+
+    @property
+    def pairs(self) -> int:
+        """Number of candidate date pairs (matrix rows)."""
+        return self.prices.shape[0]
+
+    @property
+    def size(self) -> int:
+        """Number of priced cells (date pairs x variants)."""
+        return self.prices.size
+
+    def select(
+        self,
+        max_price: Optional[float] = None,
+        max_layovers: Optional[int] = None,
+        airlines: Optional[Sequence[str]] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Flat indices (ascending) of the cells passing every filter.
+
+        Returns None when no filter is given, meaning every cell.
+        """
+        if max_price is None and max_layovers is None and airlines is None:
+            return None
+        mask = np.zeros(self.prices.shape, dtype=bool)
+        mask[:, allowed_variants(self.profile, max_layovers, airlines)] = True
+        if max_price is not None:
+            mask &= self.prices <= max_price
+        return np.flatnonzero(mask)
+
+    def top_k(self, k: int, cells: Optional[np.ndarray] = None) -> np.ndarray:
+        """Flat cell indices of the ``k`` cheapest options (among ``cells``), cheapest first."""
+        if cells is None:
+            return smallest_k(self.prices.ravel(), k)
+        return cells[smallest_k(self.prices.ravel()[cells], k)]
+
+    def options_for(self, cells: np.ndarray) -> List[dict]:
+        """Build option dicts for the given flat cell indices, in order."""
+        cells = np.asarray(cells, dtype=np.intp)
+        rows, variants = np.divmod(cells, VARIANT_COUNT)
+        # Gather once and convert to Python scalars; per-element NumPy access is slow
+        prices = self.prices.ravel()[cells].tolist()
+        dep_ordinals = self.dep_ordinals[rows].tolist()
+        ret_ordinals = self.ret_ordinals[rows].tolist()
+        weekdays = self.weekdays[rows].tolist()
+        profile = self.profile
+
+        return [
+            _option_dict(
+                profile, date.fromordinal(dep_ordinal), date.fromordinal(ret_ordinal), price, variant, weekday
+            )
+            for price, variant, dep_ordinal, ret_ordinal, weekday in zip(
+                prices, variants.tolist(), dep_ordinals, ret_ordinals, weekdays
+            )
+        ]
+
+    def options(self, k: int, cells: Optional[np.ndarray] = None) -> List[dict]:
+        """Option dicts for the ``k`` cheapest cells (among ``cells``)."""
+        return self.options_for(self.top_k(k, cells))
+
+    def flight_batch(self) -> FlightBatch:
+        """Every cell as a scoring batch, in flat cell order."""
+        return FlightBatch(
+            price_usd=self.prices.ravel(),
+            layovers=np.tile(VARIANT_LAYOVERS, self.pairs),
+            is_weekday=np.repeat(self.weekdays < 5, VARIANT_COUNT),
+            is_red_eye=np.tile([False, True], self.pairs),
+        )
+
+    def summary(self, cells: Optional[np.ndarray] = None) -> str:
+        """One-line summary over every priced cell (or ``cells``), not just the returned ones."""
+        if cells is None:
+            if self.size == 0:
+                return "No flight options found for specified dates."
+            weekday_options = int(np.count_nonzero(self.weekdays < 5)) * VARIANT_COUNT
+            red_eye_options = self.pairs
+            return (
+                f"Found {self.size} flight options. "
+                f"Price range: ${self.prices.min():.0f}-${self.prices.max():.0f}. "
+                f"{weekday_options} weekday options, {red_eye_options} red-eye options available."
+            )
+
+        if cells.size == 0:
+            return "No flight options match the requested filters."
+        rows, variants = np.divmod(cells, VARIANT_COUNT)
+        prices = self.prices.ravel()[cells]
+        return (
+            f"Found {cells.size} flight options. "
+            f"Price range: ${prices.min():.0f}-${prices.max():.0f}. "
+            f"{int(np.count_nonzero(self.weekdays[rows] < 5))} weekday options, "
+            f"{int(np.count_nonzero(variants == 1))} red-eye options available."
+        )
+
+
+def paired_fare_grid(
+    profile: FlightProfile,
+    departure: date,
+    return_: date,
+    flexibility_days: int,
+    today: Optional[date] = None,
+    min_trip_days: int = 1,
+    max_trip_days: Optional[int] = None,
+) -> FareGrid:
+    """
+    Grid where departure and return shift together by the same day offset.
+
+    Date pairs departing before ``today`` or whose trip length falls outside
+    [``min_trip_days``, ``max_trip_days``] are dropped.
+    """
+    today = today or date.today()
+    offsets = np.arange(-flexibility_days, flexibility_days + 1, dtype=np.int64)
+    dep = departure.toordinal() + offsets
+    ret = return_.toordinal() + offsets
+    valid = (dep >= today.toordinal()) & (ret - dep >= max(1, min_trip_days))
+    if max_trip_days is not None:
+        valid &= ret - dep <= max_trip_days
+    return FareGrid(profile, dep[valid], ret[valid], offsets[valid])
+
+
+@dataclass
+class FlexSearchResult:
+    """Top-k options of a 2-D flexible search plus pruning statistics."""
+    options: List[dict]
+    candidates: int  # Valid (departure, return, variant) cells in the grid
+    evaluated: int  # Cells individually priced
+    min_price: float
+    max_price: float
+    weekday_options: int
+    red_eye_options: int
+
+    @property
+    def pruned(self) -> int:
+        """Cells skipped because their row's lower bound could not make the top-k."""
+        return self.candidates - self.evaluated
+
+    def summary(self) -> str:
+        """One-line summary matching the paired search's wording."""
+        if not self.candidates:
+            return "No flight options found for specified dates."
+        return (
+            f"Found {self.candidates} flight options. "
+            f"Price range: ${self.min_price:.0f}-${self.max_price:.0f}. "
+            f"{self.weekday_options} weekday options, {self.red_eye_options} red-eye options available."
+        )
+
+    def stats(self) -> dict:
+        """Counts reported alongside the options."""
+        return {"candidates": self.candidates, "evaluated": self.evaluated, "pruned": self.pruned}
+
+
+def _closest_to_zero(lo: int, hi: int) -> int:
+    """Smallest |x| for x in the integer interval [lo, hi] (lo <= hi)."""
+    if lo > 0:
+        return lo
+    if hi < 0:
+        return -hi
+    return 0
+
+
+def _max_distance(base: float, multiplier: float, max_price: Optional[float]) -> Optional[int]:
+    """
+    Largest trip-length change whose fare stays within ``max_price``.
+
+    None means unbounded; -1 means even the requested trip length is too dear.
+    The estimate is corrected against the exact fare expression so float
+    rounding can never disagree with the per-cell comparison.
+    """
+    if max_price is None or max_price == float("inf"):
+        return None
+
+    def fare(distance: int) -> float:
+        return (base + TRIP_LENGTH_CHANGE_USD * distance) * multiplier
+
+    if fare(0) > max_price:
+        return -1
+    distance = int((max_price / multiplier - base) // TRIP_LENGTH_CHANGE_USD)
+    while distance > 0 and fare(distance) > max_price:
+        distance -= 1
+    while fare(distance + 1) <= max_price:
+        distance += 1
+    return distance
+
+
+def flexible_search(
+    profile: FlightProfile,
+    departure: date,
+    return_: date,
+    departure_flex_days: int,
+    return_flex_days: int,
+    k: int = 10,
+    today: Optional[date] = None,
+    min_trip_days: int = 1,
+    max_trip_days: Optional[int] = None,
+    max_price: Optional[float] = None,
+    max_layovers: Optional[int] = None,
+    airlines: Optional[Sequence[str]] = None,
+) -> FlexSearchResult:
+    """
+    Top-k search over the full departure x return date grid.
+
+    Departure and return each shift independently within their own window;
+    a trip longer or shorter than requested costs ``TRIP_LENGTH_CHANGE_USD``
+    per day, so the diagonal (equal shifts) prices exactly like the paired
+    grid. For each departure row and variant the valid returns form one
+    interval (a price cap only narrows it around the requested trip length),
+    which gives the row's count, cheapest and dearest cell in O(1). Rows are
+    visited cheapest-bound first and cells pushed through a size-k heap; once
+    a row's bound cannot beat the current k-th best, it and every later row
+    are pruned without pricing a single cell.
+    """
+    today_ordinal = (today or date.today()).toordinal()
+    dep_ordinal = departure.toordinal()
+    ret_ordinal = return_.toordinal()
+    min_trip = max(1, min_trip_days)
+    variants = allowed_variants(profile, max_layovers, airlines)
+
+    rows: List[Tuple[float, int, float, int, List[Tuple[int, int, int]]]] = []
+    candidates = weekday_options = red_eye_options = 0
+    min_price = float("inf")
+    max_price_seen = float("-inf")
+    for dep_offset in range(-departure_flex_days, departure_flex_days + 1):
+        dep = dep_ordinal + dep_offset
+        if dep < today_ordinal:
+            continue
+        # Valid return offsets: inside the return window and the trip-length bounds
+        lo = max(-return_flex_days, dep + min_trip - ret_ordinal)
+        hi = return_flex_days
+        if max_trip_days is not None:
+            hi = min(hi, dep + max_trip_days - ret_ordinal)
+        if lo > hi:
+            continue
+
+        weekday = (dep - 1) % 7
+        base = (
+            float(profile.base_price_usd)
+            + WEEKDAY_SURCHARGE_USD * weekday
+            + OFFSET_SURCHARGE_USD * dep_offset
+            + (WEEKEND_SURCHARGE_USD if weekday >= 5 else 0.0)
+        )
+        spans = []
+        bound = float("inf")
+        for variant in variants:
+            multiplier = VARIANT_MULTIPLIERS[variant]
+            distance = _max_distance(base, multiplier, max_price)
+            v_lo, v_hi = lo, hi
+            if distance is not None:
+                v_lo, v_hi = max(lo, dep_offset - distance), min(hi, dep_offset + distance)
+            if v_lo > v_hi:
+                continue
+            spans.append((variant, v_lo, v_hi))
+            cells = v_hi - v_lo + 1
+            candidates += cells
+            if weekday < 5:
+                weekday_options += cells
+            if variant == 1:
+                red_eye_options += cells
+            nearest = _closest_to_zero(v_lo - dep_offset, v_hi - dep_offset)
+            farthest = max(abs(v_lo - dep_offset), abs(v_hi - dep_offset))
+            bound = min(bound, (base + TRIP_LENGTH_CHANGE_USD * nearest) * multiplier)
+            max_price_seen = max(max_price_seen, (base + TRIP_LENGTH_CHANGE_USD * farthest) * multiplier)
+        if not spans:
+            continue
+        min_price = min(min_price, bound)
+        rows.append((bound, dep_offset, base, weekday, spans))
+
+    rows.sort(key=lambda row: (row[0], row[1]))
+    # Max-heap of the k best cells so far, keyed by (price, dep offset, ret offset, variant)
+    heap: List[Tuple[float, int, int, int, int]] = []
+    evaluated = 0
+    for bound, dep_offset, base, weekday, spans in rows:
+        if k <= 0 or (len(heap) >= k and (bound, dep_offset) > (-heap[0][0], -heap[0][1])):
+            break
+        first = min(span[1] for span in spans)
+        last = max(span[2] for span in spans)
+        for ret_offset in range(first, last + 1):
+            fare = base + TRIP_LENGTH_CHANGE_USD * abs(ret_offset - dep_offset)
+            for variant, v_lo, v_hi in spans:
+                if not v_lo <= ret_offset <= v_hi:
+                    continue
+                price = fare * VARIANT_MULTIPLIERS[variant]
+                evaluated += 1
+                entry = (-price, -dep_offset, -ret_offset, -variant, weekday)
+                if len(heap) < k:
+                    heapq.heappush(heap, entry)
+                elif entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+
+    options = [
+        _option_dict(
+            profile,
+            date.fromordinal(dep_ordinal - neg_dep),
+            date.fromordinal(ret_ordinal - neg_ret),
+            -neg_price,
+            -neg_variant,
+            weekday,
+        )
+        for neg_price, neg_dep, neg_ret, neg_variant, weekday in sorted(heap, reverse=True)
+    ]
+
+    return FlexSearchResult(
+        options=options,
+        candidates=candidates,
+        evaluated=evaluated,
+        min_price=min_price if candidates else 0.0,
+        max_price=max_price_seen if candidates else 0.0,
+        weekday_options=weekday_options,
+        red_eye_options=red_eye_options,
+    )
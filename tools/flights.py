@@ -16,6 +16,10 @@ class SearchFlightsRequest(BaseModel):
     departure_date: str = Field(..., description="Preferred departure date YYYY-MM-DD")
     return_date: str = Field(..., description="Preferred return date YYYY-MM-DD")
     flexibility_days: int = Field(default=3, description="Days +/- to consider for flexibility")
+    max_price: float | None = Field(None, description="Drop itineraries priced above this (USD)")
+    max_layovers: int | None = Field(None, description="Drop itineraries with more layovers than this")
+    brands_only: list[str] | None = Field(None, description="Only return itineraries flown by these airlines")
+    limit: int = Field(default=10, description="Maximum number of options to return")
 
 
 class FlightOptionResponse(BaseModel):
@@ -41,6 +45,17 @@ class FlightSearchResponse(BaseModel):
     summary: str = Field(..., description="Brief summary of options and price range")
 
 
+def flight_passes_filters(request: SearchFlightsRequest, price: float, layovers: int, airline: str) -> bool:
+    """Whether an itinerary satisfies the request's optional filters."""
+    if request.max_price is not None and price > request.max_price:
+        return False
+    if request.max_layovers is not None and layovers > request.max_layovers:
+        return False
+    if request.brands_only is not None and airline not in request.brands_only:
+        return False
+    return True
+
+
 @mcp.tool()
 def search_flights(request: SearchFlightsRequest) -> FlightSearchResponse:
     """
@@ -51,7 +66,8 @@ def search_flights(request: SearchFlightsRequest) -> FlightSearchResponse:
     user affordability thresholds (handled by agent reasoning).
     
     Returns only essential fields - no raw API dumps. Options are pre-filtered
-    to reasonable candidates (not all possible combinations).
+    to reasonable candidates (not all possible combinations), and the optional
+    price, layover and airline filters are applied before options are built.
     
     Idempotent: same booking_code can be reused safely.
     """
@@ -84,16 +100,21 @@ def search_flights(request: SearchFlightsRequest) -> FlightSearchResponse:
                 if is_red_eye:
                     price *= 0.85
                 
+                airline = "United" if variant == 0 else "Hawaiian"
+                layovers = 1 if variant == 0 else 0
+                if not flight_passes_filters(request, price, layovers, airline):
+                    continue
+                
                 options.append(FlightOptionResponse(
                     departure_date=candidate_dep.isoformat(),
                     return_date=candidate_ret.isoformat(),
                     price_usd=price,
-                    airline="United" if variant == 0 else "Hawaiian",
+                    airline=airline,
                     departure_time="08:30" if not is_red_eye else "23:45",
                     return_time="14:20",
                     is_red_eye=is_red_eye,
                     is_weekday=is_weekday,
-                    layovers=1 if variant == 0 else 0,
+                    layovers=layovers,
                     total_duration_hours=8.5 if variant == 0 else 6.0,
                     booking_code=f"FLT-{candidate_dep.isoformat()}-{variant}",
                 ))
@@ -112,13 +133,15 @@ def search_flights(request: SearchFlightsRequest) -> FlightSearchResponse:
             f"Found {len(options)} flight options. Price range: ${min_price:.0f}-${max_price:.0f}. "
             f"{len(weekday_options)} weekday options, {len(red_eye_options)} red-eye options available."
         )
+    elif request.max_price is not None or request.max_layovers is not None or request.brands_only is not None:
+        summary = "No flight options match the requested filters."
     else:
         summary = "No flight options found for specified dates."
     
     return FlightSearchResponse(
         origin=request.origin,
         destination=request.destination,
-        options=options[:10],  # Limit to top 10
+        options=options[:request.limit],
         summary=summary,
     )
 
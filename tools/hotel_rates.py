@@ -0,0 +1,167 @@
+"""Per-night hotel rate calendar with prefix sums.
+
+Rates for every property and night over the next ``CALENDAR_DAYS`` nights
+are stored as one contiguous (properties x nights) float64 array, with a
+running prefix sum per property. The total for any stay is then a single
+subtraction, and every (check-in, length) combination for a destination
+can be priced in one vectorized call.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.hotel_index import HotelIndex
+
+CALENDAR_DAYS = 365
+WEEKEND_NIGHT_PREMIUM = 1.15  # Friday and Saturday nights
+PREFERRED_BRAND_DISCOUNT = 0.95
+STORM_DISCOUNT = 0.75
+STORM_PROMO_PROPERTIES = 2  # The cheapest brands run the storm promotion
+STORM_PROMO_DAY_INTERVAL = 7  # On check-in days of the month divisible by this
+
+# Mock inventory: every destination has one property per brand
+BRANDS = ("Marriott", "Hilton", "Hyatt", "Westin", "Four Seasons", "Budget Inn")
+
+
+@dataclass(frozen=True)
+class HotelProperty:
+    """A bookable property and its undiscounted weekday nightly rate."""
+    index: int
+    brand: str
+    name: str
+    base_rate_usd: float
+    rating: float
+
+
+def destination_properties(destination: str) -> Tuple[HotelProperty, ...]:
+    """The mock properties for a destination."""
+    return tuple(
+        HotelProperty(
+            index=i,
+            brand=brand,
+            name=f"{brand} {destination}",
+            base_rate_usd=120.0 + (i * 40.0),
+            rating=min(5.0, 3.0 + (i * 0.4)),
+        )
+        for i, brand in enumerate(BRANDS)
+    )
+
+
+def nightly_rates(base_rates: np.ndarray, first_night: date, nights: int) -> np.ndarray:
+    """(properties x nights) rates starting at ``first_night``."""
+    weekdays = (first_night.toordinal() - 1 + np.arange(nights)) % 7
+    multipliers = np.where((weekdays == 4) | (weekdays == 5), WEEKEND_NIGHT_PREMIUM, 1.0)
+    return np.asarray(base_rates, dtype=np.float64)[:, None] * multipliers[None, :]
+
+
+def storm_promo_property(index):
+    """Whether a property (by index; scalar or array) takes part in the storm promotion."""
+    return index < STORM_PROMO_PROPERTIES
+
+
+def storm_promo_day(day_of_month):
+    """Whether a check-in day of the month (scalar or array) gets the storm promotion."""
+    return day_of_month % STORM_PROMO_DAY_INTERVAL == 0
+
+
+def has_storm_discount(prop: HotelProperty, check_in: date) -> bool:
+    """Stay-level storm promotion on the cheapest brands for some check-in days."""
+    return storm_promo_property(prop.index) and storm_promo_day(check_in.day)
+
+
+@lru_cache(maxsize=256)
+def get_catalog_index(destination: str) -> HotelIndex:
+    """
+    Index of a destination's properties by base (weekday) nightly rate.
+
+    Every property's nights share the same weekend multipliers, so ordering
+    by base rate is also the ordering by undiscounted stay price.
+    """
+    return HotelIndex(
+        destination_properties(destination),
+        rate=lambda p: p.base_rate_usd,
+        brand=lambda p: p.brand,
+        rating=lambda p: p.rating,
+    )
+
+
+class HotelRateCalendar:
+    """
+    Nightly rates for a destination's properties over ``days`` nights from ``start``.
+
+    ``prefix[p, i]`` is the sum of property ``p``'s first ``i`` nights, so a
+    stay of ``n`` nights checking in on night ``i`` costs
+    ``prefix[p, i + n] - prefix[p, i]``.
+    """
+
+    def __init__(self, destination: str, start: Optional[date] = None, days: int = CALENDAR_DAYS):
+        self.destination = destination
+        self.start = start or date.today()
+        self.days = days
+        self.properties = destination_properties(destination)
+        self._base_rates = np.array([p.base_rate_usd for p in self.properties])
+        self.rates = np.ascontiguousarray(nightly_rates(self._base_rates, self.start, days))
+        self.prefix = np.zeros((len(self.properties), days + 1))
+        np.cumsum(self.rates, axis=1, out=self.prefix[:, 1:])
+
+    def stay_totals(self, check_in: date, nights: int) -> np.ndarray:
+        """Undiscounted total per property for one stay; O(1) per property inside the calendar."""
+        first = (check_in - self.start).days
+        if 0 <= first and first + nights <= self.days:
+            return self.prefix[:, first + nights] - self.prefix[:, first]
+        # Outside the calendar (past dates or beyond the horizon): price directly
+        return nightly_rates(self._base_rates, check_in, nights).sum(axis=1)
+
+    def price_stays(self, first_check_in: date, check_ins: int, lengths: Sequence[int]) -> np.ndarray:
+        """
+        Undiscounted totals for every property, check-in and stay length.
+
+        Returns a (properties x check_ins x lengths) array; combinations that
+        run outside the calendar are ``nan``.
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        starts = (first_check_in - self.start).days + np.arange(check_ins, dtype=np.int64)
+        ends = starts[:, None] + lengths[None, :]
+        valid = (starts[:, None] >= 0) & (ends <= self.days) & (lengths[None, :] > 0)
+
+        start_idx = np.broadcast_to(np.clip(starts, 0, self.days)[:, None], ends.shape)
+        end_idx = np.clip(ends, 0, self.days)
+        totals = self.prefix[:, end_idx] - self.prefix[:, start_idx]
+        totals[:, ~valid] = np.nan
+        return totals
+
+    def quote_stays(
+        self,
+        first_check_in: date,
+        check_ins: int,
+        lengths: Sequence[int],
+        preferred_brands: Sequence[str] = (),
+    ) -> np.ndarray:
+        """
+        Like ``price_stays`` but with the preferred-brand and storm discounts
+        applied, so each cell equals ``search_hotels_tool``'s total price.
+        """
+        totals = self.price_stays(first_check_in, check_ins, lengths)
+        preferred = np.array([p.brand in preferred_brands for p in self.properties])
+        totals[preferred] *= PREFERRED_BRAND_DISCOUNT
+
+        first = first_check_in.toordinal()
+        days_of_month = np.array([date.fromordinal(first + i).day for i in range(check_ins)])
+        stormy_property = storm_promo_property(np.array([p.index for p in self.properties]))
+        storm = stormy_property[:, None] & storm_promo_day(days_of_month)[None, :]
+        totals[storm] *= STORM_DISCOUNT
+        return totals
+
+
+@lru_cache(maxsize=256)
+def _destination_calendar(destination: str, start: date) -> HotelRateCalendar:
+    return HotelRateCalendar(destination, start)
+
+
+def get_rate_calendar(destination: str, today: Optional[date] = None) -> HotelRateCalendar:
+    """Shared calendar for a destination starting ``today``; rebuilt when the date changes."""
+    return _destination_calendar(destination, today or date.today())
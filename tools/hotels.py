@@ -15,6 +15,10 @@ class SearchHotelsRequest(BaseModel):
     check_in_date: str = Field(..., description="Check-in date YYYY-MM-DD")
     check_out_date: str = Field(..., description="Check-out date YYYY-MM-DD")
     preferred_brands: list[str] = Field(default_factory=list, description="Preferred hotel brands")
+    max_price: float | None = Field(None, description="Drop hotels whose nightly rate is above this (USD)")
+    min_rating: float | None = Field(None, description="Drop hotels rated below this")
+    brands_only: list[str] | None = Field(None, description="Only return hotels of these brands")
+    limit: int | None = Field(None, description="Maximum number of options to return (all by default)")
 
 
 class HotelOptionResponse(BaseModel):
@@ -38,6 +42,17 @@ class HotelSearchResponse(BaseModel):
     summary: str = Field(..., description="Brief summary of options and price range")
 
 
+def hotel_passes_filters(request: SearchHotelsRequest, nightly_rate: float, rating: float, brand: str) -> bool:
+    """Whether a hotel satisfies the request's optional filters."""
+    if request.max_price is not None and nightly_rate > request.max_price:
+        return False
+    if request.min_rating is not None and rating < request.min_rating:
+        return False
+    if request.brands_only is not None and brand not in request.brands_only:
+        return False
+    return True
+
+
 @mcp.tool()
 def search_hotels(request: SearchHotelsRequest) -> HotelSearchResponse:
     """
@@ -49,7 +64,8 @@ def search_hotels(request: SearchHotelsRequest) -> HotelSearchResponse:
     - Anomalous pricing (e.g., storm discounts) explicitly flagged
     
     Returns only essential fields - no raw API dumps. Options are pre-filtered
-    to reasonable candidates.
+    to reasonable candidates, and the optional price, rating and brand filters
+    are applied before options are built.
     
     Idempotent: same booking_code can be reused safely.
     """
@@ -97,6 +113,8 @@ def search_hotels(request: SearchHotelsRequest) -> HotelSearchResponse:
             rating = 5.0
         
         nightly_rate = base_rate
+        if not hotel_passes_filters(request, nightly_rate, rating, brand):
+            continue
         total_price = nightly_rate * nights
         
         options.append(HotelOptionResponse(
@@ -131,12 +149,14 @@ def search_hotels(request: SearchHotelsRequest) -> HotelSearchResponse:
         
         if anomalous:
             summary += f"{len(anomalous)} option(s) with anomalous pricing detected."
+    elif request.max_price is not None or request.min_rating is not None or request.brands_only is not None:
+        summary = "No hotel options match the requested filters."
     else:
         summary = "No hotel options found for specified dates."
     
     return HotelSearchResponse(
         destination=request.destination,
-        options=options,
+        options=options[:request.limit],
         summary=summary,
     )
 
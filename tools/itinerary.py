@@ -0,0 +1,282 @@
+"""Multi-city itinerary planning by dynamic programming.
+
+Chooses the order of the cities and the nights spent in each to minimize
+the trip's cost: flights plus hotels, plus ``WEATHER_PENALTY_USD`` per night
+scaled by how far that night's weather falls short of the user's
+preferences. Every stay's average nightly rate must be within the user's
+hotel budget, and nights can be required to clear a minimum weather score.
+
+State is (visited set, current city, day): the cheapest way to have
+finished a stay in ``city`` on ``day`` having visited exactly ``visited``.
+All visited sets are held in one (2**k x k) array per day, so each
+transition "fly to city c on day d and stay n nights" is a handful of NumPy
+operations over every visited set at once. Days nobody can reach are
+skipped, and stays that leave too few days for the remaining cities are
+pruned before they are priced.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.analysis import index_weather_periods, score_weather_period
+from core.destinations import get_registry, name_key
+from core.models import UserProfile, WeatherPeriod
+from tools.fare_calendar import leg_fare
+from tools.hotel_rates import get_rate_calendar
+
+MAX_CITIES = 8
+MAX_DAYS = 30  # Weather forecasts cover 30 days
+MIN_NIGHTS = 2
+WEATHER_PENALTY_USD = 100.0  # Per night with a weather score of 0
+
+
+@dataclass(frozen=True)
+class ItineraryStop:
+    """One city on the route: the flight in, the nights there and the hotel."""
+    city: str
+    arrival_date: date
+    nights: int
+    flight_usd: float
+    hotel: str
+    hotel_usd: float
+    weather_score: float  # Worst night's weather score
+
+
+@dataclass(frozen=True)
+class Itinerary:
+    """The cheapest feasible route through every requested city."""
+    origin: str
+    stops: Tuple[ItineraryStop, ...]
+    return_date: date
+    return_flight_usd: float
+    total_usd: float  # Flights and hotels
+    weather_penalty_usd: float
+
+
+def _flight_profile(city: str):
+    registry = get_registry()
+    dest = registry.by_city(city) or registry.by_alias(city)
+    return registry.flight_profile(dest.airport_code if dest else city)
+
+
+def night_weather_scores(periods: Sequence[WeatherPeriod], profile: UserProfile, start: date, days: int) -> np.ndarray:
+    """The user's weather score for each of ``days`` nights from ``start`` (0 where nothing is forecast)."""
+    index = index_weather_periods(periods)
+    scores = np.zeros(days)
+    for night in range(days):
+        period = index.stab(start + timedelta(days=night))
+        if period is not None:
+            scores[night] = score_weather_period(period, profile)[0]
+    return scores
+
+
+def stay_costs(
+    city: str,
+    profile: UserProfile,
+    start: date,
+    days: int,
+    weather: np.ndarray,
+    min_weather_score: float = 0.0,
+    today: Optional[date] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cheapest acceptable hotel for every (first night, nights) stay in ``city``.
+
+    Returns ``(costs, properties)``, both (days x days + 1): the total for the
+    cheapest property whose average nightly rate is within the user's hotel
+    budget (``inf`` when none is, or when a night's weather scores below
+    ``min_weather_score``), and that property's index.
+    """
+    calendar = get_rate_calendar(city, today)
+    lengths = np.arange(days + 1)
+    totals = calendar.quote_stays(start, days, lengths, profile.preferred_brands)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nightly = totals / lengths
+    totals = np.where(nightly <= profile.hotel_budget_max, totals, np.inf)
+    properties = totals.argmin(axis=0)
+    costs = totals.min(axis=0)
+
+    # A stay is out when it runs past the trip or any of its nights has poor weather
+    bad = np.concatenate(([0], np.cumsum(weather < min_weather_score)))
+    firsts = np.arange(days)[:, None]
+    ends = firsts + lengths[None, :]
+    in_trip = ends <= days
+    clear = bad[np.minimum(ends, days)] == bad[firsts]
+    costs[~(in_trip & clear)] = np.inf
+    return costs, properties
+
+
+def solve_route(
+    legs: np.ndarray, home: np.ndarray, stays: np.ndarray, min_nights: int = MIN_NIGHTS
+) -> Optional[Tuple[float, List[Tuple[int, int, int]]]]:
+    """
+    Cheapest order and night allocation visiting every city exactly once.
+
+    ``legs[f, c, d]`` is the fare from city ``f`` (``f == k`` is the origin)
+    to city ``c`` on day ``d``; ``home[c, d]`` the fare home from ``c`` on day
+    ``d``; ``stays[c, d, n]`` the cost of ``n`` nights in ``c`` from night
+    ``d`` (``inf`` if not allowed). The trip leaves on day 0 and returns on
+    day ``D = stays.shape[1]``; each city gets at least ``min_nights``.
+
+    Returns: (total cost, [(city, arrival day, nights)] in visiting order),
+    or None when no route fits
+    """
+    k, days = stays.shape[0], stays.shape[1]
+    masks = np.arange(1 << k)
+    popcount = np.array([bin(mask).count("1") for mask in masks])
+    full = (1 << k) - 1
+
+    cost = np.full((days + 1, 1 << k, k), np.inf)
+    parent_day = np.zeros((days + 1, 1 << k, k), dtype=np.int64)
+    parent_city = np.full((days + 1, 1 << k, k), -1, dtype=np.int64)
+
+    for day in range(days):
+        if day == 0:
+            # Only the origin is "finished" on day 0
+            sources = {c: (np.array([0]), np.array([legs[k, c, 0]]), np.array([-1])) for c in range(k)}
+        else:
+            current = cost[day]
+            if not np.isfinite(current).any():
+                continue
+            sources = {}
+            for c in range(k):
+                free = masks[(masks & (1 << c)) == 0]
+                via = current[free] + legs[:k, c, day][None, :]
+                came_from = via.argmin(axis=1)
+                base = via[np.arange(len(free)), came_from]
+                alive = np.isfinite(base)
+                if alive.any():
+                    sources[c] = (free[alive], base[alive], came_from[alive])
+
+        for c, (free, base, came_from) in sources.items():
+            targets = free | (1 << c)
+            remaining = k - popcount[targets]
+            # Leave min_nights for every city still to visit; the last stay ends the trip
+            longest = np.where(remaining > 0, days - day - min_nights * remaining, days - day)
+            shortest = np.where(remaining > 0, min_nights, days - day)
+            for nights in range(max(1, min_nights), days - day + 1):
+                stay = stays[c, day, nights]
+                if not np.isfinite(stay):
+                    continue
+                fits = (shortest <= nights) & (nights <= longest)
+                if not fits.any():
+                    continue
+                total = base[fits] + stay
+                rows = targets[fits]
+                slot = cost[day + nights, rows, c]
+                better = total < slot
+                if better.any():
+                    rows = rows[better]
+                    cost[day + nights, rows, c] = total[better]
+                    parent_day[day + nights, rows, c] = day
+                    parent_city[day + nights, rows, c] = came_from[fits][better]
+
+    finals = cost[days, full] + home[:, days]
+    last = int(finals.argmin())
+    if not np.isfinite(finals[last]):
+        return None
+
+    route = []
+    mask, city, day = full, last, days
+    while city >= 0:
+        arrived = int(parent_day[day, mask, city])
+        previous = int(parent_city[day, mask, city])
+        route.append((city, arrived, day - arrived))
+        mask ^= 1 << city
+        city, day = previous, arrived
+    return float(finals[last]), route[::-1]
+
+
+def validate_request(cities: Sequence[str], days: int, min_nights: int = MIN_NIGHTS) -> None:
+    """
+    Raise ``ValueError`` unless ``cities`` are 1 to ``MAX_CITIES`` distinct
+    cities (compared the way the destination registry looks them up), ``days``
+    is 1 to ``MAX_DAYS`` and ``min_nights`` is at least 1.
+    """
+    if not 1 <= len(cities) <= MAX_CITIES:
+        raise ValueError(f"Itineraries cover 1 to {MAX_CITIES} cities, got {len(cities)}")
+    if len({name_key(city) for city in cities}) != len(cities):
+        raise ValueError("Each city can only be visited once")
+    if not 1 <= days <= MAX_DAYS:
+        raise ValueError(f"Itineraries span 1 to {MAX_DAYS} days, got {days}")
+    if min_nights < 1:
+        raise ValueError(f"Each city needs at least 1 night, got {min_nights}")
+
+
+def plan_itinerary(
+    profile: UserProfile,
+    origin: str,
+    cities: Sequence[str],
+    start: date,
+    days: int,
+    forecasts: Sequence[Sequence[WeatherPeriod]],
+    min_nights: int = MIN_NIGHTS,
+    min_weather_score: float = 0.0,
+    today: Optional[date] = None,
+) -> Optional[Itinerary]:
+    """
+    Cheapest route from ``origin`` through every city in ``cities`` and back.
+
+    ``forecasts[i]`` are the weather periods for ``cities[i]``. Every leg is
+    priced with the one-way fare model of the city it flies into (the route
+    profiles only describe flights from the origin), hotels from each
+    city's rate calendar with the user's preferred-brand discount.
+
+    Returns: the itinerary, or None when no route satisfies the constraints
+    """
+    validate_request(cities, days, min_nights)
+    if len(forecasts) != len(cities):
+        raise ValueError("Need one forecast per city")
+    today = today or date.today()
+    k = len(cities)
+
+    dates = [start + timedelta(days=d) for d in range(days + 1)]
+    arrival = np.array([[leg_fare(_flight_profile(city), day, today) for day in dates] for city in cities])
+    legs = np.broadcast_to(arrival[None, :, :], (k + 1, k, days + 1)).copy()
+    for c in range(k):
+        legs[c, c] = np.inf
+
+    hotels = np.empty((k, days, days + 1))
+    properties = np.empty((k, days, days + 1), dtype=np.int64)
+    penalties = np.empty((k, days, days + 1))
+    weather = [night_weather_scores(periods, profile, start, days) for periods in forecasts]
+    firsts = np.arange(days)[:, None]
+    ends = np.minimum(firsts + np.arange(days + 1)[None, :], days)
+    for c, city in enumerate(cities):
+        hotels[c], properties[c] = stay_costs(city, profile, start, days, weather[c], min_weather_score, today)
+        shortfall = np.concatenate(([0.0], np.cumsum(1.0 - weather[c])))
+        penalties[c] = WEATHER_PENALTY_USD * (shortfall[ends] - shortfall[firsts])
+
+    solved = solve_route(legs, arrival, hotels + penalties, min_nights)
+    if solved is None:
+        return None
+    _, route = solved
+
+    calendars = [get_rate_calendar(city, today) for city in cities]
+    stops = []
+    previous = k
+    penalty = 0.0
+    for c, day, nights in route:
+        penalty += float(penalties[c, day, nights])
+        stops.append(ItineraryStop(
+            city=cities[c],
+            arrival_date=dates[day],
+            nights=nights,
+            flight_usd=float(legs[previous, c, day]),
+            hotel=calendars[c].properties[properties[c, day, nights]].name,
+            hotel_usd=float(hotels[c, day, nights]),
+            weather_score=float(weather[c][day:day + nights].min()),
+        ))
+        previous = c
+    return_flight = float(arrival[previous, days])
+    return Itinerary(
+        origin=origin,
+        stops=tuple(stops),
+        return_date=dates[days],
+        return_flight_usd=return_flight,
+        total_usd=sum(stop.flight_usd + stop.hotel_usd for stop in stops) + return_flight,
+        weather_penalty_usd=penalty,
+    )
@@ -9,8 +9,8 @@ mcp = FastMCP("Travel Genie")
 # and register them with our unified server
 from tools.user_profile import GetUserProfileRequest, UserProfileResponse, _MOCK_PROFILES
 from tools.weather import GetWeatherForecastRequest, WeatherForecastResponse
-from tools.flights import SearchFlightsRequest, FlightSearchResponse
-from tools.hotels import SearchHotelsRequest, HotelSearchResponse
+from tools.flights import SearchFlightsRequest, FlightSearchResponse, flight_passes_filters
+from tools.hotels import SearchHotelsRequest, HotelSearchResponse, hotel_passes_filters
 
 from core.models import UserProfile, ComfortLevel
 from datetime import date, timedelta
@@ -128,16 +128,21 @@ def search_flights(request: SearchFlightsRequest) -> FlightSearchResponse:
                 if is_red_eye:
                     price *= 0.85
                 
+                airline = "United" if variant == 0 else "Hawaiian"
+                layovers = 1 if variant == 0 else 0
+                if not flight_passes_filters(request, price, layovers, airline):
+                    continue
+                
                 options.append(FlightOptionResponse(
                     departure_date=candidate_dep.isoformat(),
                     return_date=candidate_ret.isoformat(),
                     price_usd=price,
-                    airline="United" if variant == 0 else "Hawaiian",
+                    airline=airline,
                     departure_time="08:30" if not is_red_eye else "23:45",
                     return_time="14:20",
                     is_red_eye=is_red_eye,
                     is_weekday=is_weekday,
-                    layovers=1 if variant == 0 else 0,
+                    layovers=layovers,
                     total_duration_hours=8.5 if variant == 0 else 6.0,
                     booking_code=f"FLT-{candidate_dep.isoformat()}-{variant}",
                 ))
@@ -153,13 +158,15 @@ def search_flights(request: SearchFlightsRequest) -> FlightSearchResponse:
             f"Found {len(options)} flight options. Price range: ${min_price:.0f}-${max_price:.0f}. "
             f"{len(weekday_options)} weekday options, {len(red_eye_options)} red-eye options available."
         )
+    elif request.max_price is not None or request.max_layovers is not None or request.brands_only is not None:
+        summary = "No flight options match the requested filters."
     else:
         summary = "No flight options found for specified dates."
     
     return FlightSearchResponse(
         origin=request.origin,
         destination=request.destination,
-        options=options[:10],
+        options=options[:request.limit],
         summary=summary,
     )
 
@@ -202,6 +209,8 @@ def search_hotels(request: SearchHotelsRequest) -> HotelSearchResponse:
         
         rating = min(5.0, 3.0 + (i * 0.4))
         nightly_rate = base_rate
+        if not hotel_passes_filters(request, nightly_rate, rating, brand):
+            continue
         total_price = nightly_rate * nights
         
         options.append(HotelOptionResponse(
@@ -230,12 +239,14 @@ def search_hotels(request: SearchHotelsRequest) -> HotelSearchResponse:
             summary += f"{len(preferred_matches)} options match preferred brands. "
         if anomalous:
             summary += f"{len(anomalous)} option(s) with anomalous pricing detected."
+    elif request.max_price is not None or request.min_rating is not None or request.brands_only is not None:
+        summary = "No hotel options match the requested filters."
     else:
         summary = "No hotel options found for specified dates."
     
     return HotelSearchResponse(
         destination=request.destination,
-        options=options,
+        options=options[:request.limit],
         summary=summary,
     )
 
@@ -3,7 +3,7 @@
 from fastmcp import FastMCP
 from pydantic import BaseModel, Field
 
-from core.models import UserProfile, ComfortLevel
+from core.profiles import MOCK_PROFILES
 
 mcp = FastMCP("Travel Genie Tools")
 
@@ -30,41 +30,8 @@ class UserProfileResponse(BaseModel):
     safety_conscious: bool = Field(..., description="Whether user prioritizes safety over other factors")
 
 
-# Mock user profile storage (in production, this would query a database)
-_MOCK_PROFILES = {
-    "user_123": UserProfile(
-        user_id="user_123",
-        citizenship="USA",
-        passport_country="USA",
-        preferred_temp_range=(75.0, 85.0),
-        airfare_budget_soft=600.0,
-        airfare_budget_hard=900.0,
-        hotel_budget_min=150.0,
-        hotel_budget_max=300.0,
-        preferred_brands=["Marriott", "Hilton"],
-        typical_trip_length_days=7,
-        comfort_level=ComfortLevel.COMFORT,
-        flexibility_days=5,
-        safety_conscious=True,
-        visa_required=False,
-    ),
-    "default": UserProfile(
-        user_id="default",
-        citizenship="USA",
-        passport_country="USA",
-        preferred_temp_range=(70.0, 80.0),
-        airfare_budget_soft=500.0,
-        airfare_budget_hard=800.0,
-        hotel_budget_min=100.0,
-        hotel_budget_max=250.0,
-        preferred_brands=[],
-        typical_trip_length_days=5,
-        comfort_level=ComfortLevel.STANDARD,
-        flexibility_days=3,
-        safety_conscious=False,
-        visa_required=False,
-    ),
-}
+# Mock user profile storage (shared with the plain tool engine)
+_MOCK_PROFILES = MOCK_PROFILES
 
 
 @mcp.tool()